@@ -0,0 +1,278 @@
+import io
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+from datetime import datetime, timezone
+
+from PIL import Image
+
+import process_markdown as pm
+import cleanup_assets
+
+# --- Benchmark Settings ---
+
+# Repository root: templates and the build scripts are taken from here
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Sentences the synthetic posts are assembled from
+SAMPLE_SENTENCES = [
+    "Bu yazıda statik site üreticisinin nasıl çalıştığını anlatıyorum.",
+    "Görseller derleme sırasında küçültülüp yeniden kodlanıyor.",
+    "Şehir merkezinde uzun bir yürüyüş yaptık ve çok fotoğraf çektik.",
+    "Ağaçların arasından geçen ışık öğleden sonra çok güzeldi.",
+    "Kod örnekleri ve bağlantılar Markdown içinde olduğu gibi kalıyor.",
+    "The quick brown fox jumps over the lazy dog near the riverbank.",
+]
+
+# Embeds mixed into every few posts
+SAMPLE_EMBEDS = [
+    "https://youtu.be/CqL5kB8pOfo?si=sacHP973vySTOM3O",
+    "https://x.com/ClashRoyale/status/1938386798322880662",
+]
+
+
+def generate_image(path, width, height, rng):
+    """Writes a noisy gradient image so encoders have realistic work to do."""
+    noise = Image.effect_noise((width, height), 64)
+    gradient = Image.linear_gradient('L').resize((width, height))
+    tint = Image.new('L', (width, height), rng.randrange(256))
+    img = Image.merge('RGB', (noise, gradient, tint))
+    if path.lower().endswith('.png'):
+        img.save(path, optimize=False)
+    else:
+        img.save(path, quality=95)
+
+
+def generate_post(index, post_count, image_names, rng):
+    """Returns the markdown of one synthetic post with front matter, images, links and embeds."""
+    date = datetime(2020, 1, 1) + (datetime(2025, 12, 31) - datetime(2020, 1, 1)) * index / max(1, post_count)
+    lines = [
+        '---',
+        f'title: Deneme Yazısı {index}',
+        'author: Benchmark',
+        f'date: {date:%Y-%m-%d}',
+        '---',
+        '',
+        f'# Deneme Yazısı {index}',
+        '',
+    ]
+    for paragraph in range(rng.randint(4, 12)):
+        lines.append(' '.join(rng.choice(SAMPLE_SENTENCES) for _ in range(rng.randint(3, 8))))
+        lines.append('')
+        if paragraph % 3 == 0 and image_names:
+            image_name = rng.choice(image_names)
+            lines.append(f'![{os.path.splitext(image_name)[0]}](../img/{image_name})')
+            lines.append('')
+        if paragraph % 4 == 1 and post_count > 1:
+            lines.append(f'[Önceki yazı](post-{(index + post_count - 1) % post_count:05d}.md)')
+            lines.append('')
+    if index % 5 == 0:
+        lines.append(SAMPLE_EMBEDS[(index // 5) % len(SAMPLE_EMBEDS)])
+        lines.append('')
+    if index % 7 == 0:
+        lines.extend(['```', SAMPLE_EMBEDS[0], '![kod](../img/missing.jpg)', '```', ''])
+    return '\n'.join(lines)
+
+
+def generate_corpus(site_dir, post_count, image_count, image_size, seed=0):
+    """Creates a synthetic site: config, templates, posts and large JPEG/PNG sources."""
+    rng = random.Random(seed)
+    content_dir = os.path.join(site_dir, 'content')
+    image_dir = os.path.join(site_dir, 'img')
+    output_dir = os.path.join(site_dir, 'public')
+    for directory in (content_dir, image_dir, output_dir):
+        os.makedirs(directory, exist_ok=True)
+
+    shutil.copytree(os.path.join(PROJECT_DIR, 'templates'), os.path.join(site_dir, 'templates'), dirs_exist_ok=True)
+    shutil.copy2(os.path.join(PROJECT_DIR, 'public', 'style.css'), output_dir)
+    with open(os.path.join(PROJECT_DIR, 'config.json'), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config.update({'output_folder': 'public', 'content_folder': 'content', 'site_url': '/'})
+    with open(os.path.join(site_dir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+    image_names = []
+    width, height = image_size
+    for i in range(image_count):
+        image_name = f'photo-{i:04d}.{"png" if i % 4 == 3 else "jpg"}'
+        generate_image(os.path.join(image_dir, image_name), width, height, rng)
+        image_names.append(image_name)
+
+    with open(os.path.join(content_dir, 'index.md'), 'w', encoding='utf-8') as f:
+        f.write('---\ntitle: "Ana Sayfa"\n---\n\n# Benchmark\n\nSentetik içerik.\n')
+    for i in range(post_count):
+        with open(os.path.join(content_dir, f'post-{i:05d}.md'), 'w', encoding='utf-8') as f:
+            f.write(generate_post(i, post_count, image_names, rng))
+    return image_names
+
+
+def measure(function, repeat=1):
+    """Runs `function` `repeat` times and returns min/mean/max wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return {
+        'runs': len(timings),
+        'min_s': round(min(timings), 6),
+        'mean_s': round(sum(timings) / len(timings), 6),
+        'max_s': round(max(timings), 6),
+    }
+
+
+@contextlib.contextmanager
+def silenced(verbose):
+    """Swallows the progress output of the build functions unless verbose."""
+    if verbose:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+def run_build(site_dir, renderer, verbose):
+    """Runs a full build the way build.sh does, in a fresh interpreter. Returns True on success."""
+    output = None if verbose else subprocess.DEVNULL
+    command = [sys.executable, os.path.join(PROJECT_DIR, 'process_markdown.py'), '--build-all', '--renderer', renderer]
+    return subprocess.run(command, cwd=site_dir, stdout=output, stderr=output).returncode == 0
+
+
+def git_revision():
+    """Returns the commit the benchmarked code is at, or None outside a git checkout."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_DIR, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmarks(site_dir, post_count, image_count, image_size, repeat, verbose):
+    """Generates the corpus in `site_dir` and times every build stage. Returns the stage results."""
+    stages = {}
+    started = time.perf_counter()
+    image_names = generate_corpus(site_dir, post_count, image_count, image_size)
+    stages['generate_corpus'] = {'runs': 1, 'min_s': round(time.perf_counter() - started, 6)}
+
+    # The pipeline resolves content, templates and output relative to the working directory
+    previous_dir = os.getcwd()
+    os.chdir(site_dir)
+    try:
+        config = pm.load_config()
+        renderer = config.get('renderer', pm.DEFAULT_RENDERER)
+        if renderer == 'pandoc' and shutil.which('pandoc') is None:
+            print("Uyarı: pandoc bulunamadı; ölçümler markdown işleyicisiyle yapılıyor.", file=sys.stderr)
+            renderer = 'markdown'
+        config['renderer'] = renderer
+        content_dir = config.get('content_folder', 'content')
+        post_files = sorted(os.path.join(content_dir, f) for f in os.listdir(content_dir) if f != 'index.md')
+        posts = {}
+        for md_file_path in post_files:
+            with open(md_file_path, 'r', encoding='utf-8') as f:
+                posts[md_file_path] = f.read()
+
+        def process_all():
+            for md_file_path, content in posts.items():
+                pm.process_markdown_content(config, content, md_file_path, {})
+
+        def summarize_all():
+            for md_file_path in post_files:
+                pm.get_post_summary(config, md_file_path)
+
+        with silenced(verbose):
+            # The first pass reads image headers and hashes sources; later passes hit the caches
+            stages['process_markdown_content_cold'] = measure(process_all)
+            stages['process_markdown_content'] = measure(process_all, repeat)
+            stages['get_post_summary'] = measure(summarize_all, repeat)
+
+        # Every planned variant of each image is encoded, as a build does, into a scratch folder
+        scratch_dir = tempfile.mkdtemp(prefix='assets-', dir=site_dir)
+        quality = pm.get_image_settings(config)['quality']
+        image_jobs = []
+        for image_name in image_names:
+            source_path = os.path.join('img', image_name)
+            variants = pm.plan_responsive_image(config, source_path, scratch_dir)['variants']
+            image_jobs.append((source_path, variants[0][0], 'image', variants, quality))
+        def process_all_assets():
+            for job in image_jobs:
+                pm.process_asset(*job)
+        stages['process_asset'] = measure(process_all_assets, repeat)
+        shutil.rmtree(scratch_dir)
+
+        build_results = []
+        stages['build_cold'] = measure(lambda: build_results.append(run_build(site_dir, renderer, verbose)))
+        stages['build_warm'] = measure(lambda: build_results.append(run_build(site_dir, renderer, verbose)), repeat)
+        # Pandoc and the in-process renderer are not comparable, so the one used is recorded
+        stages['build_cold']['renderer'] = stages['build_warm']['renderer'] = renderer
+        if not all(build_results):
+            print("Uyarı: Derlemelerden en az biri hatayla bitti; --verbose ile ayrıntıları görebilirsiniz.", file=sys.stderr)
+            stages['build_cold']['failed'] = not build_results[0]
+            stages['build_warm']['failed'] = not all(build_results[1:])
+
+        post_index = pm.load_post_index(config)
+        with silenced(verbose):
+            stages['generate_homepage'] = measure(lambda: pm.generate_homepage(config, post_index), repeat)
+            # find_all_referenced_assets was replaced by the reference graph the build
+            # writes; a dry run times the same decision without deleting anything
+            stages['cleanup_reference_graph'] = measure(lambda: cleanup_assets.cleanup_assets(dry_run=True, full=False), repeat)
+            stages['cleanup_reference_graph_full'] = measure(lambda: cleanup_assets.cleanup_assets(dry_run=True, full=True), repeat)
+    finally:
+        os.chdir(previous_dir)
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the PanBlog build pipeline on a synthetic site.")
+    parser.add_argument('--posts', type=int, default=200, help="Number of synthetic posts (default: 200).")
+    parser.add_argument('--images', type=int, default=20, help="Number of source images shared by the posts (default: 20).")
+    parser.add_argument('--image-size', default='3000x2000', help="Source image size as WIDTHxHEIGHT (default: 3000x2000).")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per stage; min/mean/max are reported (default: 3).")
+    parser.add_argument('--output', default='benchmark-results.json', help="JSON file the results are written to (default: benchmark-results.json).")
+    parser.add_argument('--workdir', help="Directory for the synthetic site (default: a temporary directory).")
+    parser.add_argument('--keep', action='store_true', help="Keep the synthetic site after the run.")
+    parser.add_argument('--verbose', action='store_true', help="Show the build output.")
+    args = parser.parse_args()
+
+    try:
+        width, height = (int(v) for v in args.image_size.lower().split('x'))
+    except ValueError:
+        print(f"Hata: Geçersiz görsel boyutu: {args.image_size} (örnek: 3000x2000)", file=sys.stderr)
+        sys.exit(1)
+
+    site_dir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix='panblog-bench-')
+    os.makedirs(site_dir, exist_ok=True)
+    print(f"📏 Benchmarking {args.posts} posts and {args.images} images in {site_dir}...", file=sys.stderr)
+    try:
+        stages = run_benchmarks(site_dir, args.posts, args.images, (width, height), max(1, args.repeat), args.verbose)
+    finally:
+        if not args.keep:
+            shutil.rmtree(site_dir, ignore_errors=True)
+
+    results = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'corpus': {'posts': args.posts, 'images': args.images, 'image_size': [width, height]},
+        'stages': stages,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    for stage, result in stages.items():
+        renderer = f" ({result['renderer']})" if 'renderer' in result else ''
+        print(f"  {stage:32} {result['min_s'] * 1000:10.1f} ms{renderer}")
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
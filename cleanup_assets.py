@@ -1,22 +1,13 @@
 import os
-import re
-import glob
 import json
 import argparse
 import sys
 
-# --- Pre-compiled Regular Expressions (Consistent with process_markdown.py) ---
-# This regex is designed to find asset paths in various contexts.
-# It captures paths from:
-# - Markdown images: ![alt text](path/to/image.jpg)
-# - HTML tags (like <img>, <video>, <source>): src="path/to/asset.mp4"
-# - CSS properties: url('path/to/font.woff') or url("path/to/image.png")
-ASSET_PATH_RE = re.compile(
-    r'(!\[.*?\]\((?P<md_img>.*?)\)|'          # Group 'md_img' for Markdown images
-    r'<[a-zA-Z0-9]+\s+[^>]*?src\s*=\s*["\\](?P<html_src>.*?)["\\][^>]*?>|' # Group 'html_src' for src attributes
-    r'url\s*\(\s*["\\]?(?P<css_url>.*?)["\\]?\s*\))', # Group 'css_url' for CSS url()
-    re.IGNORECASE
-)
+# --- Build State Files (Consistent with process_markdown.py) ---
+# The build records which asset files every page references in this graph,
+# together with per-file reference counts and the files whose count dropped
+# to zero since the last cleanup.
+ASSET_REFS_NAME = '.asset-refs.json'
 
 def load_config(config_path='config.json'):
     """Loads the configuration file with error handling."""
@@ -30,46 +21,43 @@ def load_config(config_path='config.json'):
         print(f"❌ Error: JSON format error in configuration file: {config_path}", file=sys.stderr)
         sys.exit(1)
 
-def find_all_referenced_assets(config):
-    """Scans all relevant project files to find which assets are in use."""
-    content_dir = config.get('content_folder', 'content')
+def load_reference_graph(config):
+    """Loads the asset reference graph written by the build, or None if there is none."""
     output_dir = config.get('output_folder', 'public')
-    templates_dir = 'templates'
-    
-    # Define which file types to scan for asset references
-    scan_patterns = [
-        os.path.join(content_dir, '**', '*.*'),
-        os.path.join(output_dir, '**', '*.html'),
-        os.path.join(output_dir, '**', '*.css'),
-        os.path.join(templates_dir, '**', '*.html'),
-    ]
-    
-    referenced_assets = set()
-    
-    print("   - Scanning for asset references in project files...")
-    for pattern in scan_patterns:
-        # recursive=True is needed for '**' to work correctly
-        for file_path in glob.glob(pattern, recursive=True):
-            if os.path.isfile(file_path):
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        matches = ASSET_PATH_RE.finditer(content)
-                        for match in matches:
-                            # Find the path from the correct capture group
-                            path = match.group('md_img') or match.group('html_src') or match.group('css_url')
-                            if path and not path.startswith(('http://', 'https://', '//', 'data:')):
-                                # Extract just the filename from the path
-                                filename = os.path.basename(path)
-                                referenced_assets.add(filename)
-                except Exception as e:
-                    print(f"   - Warning: Could not read or process file {file_path}: {e}", file=sys.stderr)
-                    
-    print(f"   - Found {len(referenced_assets)} unique referenced assets.")
-    return referenced_assets
-
-def cleanup_assets(dry_run):
-    """Deletes unused assets from the public assets directory."""
+    refs_path = os.path.join(output_dir, ASSET_REFS_NAME)
+    try:
+        with open(refs_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError:
+        print(f"❌ Error: JSON format error in reference graph: {refs_path}", file=sys.stderr)
+        sys.exit(1)
+
+def save_reference_graph(config, graph):
+    """Writes the asset reference graph back atomically."""
+    output_dir = config.get('output_folder', 'public')
+    refs_path = os.path.join(output_dir, ASSET_REFS_NAME)
+    temp_path = f"{refs_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(graph, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temp_path, refs_path)
+
+def find_referencing_pages(graph):
+    """Inverts the graph into asset -> pages that reference it (used for reports only)."""
+    referencing_pages = {}
+    for page, files in graph.get('pages', {}).items():
+        for asset_filename in files:
+            referencing_pages.setdefault(asset_filename, []).append(page)
+    return referencing_pages
+
+def cleanup_assets(dry_run, full):
+    """Deletes unused assets from the public assets directory.
+
+    By default only the assets the build released (reference count dropped to
+    zero) are checked. With `full`, every file in the assets directory is
+    checked against the reference counts.
+    """
     print("🧹 Starting asset cleanup...")
     config = load_config()
     project_root = os.getcwd()
@@ -80,31 +68,47 @@ def cleanup_assets(dry_run):
         print("   - Assets directory does not exist. Nothing to clean up.")
         return
 
-    # 1. Get all assets currently in the public/assets directory
-    current_assets = {f for f in os.listdir(public_assets_dir) if os.path.isfile(os.path.join(public_assets_dir, f))}
-    print(f"   - Found {len(current_assets)} files in the public assets directory.")
-
-    # 2. Find all assets that are actually referenced in the project
-    referenced_assets = find_all_referenced_assets(config)
+    graph = load_reference_graph(config)
+    if graph is None:
+        print("   - ⚠️ No asset reference graph found. Run the build first; nothing was deleted.", file=sys.stderr)
+        return
 
-    # 3. Determine which assets are unreferenced and should be deleted
-    assets_to_delete = current_assets - referenced_assets
+    counts = graph.get('counts', {})
+    released = set(graph.get('released', []))
 
-    if not assets_to_delete:
-        print("✨ All assets are in use. No cleanup needed.")
-        return
+    # 1. Decide which assets to look at
+    if full:
+        candidates = {f for f in os.listdir(public_assets_dir) if os.path.isfile(os.path.join(public_assets_dir, f))}
+        print(f"   - Checking all {len(candidates)} files in the public assets directory.")
+    else:
+        candidates = {f for f in released if os.path.isfile(os.path.join(public_assets_dir, f))}
+        print(f"   - Checking {len(candidates)} asset(s) released since the last cleanup.")
 
-    print(f"   - Found {len(assets_to_delete)} unreferenced assets to delete.")
+    # 2. An asset is unused when no page holds a reference to it
+    assets_to_delete = {f for f in candidates if counts.get(f, 0) <= 0}
+    assets_to_keep = candidates - assets_to_delete
 
     if dry_run:
-        print("\n[DRY RUN] The following assets would be deleted:")
-        for asset_filename in sorted(list(assets_to_delete)):
-            print(f"  - {asset_filename}")
+        referencing_pages = find_referencing_pages(graph)
+        print("\n[DRY RUN] Reference report:")
+        for asset_filename in sorted(candidates):
+            if asset_filename in assets_to_keep:
+                pages = ', '.join(sorted(referencing_pages.get(asset_filename, [])))
+                print(f"  - keep   {asset_filename}: referenced by {counts[asset_filename]} page(s): {pages}")
+            elif asset_filename in released:
+                print(f"  - delete {asset_filename}: its last referencing page was rebuilt or removed")
+            else:
+                print(f"  - delete {asset_filename}: no page has ever referenced it")
         print("\n[DRY RUN] No files were actually deleted.")
+        return
+
+    if not assets_to_delete:
+        print("✨ All assets are in use. No cleanup needed.")
     else:
+        print(f"   - Found {len(assets_to_delete)} unreferenced assets to delete.")
         print("\nDeleting unreferenced assets...")
         deleted_count = 0
-        for asset_filename in assets_to_delete:
+        for asset_filename in sorted(assets_to_delete):
             asset_full_path = os.path.join(public_assets_dir, asset_filename)
             try:
                 os.remove(asset_full_path)
@@ -114,6 +118,10 @@ def cleanup_assets(dry_run):
                 print(f"  - ❌ Error deleting {asset_filename}: {e}", file=sys.stderr)
         print(f"\n✅ Cleanup complete. Deleted {deleted_count} asset(s).")
 
+    # Released assets have now been dealt with
+    graph['released'] = sorted(released - candidates)
+    save_reference_graph(config, graph)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Cleans up unused assets from the public/assets directory.",
@@ -123,12 +131,19 @@ def main():
         '--dry-run',
         action='store_true',
         help="""Perform a 'dry run' without deleting any files.
-This will list all the assets that are considered unreferenced
-and would be deleted if run normally."""
+This prints a report of every checked asset and why it
+would be kept or deleted."""
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help="""Check every file in the assets directory instead of
+only the assets released since the last cleanup.
+Use this once to remove files the build never tracked."""
     )
     args = parser.parse_args()
 
-    cleanup_assets(dry_run=args.dry_run)
+    cleanup_assets(dry_run=args.dry_run, full=args.full)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
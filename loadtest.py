@@ -0,0 +1,138 @@
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import subprocess
+import http.client
+
+# --- Load Test Settings ---
+
+# Paths requested round-robin when none are given on the command line
+DEFAULT_PATHS = ['/', '/index.html', '/style.css']
+
+
+def find_free_port():
+    """Asks the OS for an unused local port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=10.0):
+    """Blocks until something accepts connections on the port."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def run_worker(host, port, paths, headers, deadline, latencies, errors):
+    """Sends requests over one keep-alive connection until the deadline."""
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    index = 0
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors.append(response.status)
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(type(e).__name__)
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value at the given fraction of a sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def load_test(host, port, paths, concurrency, duration, headers):
+    """Runs the load test and returns a summary dict."""
+    latencies_per_worker = [[] for _ in range(concurrency)]
+    errors = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=run_worker, args=(host, port, paths, headers, deadline, latencies_per_worker[i], errors))
+        for i in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(l for worker in latencies_per_worker for l in worker)
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round((latencies[-1] if latencies else 0.0) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test a local PanBlog server and report requests/s and p99 latency.")
+    parser.add_argument('paths', nargs='*', help=f"URL paths to request round-robin (default: {' '.join(DEFAULT_PATHS)}).")
+    parser.add_argument('--port', type=int, help="Port of an already running server. If omitted, serve.py is started on a free port.")
+    parser.add_argument('--root', help="Folder the started serve.py instance serves (default: output_folder from config.json).")
+    parser.add_argument('--concurrency', type=int, default=16, help="Number of concurrent keep-alive connections (default: 16).")
+    parser.add_argument('--duration', type=float, default=10.0, help="Test duration in seconds (default: 10).")
+    parser.add_argument('--encoding', default='br, gzip', help="Accept-Encoding header to send (default: 'br, gzip'; use '' for identity).")
+    parser.add_argument('--json', action='store_true', help="Print the summary as JSON.")
+    args = parser.parse_args()
+
+    headers = {'Accept-Encoding': args.encoding} if args.encoding else {}
+    paths = args.paths or DEFAULT_PATHS
+    server_process = None
+    port = args.port
+    if port is None:
+        port = find_free_port()
+        command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'serve.py'), '--port', str(port), '--host', '127.0.0.1', '--quiet']
+        if args.root:
+            command += ['--root', args.root]
+        server_process = subprocess.Popen(command)
+        if not wait_for_port(port):
+            server_process.terminate()
+            print("Hata: serve.py başlatılamadı.", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        summary = load_test('127.0.0.1', port, paths, args.concurrency, args.duration, headers)
+    finally:
+        if server_process:
+            server_process.terminate()
+            server_process.wait()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Requests:     {summary['requests']} in {summary['seconds']} s ({summary['errors']} errors)")
+        print(f"Throughput:   {summary['requests_per_second']} requests/s")
+        print(f"Latency p50:  {summary['p50_ms']} ms")
+        print(f"Latency p99:  {summary['p99_ms']} ms (max {summary['max_ms']} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,233 @@ import re
 import os
 import shutil
 import sys
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, features
 import glob
 import markdown
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import format_datetime
 import tempfile
 import json
 import argparse
+import html
+import subprocess
+import hashlib
+import math
+import gzip
+import time
+import pstats
+import cProfile
+import threading
+import contextlib
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# --- Incremental Build Settings ---
+
+# Name of the build manifest stored in the output folder
+BUILD_MANIFEST_NAME = '.build-manifest.json'
+
+# Bump when the manifest layout or rendering logic changes to force a full rebuild
+BUILD_MANIFEST_VERSION = 9
+
+# Templates every rendered page depends on
+TEMPLATE_FILES = ('templates/post.html', 'templates/homepage.html', 'templates/_footer.html')
+
+# Image file extensions that are encoded by the image pipeline instead of a plain copy
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')
+
+# Images that get resized derivatives; animated formats like GIF are only optimized
+RESPONSIVE_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+# Defaults for the responsive image pipeline, overridable in config.json
+DEFAULT_IMAGE_WIDTHS = (480, 960, 1600)
+DEFAULT_IMAGE_FORMATS = ('webp',)
+DEFAULT_IMAGE_QUALITY = 85
+DEFAULT_IMAGE_SIZES = '(max-width: 800px) 100vw, 800px'
+
+# Pillow format name, file extension and MIME type of each modern output format
+MODERN_IMAGE_FORMATS = {
+    'avif': ('AVIF', '.avif', 'image/avif'),
+    'webp': ('WEBP', '.webp', 'image/webp'),
+}
+
+# Name of the asset manifest (source path -> content hash and output files) stored in the output folder
+ASSET_MANIFEST_NAME = '.asset-manifest.json'
+
+# Name of the asset reference graph (page -> referenced asset files) stored in the output folder
+ASSET_REFS_NAME = '.asset-refs.json'
+
+# Key of the reference graph entry for assets used by templates and stylesheets
+STATIC_REFS_PAGE = '(templates)'
+
+# Number of hex digits of the content hash embedded in fingerprinted asset names
+FINGERPRINT_LENGTH = 12
+
+# Name of the post index (title, date, preview image, summary per post) stored in the output folder
+POST_INDEX_NAME = '.post-index.json'
+
+# Name of the listing page state (page name -> content hash) stored in the output folder
+LISTING_PAGES_NAME = '.listing-pages.json'
+
+# Number of post summaries per homepage page, overridable with posts_per_page in config.json
+DEFAULT_POSTS_PER_PAGE = 10
+
+# Post names whose HTML file would overwrite a listing page (index-2, archive, archive-2025, archive-2025-06)
+RESERVED_POST_NAME_RE = re.compile(r'^(?:index(?:-\d+)?|archive(?:-\d{4}(?:-\d{2})?)?)\.md$')
+
+# Month names accepted in front matter dates (Turkish, with and without diacritics, and English)
+MONTH_NAMES = {
+    'ocak': 1, 'şubat': 2, 'subat': 2, 'mart': 3, 'nisan': 4, 'mayıs': 5, 'mayis': 5, 'haziran': 6,
+    'temmuz': 7, 'ağustos': 8, 'agustos': 8, 'eylül': 9, 'eylul': 9, 'ekim': 10, 'kasım': 11, 'kasim': 11,
+    'aralık': 12, 'aralik': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+# Month names used in archive page titles
+MONTH_DISPLAY_NAMES = ('Ocak', 'Şubat', 'Mart', 'Nisan', 'Mayıs', 'Haziran', 'Temmuz', 'Ağustos', 'Eylül', 'Ekim', 'Kasım', 'Aralık')
+
+# config.json keys that end up in rendered pages
+RENDER_CONFIG_KEYS = (
+    'site_title', 'site_description', 'author', 'site_url', 'default_lang', 'navigation_links',
+    'image_widths', 'image_formats', 'image_quality', 'image_sizes', 'renderer', 'embed_facades',
+)
+
+# Text outputs that get precompressed .gz/.br sidecars for the server
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js', '.xml', '.json', '.svg', '.txt')
+
+# Files smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 256
+
+# --- Renderer Settings ---
+
+# Markdown to HTML converters selectable with the `renderer` config key or --renderer.
+# The in-process renderer is the default so a build never spawns a process per post.
+RENDERERS = ('pandoc', 'markdown')
+DEFAULT_RENDERER = 'markdown'
+
+# python-markdown extensions approximating pandoc's markdown dialect
+MARKDOWN_EXTENSIONS = ['extra', 'smarty', 'sane_lists']
+
+# Pandoc's smart extension writes typographic characters, not entities
+MARKDOWN_EXTENSION_CONFIGS = {
+    'smarty': {
+        'substitutions': {
+            'left-single-quote': '‘', 'right-single-quote': '’',
+            'left-double-quote': '“', 'right-double-quote': '”',
+            'left-angle-quote': '«', 'right-angle-quote': '»',
+            'ellipsis': '…', 'ndash': '–', 'mdash': '—',
+        },
+    },
+}
+
+# --- Embed Settings ---
+
+# Render YouTube videos and tweets as local click-to-load placeholders, overridable with embed_facades in config.json
+DEFAULT_EMBED_FACADES = True
+
+# Script that swaps facades for the real player or widget, copied from templates/ next to style.css
+EMBED_CLIENT_NAME = 'embeds.js'
+
+# Permissions of the YouTube player iframe
+YOUTUBE_IFRAME_ALLOW = 'accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture'
+
+# --- Search Index Settings ---
+
+# Folder in the output folder holding the search metadata and index shards
+SEARCH_DIR_NAME = 'search'
+
+# Name of the search index state (post -> doc id, hash and shards) stored in the output folder
+SEARCH_STATE_NAME = '.search-index.json'
+
+# Bump when the shard layout or term normalization changes to rebuild the whole index
+SEARCH_INDEX_VERSION = 1
+
+# Terms are sharded by this many leading characters; shorter terms are not indexed
+SEARCH_SHARD_PREFIX_LENGTH = 2
+
+# Weight of a term occurrence in the title relative to one in the body
+SEARCH_TITLE_WEIGHT = 5
+
+# Frequent words left out of the index (Turkish and English, after normalization)
+SEARCH_STOP_WORDS = frozenset((
+    'acaba', 'ama', 'bir', 'biz', 'bu', 'cok', 'da', 'de', 'daha', 'diye', 'en', 'gibi', 'hem', 'her', 'icin',
+    'ile', 'ise', 'ki', 'mi', 'mu', 'ne', 'o', 'olan', 'olarak', 'sen', 'siz', 'su', 've', 'veya', 'ya',
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'in', 'is', 'it', 'of', 'on', 'or', 'the', 'to', 'was', 'with',
+))
+
+# Turkish letters folded to their ASCII base so queries typed without them still match
+TURKISH_FOLD = str.maketrans({'ı': 'i', 'ş': 's', 'ğ': 'g', 'ç': 'c', 'ö': 'o', 'ü': 'u'})
+
+# --- Link Graph Settings ---
+
+# Name of the link graph (links, backlinks, broken links, related posts) stored in the output folder
+LINK_GRAPH_NAME = '.link-graph.json'
+
+# Bump when the related posts scoring or markup changes so every list is recomputed
+LINK_GRAPH_VERSION = 2
+
+# Folder in the output folder keeping each post's converted body, so a post whose
+# related posts list changed is written again without converting its markdown
+POST_BODY_CACHE_DIR = '.post-bodies'
+
+# Number of related posts shown under each post, overridable with related_posts in config.json
+DEFAULT_RELATED_POSTS = 3
+
+# Distinctive terms per post compared when looking for related posts
+RELATED_SIGNATURE_TERMS = 25
+
+# Terms in more posts than this say little about relatedness and are skipped
+RELATED_MAX_DOCUMENT_FREQUENCY = 200
+
+# Score added for a direct link in either direction (term similarity is at most 1)
+RELATED_LINK_WEIGHT = 0.5
+
+# --- Feed and Sitemap Settings ---
+
+# Name of the feed state (output hashes and cached entry fragments) stored in the output folder
+FEED_STATE_NAME = '.feeds.json'
+
+# Bump when the feed entry markup changes so cached fragments are re-rendered
+FEED_FORMAT_VERSION = 1
+
+# Site-wide feeds in the output folder
+ATOM_FEED_NAME = 'atom.xml'
+RSS_FEED_NAME = 'rss.xml'
+
+# Folder in the output folder holding the per-tag feeds (tag_feeds in config.json)
+TAG_FEEDS_DIR_NAME = 'feeds'
+
+# Number of newest posts per feed, overridable with feed_limit in config.json
+DEFAULT_FEED_LIMIT = 20
+
+# Sitemaps may list at most this many URLs; larger sites get a sitemap index
+SITEMAP_NAME = 'sitemap.xml'
+SITEMAP_MAX_URLS = 50000
+
+# --- Build Report Settings ---
+
+# Default name of the JSON build report written by --report, stored in the output folder
+BUILD_REPORT_NAME = '.build-report.json'
+
+# Default file the cProfile data of --profile is dumped to
+DEFAULT_PROFILE_PATH = 'build.prof'
+
+# Number of slowest posts/assets printed after a reported build
+DEFAULT_REPORT_TOP = 10
+
+# Number of functions by cumulative time included in the report when profiling
+PROFILE_HOT_FUNCTIONS = 25
 
 # --- Pre-compiled Regular Expressions for Performance and Readability ---
 
@@ -18,11 +238,46 @@ FRONT_MATTER_RE = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL)
 # Extracts title from front matter
 TITLE_RE = re.compile(r'^title:\s*(.*)', re.MULTILINE)
 
+# Extracts every simple `key: value` line from front matter
+FRONT_MATTER_FIELD_RE = re.compile(r'^(\w+):\s*(.*)$', re.MULTILINE)
+
+# Template tokens: <!-- NAME_PLACEHOLDER -->, __NAME__, $if(var)$, $else$, $endif$ and $var$
+TEMPLATE_TOKEN_RE = re.compile(r'<!-- ([A-Z_]+)_PLACEHOLDER -->|__([A-Z][A-Z_]*[A-Z])__|\$if\((\w+)\)\$|\$(else|endif)\$|\$(\w+)\$')
+
+# HTML headings without attributes, which the markdown renderer gives pandoc-style ids
+HEADING_RE = re.compile(r'<h([1-6])>(.*?)</h\1>', re.DOTALL)
+
+# Markdown images as python-markdown writes them (alt before src; pandoc writes src first)
+MARKDOWN_IMG_RE = re.compile(r'<img alt="([^"]*)" src="([^"]*)"')
+
+# A paragraph holding nothing but an image, which pandoc renders as a captioned figure
+IMAGE_PARAGRAPH_RE = re.compile(r'<p><img src="([^"]*)" alt="([^"]*)" /></p>')
+
+# Strips tags when computing heading identifiers and search terms
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Separators of inline tag lists: `tags: a, b` or `tags: [a, b]`
+TAG_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Characters replaced by hyphens in tag feed file names
+TAG_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Words of normalized text for the search index
+SEARCH_TERM_RE = re.compile(r'\w+')
+
+# Shard prefixes usable as file names as they are; others are hex-encoded
+SEARCH_SAFE_PREFIX_RE = re.compile(r'^[a-z0-9]+$')
+
 # Extracts preview_image from front matter
 PREVIEW_IMAGE_RE = re.compile(r'^preview_image:\s*(.*)', re.MULTILINE)
 
-# Finds the first Markdown image (for summaries)
-FIRST_IMAGE_RE = re.compile(r'!\[.*?\]\((.*?)\)')
+# Finds /assets/ references in templates and stylesheets
+ASSET_URL_RE = re.compile(r'/assets/([^"\'()\s,?#]+)')
+
+# Front matter date formats: 2025-06-26 (optionally with a time), 26.06.2025 and 26 Haziran 2025
+ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})')
+DOTTED_DATE_RE = re.compile(r'^(\d{1,2})[./](\d{1,2})[./](\d{4})$')
+NAMED_DATE_RE = re.compile(r'^(\d{1,2})\s+(\w+)\s+(\d{4})$')
 
 # Finds the first paragraph tag in HTML
 FIRST_PARAGRAPH_RE = re.compile(r'<p>(.*?)</p>', re.DOTALL)
@@ -31,7 +286,7 @@ FIRST_PARAGRAPH_RE = re.compile(r'<p>(.*?)</p>', re.DOTALL)
 ASSET_RE = re.compile(r'(!\[.*?\]\((.*?)\)|<video.*?src="(.*?)".*?>)', re.IGNORECASE)
 
 # Finds alt text in a Markdown image tag
-ALT_TEXT_RE = re.compile(r'!\((.*?)\)]')
+ALT_TEXT_RE = re.compile(r'!\[(.*?)\]\(')
 
 # Finds internal Markdown links (.md)
 MD_LINK_RE = re.compile(r'(\[.*?\]\((?!http|#|mailto|tel)(.*?\.md)\))')
@@ -43,6 +298,329 @@ YOUTUBE_URL_RE = re.compile(r'(?:https?:\/\/)?(?:www\.)?(?:youtube\.com\/watch\?
 TWITTER_URL_RE = re.compile(r'(?:https?:\/\/)?(?:www\.)?(?:twitter\.com|x\.com)\/\w+\/status\/([0-9]+)(?:\S+)?')
 
 
+class BuildReport:
+    """Collects per-stage and per-item timings, I/O byte counts and cache hit/miss counts.
+
+    The module-level `build_report` instance is always counting; build_all
+    resets it and only writes it out when a report was requested. Items run
+    on worker threads are attributed through a thread-local, so code deep in
+    the pipeline only calls count_io/count_cache/span.
+    """
+
+    def __init__(self, profile=False):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.profile = profile
+        self.profiles = []
+        self.stages = []
+        self.items = []
+        self.cache = {}
+        self.active_stage = None
+        self.started = time.perf_counter()
+        self.started_cpu = self.cpu_time()
+
+    @staticmethod
+    def cpu_time():
+        """Returns CPU seconds of this process plus its finished children (pandoc, asset workers)."""
+        cpu = time.process_time()
+        if resource:
+            usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+            cpu += usage.ru_utime + usage.ru_stime
+        return cpu
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Measures one build stage; I/O and cache counts made while it runs are attributed to it."""
+        stage = {'name': name, 'bytes_read': 0, 'bytes_written': 0, 'cache': {}}
+        self.active_stage = stage
+        started, started_cpu = time.perf_counter(), self.cpu_time()
+        try:
+            yield stage
+        finally:
+            stage['wall_s'] = round(time.perf_counter() - started, 6)
+            stage['cpu_s'] = round(self.cpu_time() - started_cpu, 6)
+            self.active_stage = None
+            self.stages.append(stage)
+
+    def track(self, kind, name, function, *args):
+        """Calls `function(*args)` on the current thread and records it as one item."""
+        item = {'kind': kind, 'name': name, 'bytes_read': 0, 'bytes_written': 0}
+        self.local.item = item
+        started, started_cpu = time.perf_counter(), time.thread_time()
+        # A thread that is already profiled (the main thread) is left to its profiler
+        profiler = cProfile.Profile() if self.profile and sys.getprofile() is None else None
+        if profiler:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Python 3.12+ allows one profiler per process; the build's main profiler already sees this thread
+                profiler = None
+        try:
+            return function(*args)
+        finally:
+            if profiler:
+                profiler.disable()
+            item['wall_s'] = round(time.perf_counter() - started, 6)
+            item['cpu_s'] = round(time.thread_time() - started_cpu, 6)
+            self.local.item = None
+            with self.lock:
+                self.items.append(item)
+                if profiler:
+                    self.profiles.append(profiler)
+
+    def record_item(self, kind, name, **metrics):
+        """Records an item measured elsewhere, e.g. an asset encoded in a worker process."""
+        item = {'kind': kind, 'name': name}
+        item.update(metrics)
+        with self.lock:
+            self.items.append(item)
+        self.count_io(metrics.get('bytes_read', 0), metrics.get('bytes_written', 0), item=False)
+
+    def merge(self, items, stage):
+        """Adds the items, I/O and cache counts a worker process measured (see track_in_worker)."""
+        self.count_io(stage['bytes_read'], stage['bytes_written'], item=False)
+        with self.lock:
+            self.items.extend(items)
+            for cache, counts in stage['cache'].items():
+                for target in (self.cache, self.active_stage['cache'] if self.active_stage else None):
+                    if target is not None:
+                        merged = target.setdefault(cache, {'hit': 0, 'miss': 0})
+                        merged['hit'] += counts['hit']
+                        merged['miss'] += counts['miss']
+
+    @contextlib.contextmanager
+    def span(self, name):
+        """Adds the wall time of a sub-step (e.g. pandoc) to the item running on this thread."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            item = getattr(self.local, 'item', None)
+            if item is not None:
+                key = f'{name}_s'
+                item[key] = round(item.get(key, 0) + time.perf_counter() - started, 6)
+
+    def count_io(self, read=0, written=0, item=True, stage=True):
+        """Adds bytes read/written to the active stage and to the item running on this thread."""
+        targets = [self.active_stage] if stage else []
+        if item:
+            targets.append(getattr(self.local, 'item', None))
+        with self.lock:
+            for target in targets:
+                if target is not None:
+                    target['bytes_read'] += read
+                    target['bytes_written'] += written
+
+    def count_cache(self, cache, hit):
+        """Counts one lookup in a named cache as a hit or a miss."""
+        outcome = 'hit' if hit else 'miss'
+        with self.lock:
+            for counts in (self.cache, self.active_stage['cache'] if self.active_stage else None):
+                if counts is not None:
+                    counts.setdefault(cache, {'hit': 0, 'miss': 0})[outcome] += 1
+
+    def hot_functions(self, limit=PROFILE_HOT_FUNCTIONS):
+        """Merges every collected profile and returns the functions with the highest cumulative time."""
+        if not self.profiles:
+            return None, []
+        stats = pstats.Stats(*self.profiles)
+        rows = []
+        for (filename, line, function), (calls, _, total, cumulative, _) in stats.stats.items():
+            rows.append({
+                'function': f'{os.path.basename(filename)}:{line}({function})',
+                'calls': calls,
+                'total_s': round(total, 6),
+                'cumulative_s': round(cumulative, 6),
+            })
+        rows.sort(key=lambda row: row['cumulative_s'], reverse=True)
+        return stats, rows[:limit]
+
+    def to_dict(self, hot_functions=None):
+        """Returns the JSON-serializable report."""
+        report = {
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'wall_s': round(time.perf_counter() - self.started, 6),
+            'cpu_s': round(self.cpu_time() - self.started_cpu, 6),
+            'stages': self.stages,
+            'cache': self.cache,
+            'items': sorted(self.items, key=lambda item: item.get('wall_s', 0), reverse=True),
+        }
+        if hot_functions:
+            report['hot_functions'] = hot_functions
+        return report
+
+    def print_summary(self, top=DEFAULT_REPORT_TOP):
+        """Prints stage timings, cache hit rates and the slowest posts and assets."""
+        print("Build report:", file=sys.stderr)
+        for stage in self.stages:
+            print(f"   - {stage['name']:<10} {stage['wall_s'] * 1000:9.1f} ms wall {stage['cpu_s'] * 1000:9.1f} ms CPU"
+                  f" {stage['bytes_read'] / 1024:9.1f} KiB read {stage['bytes_written'] / 1024:9.1f} KiB written", file=sys.stderr)
+        for cache, counts in sorted(self.cache.items()):
+            lookups = counts['hit'] + counts['miss']
+            print(f"   - cache {cache}: {counts['hit']}/{lookups} hits", file=sys.stderr)
+        slowest = sorted(self.items, key=lambda item: item.get('wall_s', 0), reverse=True)[:top]
+        if slowest:
+            print(f"   Slowest {len(slowest)} item(s):", file=sys.stderr)
+            for item in slowest:
+                print(f"   - {item['wall_s'] * 1000:9.1f} ms  {item['kind']:<5} {item['name']}", file=sys.stderr)
+
+    def write(self, report_path, profile_path=None, top=DEFAULT_REPORT_TOP):
+        """Writes the JSON report (and the merged cProfile data) and prints the summary."""
+        stats, hot_functions = self.hot_functions()
+        if stats and profile_path:
+            stats.dump_stats(profile_path)
+            print(f"   - Profile data written to {profile_path} (open with python3 -m pstats).", file=sys.stderr)
+        write_json_file(report_path, self.to_dict(hot_functions))
+        self.print_summary(top)
+        print(f"   - Build report written to {report_path}", file=sys.stderr)
+
+# Shared instance the pipeline reports into; build_all replaces it per build
+build_report = BuildReport()
+
+def track_in_worker(kind, name, function, *args):
+    """Runs `function(*args)` as one item in a worker process.
+
+    Returns (result, items, stage) for BuildReport.merge in the parent, since
+    the worker reports into its own copy of `build_report`.
+    """
+    global build_report
+    build_report = BuildReport()
+    with build_report.stage(kind) as stage:
+        result = build_report.track(kind, name, function, *args)
+    return result, build_report.items, stage
+
+def post_executor(config, workers):
+    """Returns the pool posts are converted and written on.
+
+    The in-process renderer holds the GIL, so it runs on worker processes to
+    use every core. Pandoc already runs in its own processes, and a profiled
+    build stays on threads so one profiler sees every post.
+    """
+    if workers > 1 and config.get('renderer', DEFAULT_RENDERER) == 'markdown' and not build_report.profile:
+        # Workers start with the asset manifest's hashes and fallback images, as the parent does
+        return ProcessPoolExecutor(max_workers=workers, initializer=load_asset_manifest, initargs=(config,))
+    return ThreadPoolExecutor(max_workers=workers)
+
+def submit_tracked(executor, kind, name, function, *args):
+    """Submits `function(*args)` to a post_executor pool as one build report item."""
+    if isinstance(executor, ProcessPoolExecutor):
+        return executor.submit(track_in_worker, kind, name, function, *args)
+    return executor.submit(build_report.track, kind, name, function, *args)
+
+def tracked_result(executor, future):
+    """Returns the result of a submit_tracked future, merging what a worker process measured."""
+    if isinstance(executor, ProcessPoolExecutor):
+        result, items, stage = future.result()
+        build_report.merge(items, stage)
+        return result
+    return future.result()
+
+class Template:
+    """A template parsed once into literal text, variables and conditionals.
+
+    Understands pandoc's `$var$` and `$if(var)$...$else$...$endif$` as well as
+    the `<!-- NAME_PLACEHOLDER -->` and `__NAME__` markers of our templates,
+    which are variables named `name` in lower case. Values are inserted as
+    given; callers escape what needs escaping.
+    """
+
+    def __init__(self, source=None, nodes=None):
+        self.nodes = nodes if nodes is not None else self.parse(source)
+
+    @staticmethod
+    def parse(source):
+        """Parses template source into nodes: str, ('var', name) or ('if', name, then, else)."""
+        root = []
+        # Each open conditional with the node list it was opened in
+        stack = []
+        current = root
+        position = 0
+        for match in TEMPLATE_TOKEN_RE.finditer(source):
+            if match.start() > position:
+                current.append(source[position:match.start()])
+            position = match.end()
+            placeholder, marker, condition, keyword, variable = match.groups()
+            if condition:
+                node = ('if', condition, [], [])
+                current.append(node)
+                stack.append((node, current))
+                current = node[2]
+            elif keyword == 'else' and stack:
+                current = stack[-1][0][3]
+            elif keyword == 'endif' and stack:
+                current = stack.pop()[1]
+            elif keyword:
+                current.append(match.group(0))
+            else:
+                current.append(('var', (placeholder or marker or variable).lower()))
+        if position < len(source):
+            current.append(source[position:])
+        return root
+
+    def bind(self, variables):
+        """Returns a template with the given variables filled in as text.
+
+        Used for values shared by every page (navigation, footer, site title);
+        conditionals stay in place and are evaluated per page by render().
+        """
+        def bind_nodes(nodes):
+            bound = []
+            for node in nodes:
+                if isinstance(node, str):
+                    value = node
+                elif node[0] == 'var':
+                    value = variables.get(node[1], node)
+                else:
+                    value = ('if', node[1], bind_nodes(node[2]), bind_nodes(node[3]))
+                # Adjacent literals are merged so render() only joins what varies
+                if isinstance(value, str) and bound and isinstance(bound[-1], str):
+                    bound[-1] += value
+                else:
+                    bound.append(value)
+            return bound
+        return Template(nodes=bind_nodes(self.nodes))
+
+    def render(self, variables):
+        """Renders the template; missing variables are empty and falsy, as in pandoc."""
+        output = []
+        def render_nodes(nodes):
+            for node in nodes:
+                if isinstance(node, str):
+                    output.append(node)
+                elif node[0] == 'var':
+                    output.append(variables.get(node[1], ''))
+                else:
+                    render_nodes(node[2] if variables.get(node[1]) else node[3])
+        render_nodes(self.nodes)
+        return ''.join(output)
+
+    def source(self):
+        """Writes the template back out in pandoc syntax, e.g. for pandoc --template."""
+        def source_nodes(nodes):
+            parts = []
+            for node in nodes:
+                if isinstance(node, str):
+                    parts.append(node)
+                elif node[0] == 'var':
+                    parts.append(f'${node[1]}$')
+                else:
+                    else_part = f'$else${source_nodes(node[3])}' if node[3] else ''
+                    parts.append(f'$if({node[1]})${source_nodes(node[2])}{else_part}$endif$')
+            return ''.join(parts)
+        return source_nodes(self.nodes)
+
+_template_cache = {}
+
+def load_template(template_path):
+    """Returns the compiled template of a file, parsing it again only after it changes."""
+    stat = os.stat(template_path)
+    cache_key = (os.path.abspath(template_path), stat.st_mtime_ns, stat.st_size)
+    build_report.count_cache('templates', cache_key in _template_cache)
+    if cache_key not in _template_cache:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            _template_cache[cache_key] = Template(f.read())
+    return _template_cache[cache_key]
+
 def load_config(config_path='config.json'):
     """Loads the configuration file."""
     try:
@@ -69,245 +647,1950 @@ def generate_nav_html(config):
     nav_html += '</ul></nav>'
     return nav_html
 
-def get_post_summary(config, md_file_path):
-    """Generates a summary for a given blog post."""
-    try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except FileNotFoundError:
-        print(f"Uyarı: Yazı dosyası bulunamadı, atlanıyor: {md_file_path}", file=sys.stderr)
-        return ""
-        
-    front_matter_match = FRONT_MATTER_RE.search(content)
-    title = "Başlıksız"
-    preview_image_path = None
-    is_external_image = False
-
-    if front_matter_match:
-        front_matter = front_matter_match.group(1)
-        title_match = TITLE_RE.search(front_matter)
-        if title_match:
-            title = title_match.group(1).strip().strip('"')
-            
-        preview_image_match = PREVIEW_IMAGE_RE.search(front_matter)
-        if preview_image_match:
-            preview_image_path = preview_image_match.group(1).strip()
+def build_post_entry(config, md_file_path, content, content_hash, body_html, links=(), images=()):
+    """Extracts the homepage, search and feed data of a post (title, dates, tags, preview image, summary, slug, terms).
 
-    content_without_frontmatter = FRONT_MATTER_RE.sub('', content)
+    Without a preview_image in the front matter the preview is the first of
+    `images` the rewriter emitted, so its files are queued by the post itself.
+    """
+    front_matter = parse_front_matter(content)
+    title = front_matter.get('title', "Başlıksız")
+    preview_image_url = None
+    preview_picture = None
 
-    if not preview_image_path:
-        image_match = FIRST_IMAGE_RE.search(content_without_frontmatter)
-        if image_match:
-            image_url = image_match.group(1)
-            if image_url.startswith('http'):
-                preview_image_path = image_url
-                is_external_image = True
-            else:
-                image_filename = os.path.basename(image_url)
-                preview_image_path = os.path.join('assets', image_filename)
+    if front_matter.get('preview_image', '').startswith(('http://', 'https://')):
+        preview_image_url = front_matter['preview_image']
+    elif front_matter.get('preview_image'):
+        preview_image_url = os.path.join(config.get('site_url', '/'), front_matter['preview_image'].lstrip('/'))
+    elif images:
+        preview_image_url, image = images[0]
+        if image:
+            preview_picture = dict(image)
+            preview_picture['files'] = asset_job_files({None: (None, 'image', preview_picture.pop('variants'))})
 
-    processed_for_links = process_markdown_content(config, content_without_frontmatter, md_file_path)
-    html = markdown.markdown(processed_for_links)
-    summary_match = FIRST_PARAGRAPH_RE.search(html)
-    summary = summary_match.group(1) if summary_match else ""
-    
-    site_url = config.get('site_url', '/')
-    post_filename = os.path.basename(md_file_path).replace('.md', '.html')
-    post_link = os.path.join(site_url, post_filename)
+    iso_date = parse_post_date(front_matter.get('date'))
+    # lastmod of feeds and the sitemap: explicit update date, publication date, or when the source last changed
+    updated = parse_post_date(front_matter.get('updated') or front_matter.get('lastmod')) or iso_date
+    if not updated:
+        updated = datetime.fromtimestamp(os.path.getmtime(md_file_path), timezone.utc).strftime('%Y-%m-%d')
+
+    summary_match = FIRST_PARAGRAPH_RE.search(body_html)
+    return {
+        'terms': extract_search_terms(title, body_html),
+        'links': sorted(links),
+        'tags': parse_tags(front_matter.get('tags', '')),
+        'updated': updated,
+        'hash': content_hash,
+        'slug': os.path.basename(md_file_path)[:-len('.md')],
+        'title': title,
+        'date': front_matter.get('date', ''),
+        'iso_date': iso_date,
+        'preview_image': preview_image_url,
+        'preview_picture': preview_picture,
+        'summary': summary_match.group(1) if summary_match else "",
+    }
+
+def parse_tags(value):
+    """Parses an inline front matter tag list (`a, b` or `[a, b]`) into a list of tags."""
+    value = value.strip()
+    if value.startswith('[') and value.endswith(']'):
+        value = value[1:-1]
+    tags = []
+    for tag in TAG_SPLIT_RE.split(value):
+        tag = tag.strip().strip('"\'')
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+def render_post_summary(config, entry, eager=False):
+    """Renders the homepage list item for a post index entry; `eager` marks the first preview of a page."""
+    post_link = os.path.join(config.get('site_url', '/'), entry['slug'] + '.html')
 
     preview_image_html = ''
-    if preview_image_path:
-        if is_external_image:
-            absolute_image_url = preview_image_path
-        else:
-            absolute_image_url = os.path.join(site_url, preview_image_path.lstrip('/'))
-        preview_image_html = f'<img src="{absolute_image_url}" alt="{title}" class="preview-image">'
+    if entry.get('preview_picture'):
+        preview_image_html = render_picture_html(config, entry['preview_picture'], entry['title'], 'preview-image', eager)
+    elif entry['preview_image']:
+        preview_image_html = f'<img src="{entry["preview_image"]}" alt="{entry["title"]}" class="preview-image">'
 
     html_parts = [
         '<li class="post-list-item">',
         preview_image_html,
         '<div class="summary-content">',
-        f'<h2><a href="{post_link}">{title}</a></h2>',
-        f'<p>{summary}</p>',
+        f'<h2><a href="{post_link}">{entry["title"]}</a></h2>',
+        f'<p>{entry["summary"]}</p>',
         '</div>',
         '</li>'
     ]
     return '\n'.join(html_parts)
 
-def generate_homepage(config):
-    """Generates the main index.html page."""
+def index_post(config, md_file_path):
+    """Builds a post index entry straight from the markdown file, without the post-rendering pass."""
+    with open(md_file_path, 'rb') as f:
+        raw_content = f.read()
+    content = raw_content.decode('utf-8')
+    content_without_frontmatter = FRONT_MATTER_RE.sub('', content)
+    # Assets are only recorded, not copied: the summary needs the rewritten links, not the files
+    links = {}
+    images = []
+    processed_for_links = process_markdown_content(config, content_without_frontmatter, md_file_path, asset_jobs={}, links=links, images=images)
+    body_html = convert_with_markdown(processed_for_links)
+    return build_post_entry(config, md_file_path, content, hash_bytes(raw_content), body_html, links, images)
+
+def get_post_summary(config, md_file_path):
+    """Generates a summary for a given blog post."""
+    try:
+        entry = index_post(config, md_file_path)
+    except FileNotFoundError:
+        print(f"Uyarı: Yazı dosyası bulunamadı, atlanıyor: {md_file_path}", file=sys.stderr)
+        return ""
+    return render_post_summary(config, entry)
+
+def load_post_index(config):
+    """Loads the persisted post index from the output folder."""
+    output_dir = config.get('output_folder', 'public')
+    return load_json_file(os.path.join(output_dir, POST_INDEX_NAME), {})
+
+def is_reserved_post(md_file_path):
+    """Returns True for index.md and for posts named like a listing page, which are not rendered as posts."""
+    return bool(RESERVED_POST_NAME_RE.match(os.path.basename(md_file_path)))
+
+def list_post_files(config, warn=True):
+    """Returns the sorted posts of the content folder, without index.md and names the listing pages use."""
+    content_dir = config.get('content_folder', 'content')
+    post_files = []
+    for md_file_path in sorted(glob.glob(os.path.join(content_dir, '*.md'))):
+        if not is_reserved_post(md_file_path):
+            post_files.append(md_file_path)
+        elif warn and os.path.basename(md_file_path) != 'index.md':
+            print(f"Uyarı: {md_file_path} atlanıyor; bu ad bir liste sayfasına ayrılmış, dosyayı yeniden adlandırın.", file=sys.stderr)
+    return post_files
+
+def update_post_index(config, post_index, post_files):
+    """Brings the post index up to date for the given files and drops entries of deleted posts.
+
+    Entries are reused as long as the file hash still matches, so unchanged posts
+    are never parsed or rendered again.
+    """
+    updated_index = {}
+    for md_file_path in post_files:
+        with open(md_file_path, 'rb') as f:
+            content_hash = hash_bytes(f.read())
+        entry = post_index.get(md_file_path)
+        if not entry or entry.get('hash') != content_hash:
+            entry = index_post(config, md_file_path)
+        updated_index[md_file_path] = entry
+    return updated_index
+
+def parse_post_date(value):
+    """Parses a front matter date into ISO `YYYY-MM-DD`, or returns None.
+
+    Accepts ISO dates (optionally with a time), `DD.MM.YYYY` and day/month-name/year
+    forms such as `26 Haziran 2025` or `26 June 2025`.
+    """
+    value = (value or '').strip().strip('"\'')
+    iso_match = ISO_DATE_RE.match(value)
+    if iso_match:
+        year, month, day = (int(g) for g in iso_match.groups())
+    else:
+        dotted_match = DOTTED_DATE_RE.match(value)
+        named_match = NAMED_DATE_RE.match(value)
+        if dotted_match:
+            day, month, year = (int(g) for g in dotted_match.groups())
+        elif named_match and named_match.group(2).casefold() in MONTH_NAMES:
+            day, month, year = int(named_match.group(1)), MONTH_NAMES[named_match.group(2).casefold()], int(named_match.group(3))
+        else:
+            return None
+    try:
+        return datetime(year, month, day).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+def sort_post_entries(entries):
+    """Orders post index entries newest first by front matter date; undated posts come last by slug."""
+    def sort_key(entry):
+        iso_date = entry.get('iso_date') or parse_post_date(entry.get('date'))
+        return (iso_date is not None, iso_date or '', entry['slug'])
+    dated = sorted((e for e in entries if sort_key(e)[0]), key=sort_key, reverse=True)
+    undated = sorted((e for e in entries if not sort_key(e)[0]), key=lambda e: e['slug'])
+    return dated + undated
+
+def index_page_name(page_number):
+    """Returns the output filename of a homepage page: index.html, index-2.html, ..."""
+    return 'index.html' if page_number == 1 else f'index-{page_number}.html'
+
+def render_pagination_html(config, page_number, page_count):
+    """Renders the newer/older navigation between homepage pages."""
+    if page_count <= 1:
+        return ''
+    site_url = config.get('site_url', '/')
+    links = []
+    if page_number > 1:
+        links.append(f'<a href="{os.path.join(site_url, index_page_name(page_number - 1))}" rel="prev">&larr; Daha yeni</a>')
+    links.append(f'<span>Sayfa {page_number} / {page_count}</span>')
+    if page_number < page_count:
+        links.append(f'<a href="{os.path.join(site_url, index_page_name(page_number + 1))}" rel="next">Daha eski &rarr;</a>')
+    return '<nav class="pagination">' + ''.join(links) + '</nav>'
+
+def render_listing_page(config, shell, title, intro_html, entries, footer_html=''):
+    """Renders the compiled homepage shell with an intro and a list of post summaries."""
+    posts_html = footer_html
+    if entries:
+        summaries = [render_post_summary(config, entry, position == 0) for position, entry in enumerate(entries)]
+        posts_html = '<ul class="post-list">\n' + '\n'.join(summaries) + '\n</ul>' + footer_html
+    return shell.render({'site_title': title, 'index_content': intro_html, 'posts': posts_html})
+
+def listing_page_files(entries):
+    """Returns the preview image files referenced by a listing of post entries."""
+    files = set()
+    for entry in entries:
+        files.update((entry.get('preview_picture') or {}).get('files', []))
+        # Previews without a planned picture (e.g. a missing source) still point into /assets/
+        preview_match = ASSET_URL_RE.search(entry.get('preview_image') or '')
+        if not entry.get('preview_picture') and preview_match:
+            files.add(preview_match.group(1))
+    return files
+
+def group_archive_entries(entries):
+    """Groups sorted, dated post entries into {'YYYY': [...]} and {'YYYY-MM': [...]}."""
+    years, months = {}, {}
+    for entry in entries:
+        iso_date = entry.get('iso_date') or parse_post_date(entry.get('date'))
+        if not iso_date:
+            continue
+        years.setdefault(iso_date[:4], []).append(entry)
+        months.setdefault(iso_date[:7], []).append(entry)
+    return years, months
+
+def month_title(year_month):
+    """Returns a display title like `Haziran 2025` for `2025-06`."""
+    year, month = year_month.split('-')
+    return f"{MONTH_DISPLAY_NAMES[int(month) - 1]} {year}"
+
+def render_archive_index_html(config, years, months):
+    """Renders the archive overview: every year and month with its post count."""
+    site_url = config.get('site_url', '/')
+    parts = ['<h1>Arşiv</h1>', '<ul class="archive-list">']
+    for year in sorted(years, reverse=True):
+        month_links = [
+            f'<li><a href="{os.path.join(site_url, f"archive-{ym}.html")}">{month_title(ym)}</a> ({len(months[ym])})</li>'
+            for ym in sorted((ym for ym in months if ym.startswith(year)), reverse=True)
+        ]
+        parts.append(
+            f'<li><a href="{os.path.join(site_url, f"archive-{year}.html")}">{year}</a> ({len(years[year])})'
+            f'<ul>{"".join(month_links)}</ul></li>'
+        )
+    parts.append('</ul>')
+    return '\n'.join(parts)
+
+def write_page_if_changed(output_dir, page_name, page_html, page_hashes):
+    """Writes a generated page only if its content differs from the last build. Returns True if written."""
+    page_hash = hash_bytes(page_html.encode('utf-8'))
+    output_path = os.path.join(output_dir, page_name)
+    unchanged = page_hashes.get(page_name) == page_hash and os.path.exists(output_path)
+    build_report.count_cache('listing_pages', unchanged)
+    if unchanged:
+        return False
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(page_html)
+    build_report.count_io(written=len(page_html.encode('utf-8')))
+    page_hashes[page_name] = page_hash
+    return True
+
+def normalize_search_text(text):
+    """Lowercases text the Turkish way and folds diacritics (İ/I -> i/ı, then ı, ş, ğ, ... -> i, s, g, ...)."""
+    text = text.replace('İ', 'i').replace('I', 'ı').lower().translate(TURKISH_FOLD)
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+
+def extract_search_terms(title, body_html):
+    """Returns term -> weight for a post, counting title occurrences SEARCH_TITLE_WEIGHT times."""
+    terms = {}
+    body_text = html.unescape(HTML_TAG_RE.sub(' ', body_html))
+    for text, weight in ((title, SEARCH_TITLE_WEIGHT), (body_text, 1)):
+        for term in SEARCH_TERM_RE.findall(normalize_search_text(text)):
+            if len(term) >= SEARCH_SHARD_PREFIX_LENGTH and term not in SEARCH_STOP_WORDS:
+                terms[term] = terms.get(term, 0) + weight
+    return terms
+
+def search_shard_name(term):
+    """Returns the shard file name for a term; search.js derives it the same way."""
+    prefix = term[:SEARCH_SHARD_PREFIX_LENGTH]
+    if not SEARCH_SAFE_PREFIX_RE.match(prefix):
+        prefix = 'x' + prefix.encode('utf-8').hex()
+    # Not '.json.gz': compress_outputs would take that for a stale sidecar of '.json'
+    return f'shard-{prefix}.gz'
+
+def read_search_shard(shard_path):
+    """Loads a gzip-compressed shard (term -> [[doc id, weight], ...]), or {} if it does not exist."""
+    try:
+        with open(shard_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}
+    build_report.count_io(read=len(data))
+    return json.loads(gzip.decompress(data))
+
+def write_if_changed(path, data):
+    """Writes bytes to a file unless it already holds exactly them. Returns True if written."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    build_report.count_io(written=len(data))
+    return True
+
+def update_search_index(config, post_index):
+    """Brings the sharded client-side search index up to date with the post index.
+
+    Terms come from the per-post `terms` of the post index. Only shards that
+    hold a term of an added, changed or removed post are read, patched and
+    rewritten; all other shards are left untouched.
+    """
+    output_dir = config.get('output_folder', 'public')
+    site_url = config.get('site_url', '/')
+    search_dir = os.path.join(output_dir, SEARCH_DIR_NAME)
+    state_path = os.path.join(output_dir, SEARCH_STATE_NAME)
+
+    state = load_json_file(state_path, {})
+    rebuild = state.get('version') != SEARCH_INDEX_VERSION or not os.path.isdir(search_dir)
+    if rebuild:
+        state = {'version': SEARCH_INDEX_VERSION, 'next_id': 0, 'docs': {}}
+        shutil.rmtree(search_dir, ignore_errors=True)
+        os.makedirs(search_dir)
+    docs = state['docs']
+
+    # Shard name -> doc ids whose postings must be replaced there
+    dirty_shards = {}
+    changed = {}
+    for md_file_path in [path for path in docs if path not in post_index]:
+        old = docs.pop(md_file_path)
+        for shard_name in old['shards']:
+            dirty_shards.setdefault(shard_name, set()).add(old['id'])
+    for md_file_path, entry in post_index.items():
+        old = docs.get(md_file_path)
+        if old and old['hash'] == entry['hash']:
+            continue
+        doc_id = old['id'] if old else state['next_id']
+        if not old:
+            state['next_id'] += 1
+        terms = entry.get('terms', {})
+        shards = sorted({search_shard_name(term) for term in terms})
+        for shard_name in set(shards) | set(old['shards'] if old else ()):
+            dirty_shards.setdefault(shard_name, set()).add(doc_id)
+        docs[md_file_path] = {'id': doc_id, 'hash': entry['hash'], 'shards': shards}
+        changed[doc_id] = terms
+
+    all_shards = {shard_name for doc in docs.values() for shard_name in doc['shards']} | set(dirty_shards)
+    for shard_name in sorted(all_shards):
+        build_report.count_cache('search_shards', shard_name not in dirty_shards)
+        if shard_name not in dirty_shards:
+            continue
+        shard_path = os.path.join(search_dir, shard_name)
+        stale_ids = dirty_shards[shard_name]
+        postings = {}
+        for term, term_postings in read_search_shard(shard_path).items():
+            kept = [posting for posting in term_postings if posting[0] not in stale_ids]
+            if kept:
+                postings[term] = kept
+        for doc_id, terms in changed.items():
+            for term, weight in terms.items():
+                if search_shard_name(term) == shard_name:
+                    postings.setdefault(term, []).append([doc_id, weight])
+        if not postings:
+            if os.path.exists(shard_path):
+                os.remove(shard_path)
+            continue
+        for term_postings in postings.values():
+            term_postings.sort(key=lambda posting: (-posting[1], posting[0]))
+        data = json.dumps(postings, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+        write_if_changed(shard_path, gzip.compress(data, compresslevel=9, mtime=0))
+
+    meta = {
+        'version': SEARCH_INDEX_VERSION,
+        'docs': {
+            str(doc['id']): [
+                os.path.join(site_url, post_index[md_file_path]['slug'] + '.html'),
+                post_index[md_file_path]['title'],
+                post_index[md_file_path]['date'],
+            ]
+            for md_file_path, doc in docs.items()
+        },
+    }
+    meta_data = json.dumps(meta, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    write_if_changed(os.path.join(search_dir, 'meta.json'), meta_data)
+    write_search_client(config)
+    write_json_file(state_path, state)
+    print(f"   - Search index: {len(dirty_shards)} of {len(all_shards)} shard(s) updated for {len(changed)} changed post(s).", file=sys.stderr)
+
+def write_streamed(path, chunks, previous_hash):
+    """Streams text chunks to a temporary file and replaces `path` only if the content changed.
+
+    Returns the content hash and whether the file was written. Keeping the old
+    file (and its mtime) lets clients revalidate it with a 304.
+    """
+    digest = hashlib.sha256()
+    temp_path = f"{path}.tmp"
+    size = 0
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            size += len(data)
+    content_hash = digest.hexdigest()
+    if content_hash == previous_hash and os.path.exists(path):
+        os.remove(temp_path)
+        return content_hash, False
+    os.replace(temp_path, path)
+    build_report.count_io(written=size)
+    return content_hash, True
+
+def absolute_url(config, path):
+    """Joins a site-relative path to site_url."""
+    return config.get('site_url', '/').rstrip('/') + '/' + path.lstrip('/')
+
+def feed_timestamp(iso_date):
+    """Returns an Atom timestamp for a `YYYY-MM-DD` date."""
+    return f'{iso_date}T00:00:00Z'
+
+def rss_timestamp(iso_date):
+    """Returns an RFC 822 timestamp for a `YYYY-MM-DD` date."""
+    return format_datetime(datetime.strptime(iso_date, '%Y-%m-%d').replace(tzinfo=timezone.utc), usegmt=True)
+
+def render_feed_fragments(config, entry):
+    """Renders the Atom <entry> and RSS <item> of a post."""
+    post_url = absolute_url(config, entry['slug'] + '.html')
+    title = html.escape(entry['title'])
+    summary = html.escape(entry.get('summary', ''))
+    published = entry.get('iso_date') or entry['updated']
+    categories = ''.join(f'    <category term="{html.escape(tag)}"/>\n' for tag in entry.get('tags', []))
+    atom = (
+        '  <entry>\n'
+        f'    <title>{title}</title>\n'
+        f'    <link href="{html.escape(post_url)}"/>\n'
+        f'    <id>{html.escape(post_url)}</id>\n'
+        f'    <published>{feed_timestamp(published)}</published>\n'
+        f'    <updated>{feed_timestamp(entry["updated"])}</updated>\n'
+        f'{categories}'
+        f'    <summary type="html">{summary}</summary>\n'
+        '  </entry>\n'
+    )
+    rss_categories = ''.join(f'      <category>{html.escape(tag)}</category>\n' for tag in entry.get('tags', []))
+    rss = (
+        '    <item>\n'
+        f'      <title>{title}</title>\n'
+        f'      <link>{html.escape(post_url)}</link>\n'
+        f'      <guid isPermaLink="true">{html.escape(post_url)}</guid>\n'
+        f'      <pubDate>{rss_timestamp(published)}</pubDate>\n'
+        f'{rss_categories}'
+        f'      <description>{summary}</description>\n'
+        '    </item>\n'
+    )
+    return {'hash': entry['hash'], 'atom': atom, 'rss': rss}
+
+def atom_feed_chunks(config, title, feed_path, page_path, entries, fragments):
+    """Yields an Atom feed piece by piece."""
+    feed_url = html.escape(absolute_url(config, feed_path))
+    updated = max((entry['updated'] for entry in entries), default='1970-01-01')
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield f'<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="{html.escape(config.get("default_lang", "tr"))}">\n'
+    yield f'  <title>{html.escape(title)}</title>\n'
+    if config.get('site_description'):
+        yield f'  <subtitle>{html.escape(config["site_description"])}</subtitle>\n'
+    yield f'  <link href="{feed_url}" rel="self"/>\n'
+    yield f'  <link href="{html.escape(absolute_url(config, page_path))}"/>\n'
+    yield f'  <id>{feed_url}</id>\n'
+    yield f'  <updated>{feed_timestamp(updated)}</updated>\n'
+    yield f'  <author><name>{html.escape(config.get("author", ""))}</name></author>\n'
+    for entry in entries:
+        yield fragments[entry['slug']]['atom']
+    yield '</feed>\n'
+
+def rss_feed_chunks(config, title, feed_path, page_path, entries, fragments):
+    """Yields an RSS 2.0 feed piece by piece."""
+    updated = max((entry['updated'] for entry in entries), default='1970-01-01')
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n  <channel>\n'
+    yield f'    <title>{html.escape(title)}</title>\n'
+    yield f'    <link>{html.escape(absolute_url(config, page_path))}</link>\n'
+    yield f'    <description>{html.escape(config.get("site_description", ""))}</description>\n'
+    yield f'    <language>{html.escape(config.get("default_lang", "tr"))}</language>\n'
+    yield f'    <lastBuildDate>{rss_timestamp(updated)}</lastBuildDate>\n'
+    yield f'    <atom:link href="{html.escape(absolute_url(config, feed_path))}" rel="self" type="application/rss+xml"/>\n'
+    for entry in entries:
+        yield fragments[entry['slug']]['rss']
+    yield '  </channel>\n</rss>\n'
+
+def sitemap_chunks(config, urls):
+    """Yields a sitemap for (path, lastmod) pairs piece by piece."""
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for path, lastmod in urls:
+        lastmod_xml = f'<lastmod>{lastmod}</lastmod>' if lastmod else ''
+        yield f'  <url><loc>{html.escape(absolute_url(config, path))}</loc>{lastmod_xml}</url>\n'
+    yield '</urlset>\n'
+
+def sitemap_index_chunks(config, sitemaps):
+    """Yields a sitemap index for (sitemap name, lastmod) pairs."""
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for name, lastmod in sitemaps:
+        lastmod_xml = f'<lastmod>{lastmod}</lastmod>' if lastmod else ''
+        yield f'  <sitemap><loc>{html.escape(absolute_url(config, name))}</loc>{lastmod_xml}</sitemap>\n'
+    yield '</sitemapindex>\n'
+
+def tag_slug(tag):
+    """Returns the file name stem of a tag feed."""
+    return TAG_SLUG_RE.sub('-', normalize_search_text(tag)).strip('-') or 'tag'
+
+def generate_feeds(config, post_index):
+    """Writes the Atom/RSS feeds, optional per-tag feeds and the sitemap.
+
+    Every file is streamed to disk and only replaced when its content changed.
+    Feed entries are rendered once per post version and reused from the
+    feed state afterwards.
+    """
+    output_dir = config.get('output_folder', 'public')
+    state_path = os.path.join(output_dir, FEED_STATE_NAME)
+    site_title = config.get('site_title', 'Blog')
+    feed_limit = max(1, int(config.get('feed_limit', DEFAULT_FEED_LIMIT)))
+    if not config.get('site_url', '/').startswith(('http://', 'https://')):
+        print("Uyarı: site_url mutlak bir adres değil; akış ve site haritası bağlantıları göreli olacak (--site-url ile verin).", file=sys.stderr)
+
+    # Fragments depend on the rendering setup (renderer, site URL, templates) as well as on the post
+    config_hash = hash_bytes(json.dumps([FEED_FORMAT_VERSION, compute_global_hash(config)]).encode('utf-8'))
+    state = load_json_file(state_path, {})
+    cached = state.get('entries', {}) if state.get('config_hash') == config_hash else {}
+    previous_outputs = state.get('outputs', {})
+    outputs = {}
+    fragments = {}
+    written = []
+
+    def stream(path, chunks):
+        outputs[path], changed = write_streamed(os.path.join(output_dir, path), chunks, previous_outputs.get(path))
+        if changed:
+            written.append(path)
+
+    def feed_fragments(entries):
+        for entry in entries:
+            cached_entry = cached.get(entry['slug'])
+            hit = bool(cached_entry) and cached_entry['hash'] == entry['hash']
+            build_report.count_cache('feed_entries', hit)
+            fragments[entry['slug']] = cached_entry if hit else render_feed_fragments(config, entry)
+
+    def write_feeds(title, atom_path, rss_path, page_path, entries):
+        feed_fragments(entries)
+        for path, chunks in ((atom_path, atom_feed_chunks), (rss_path, rss_feed_chunks)):
+            stream(path, chunks(config, title, path, page_path, entries, fragments))
+
+    entries = sort_post_entries(list(post_index.values()))
+    write_feeds(site_title, ATOM_FEED_NAME, RSS_FEED_NAME, '', entries[:feed_limit])
+
+    if config.get('tag_feeds'):
+        os.makedirs(os.path.join(output_dir, TAG_FEEDS_DIR_NAME), exist_ok=True)
+        tagged = {}
+        for entry in entries:
+            for tag in entry.get('tags', []):
+                tag_entries = tagged.setdefault(tag_slug(tag), (tag, []))[1]
+                if len(tag_entries) < feed_limit:
+                    tag_entries.append(entry)
+        for slug, (tag, tag_entries) in sorted(tagged.items()):
+            base = f'{TAG_FEEDS_DIR_NAME}/{slug}'
+            write_feeds(f'{site_title} - {tag}', f'{base}.atom.xml', f'{base}.rss.xml', '', tag_entries)
+
+    # Sitemap: homepage, posts and archive pages; large sites are split behind a sitemap index
+    newest = max((entry['updated'] for entry in entries), default=None)
+    listing_pages = sorted(load_json_file(os.path.join(output_dir, LISTING_PAGES_NAME), {}))
+    def sitemap_urls():
+        yield '', newest
+        for entry in entries:
+            yield entry['slug'] + '.html', entry['updated']
+        for page_name in listing_pages:
+            if page_name != 'index.html':
+                yield page_name, None
+    url_count = 1 + len(entries) + len([name for name in listing_pages if name != 'index.html'])
+    if url_count <= SITEMAP_MAX_URLS:
+        stream(SITEMAP_NAME, sitemap_chunks(config, sitemap_urls()))
+    else:
+        urls = sitemap_urls()
+        sitemaps = []
+        for part in range(1, -(-url_count // SITEMAP_MAX_URLS) + 1):
+            name = f'sitemap-{part}.xml'
+            part_urls = [next(urls) for _ in range(min(SITEMAP_MAX_URLS, url_count - (part - 1) * SITEMAP_MAX_URLS))]
+            stream(name, sitemap_chunks(config, part_urls))
+            sitemaps.append((name, max((lastmod for _, lastmod in part_urls if lastmod), default=None)))
+        stream(SITEMAP_NAME, sitemap_index_chunks(config, sitemaps))
+
+    # Feeds of tags that disappeared and sitemap parts no longer needed
+    for path in [path for path in previous_outputs if path not in outputs]:
+        stale_path = os.path.join(output_dir, path)
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+    write_json_file(state_path, {'config_hash': config_hash, 'outputs': outputs, 'entries': fragments})
+    print(f"   - Feeds and sitemap: {len(written)} of {len(outputs)} file(s) changed.", file=sys.stderr)
+
+def write_search_client(config):
+    """Generates search.js from templates/search.js next to style.css."""
+    output_dir = config.get('output_folder', 'public')
+    try:
+        template = load_template('templates/search.js')
+    except FileNotFoundError as e:
+        print(f"Uyarı: Arama istemcisi şablonu bulunamadı: {e.filename}", file=sys.stderr)
+        return
+    client = template.render({
+        'search_url': json.dumps(os.path.join(config.get('site_url', '/'), SEARCH_DIR_NAME, '')),
+        'shard_prefix_length': str(SEARCH_SHARD_PREFIX_LENGTH),
+        'stop_words': json.dumps(sorted(SEARCH_STOP_WORDS)),
+    })
+    write_if_changed(os.path.join(output_dir, 'search.js'), client.encode('utf-8'))
+
+def write_embed_client(config):
+    """Copies embeds.js, which swaps embed facades for the real players, next to style.css."""
+    output_dir = config.get('output_folder', 'public')
+    try:
+        with open(os.path.join('templates', EMBED_CLIENT_NAME), 'rb') as f:
+            client = f.read()
+    except FileNotFoundError as e:
+        print(f"Uyarı: Gömülü içerik istemcisi bulunamadı: {e.filename}", file=sys.stderr)
+        return
+    write_if_changed(os.path.join(output_dir, EMBED_CLIENT_NAME), client)
+
+def generate_homepage(config, post_index=None):
+    """Generates the paginated homepage and the year/month archive pages.
+
+    Post summaries come from the post index; when no up-to-date index is passed
+    in, the persisted one is loaded and refreshed for changed posts first.
+    Every listing page is regenerated in memory, but only pages whose HTML
+    actually changed are written to disk.
+    """
     content_dir = config.get('content_folder', 'content')
     output_dir = config.get('output_folder', 'public')
     template_path = 'templates/homepage.html'
-    output_path = os.path.join(output_dir, 'index.html')
     index_md_path = os.path.join(content_dir, 'index.md')
+    listing_state_path = os.path.join(output_dir, LISTING_PAGES_NAME)
 
     try:
-        with open('templates/_footer.html', 'r', encoding='utf-8') as f: footer_content = f.read()
+        footer_content = render_footer(config)
         with open(index_md_path, 'r', encoding='utf-8') as f: index_md_content = f.read()
-        with open(template_path, 'r', encoding='utf-8') as f: template_content = f.read()
+        template = load_template(template_path)
     except FileNotFoundError as e:
         print(f"Hata: Gerekli bir şablon veya içerik dosyası bulunamadı: {e.filename}", file=sys.stderr)
         sys.exit(1)
 
-    nav_content = generate_nav_html(config)
-    current_year = str(datetime.now().year)
+    site_title = config.get("site_title", "Blog")
 
     index_title_match = TITLE_RE.search(index_md_content)
-    index_title = index_title_match.group(1).strip().strip('"') if index_title_match else config.get("site_title", "Blog")
+    index_title = index_title_match.group(1).strip().strip('"') if index_title_match else site_title
 
     index_content_without_frontmatter = FRONT_MATTER_RE.sub('', index_md_content)
-    index_html_content = markdown.markdown(process_markdown_content(config, index_content_without_frontmatter, index_md_path))
+    index_assets = {}
+    index_sources = {}
+    index_html_content = markdown.markdown(process_markdown_content(config, index_content_without_frontmatter, index_md_path, index_assets, asset_sources=index_sources))
+    if index_assets:
+        run_asset_jobs(config, index_assets, workers=1)
 
-    post_files = glob.glob(os.path.join(content_dir, '*.md'))
-    post_files = [f for f in post_files if os.path.basename(f) != 'index.md']
-    post_files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
+    post_files = list_post_files(config, warn=post_index is None)
 
-    summaries = [get_post_summary(config, f) for f in post_files]
-    posts_html = '<ul class="post-list">\n' + '\n'.join(summaries) + '\n</ul>'
+    if post_index is None:
+        post_index = update_post_index(config, load_post_index(config), post_files)
+        write_json_file(os.path.join(output_dir, POST_INDEX_NAME), post_index)
 
-    final_html = template_content.replace('<!-- INDEX_CONTENT_PLACEHOLDER -->', index_html_content)
-    final_html = final_html.replace('<!-- POSTS_PLACEHOLDER -->', posts_html)
-    final_html = final_html.replace('$site_title$', index_title)
-    final_html = final_html.replace('$site_description$', config.get("site_description", ""))
-    final_html = final_html.replace('<!-- NAV_PLACEHOLDER -->', nav_content)
-    final_html = final_html.replace('<!-- FOOTER_PLACEHOLDER -->', footer_content.replace('__CURRENT_YEAR__', current_year))
+    entries = sort_post_entries([post_index[f] for f in post_files if f in post_index])
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(final_html)
-    print(f"Homepage generated at {output_path}", file=sys.stderr)
+    shell = template.bind({
+        'site_description': config.get("site_description", ""),
+        'nav': generate_nav_html(config),
+        'footer': footer_content,
+    })
+
+    # page name -> (html, referenced asset files)
+    pages = {}
+    posts_per_page = max(1, int(config.get('posts_per_page', DEFAULT_POSTS_PER_PAGE)))
+    page_count = max(1, -(-len(entries) // posts_per_page))
+    for page_number in range(1, page_count + 1):
+        page_entries = entries[(page_number - 1) * posts_per_page:page_number * posts_per_page]
+        intro_html = index_html_content if page_number == 1 else ''
+        title = index_title if page_number == 1 else f"{index_title} - Sayfa {page_number}"
+        page_html = render_listing_page(config, shell, title, intro_html, page_entries, render_pagination_html(config, page_number, page_count))
+        page_files = listing_page_files(page_entries)
+        if page_number == 1:
+            page_files.update(post_asset_files(index_assets, index_sources))
+        pages[index_page_name(page_number)] = (page_html, page_files)
+
+    years, months = group_archive_entries(entries)
+    pages['archive.html'] = (render_listing_page(config, shell, f"Arşiv - {site_title}", render_archive_index_html(config, years, months), []), set())
+    for year, year_entries in years.items():
+        pages[f'archive-{year}.html'] = (render_listing_page(config, shell, f"{year} - {site_title}", f'<h1>{year}</h1>', year_entries), listing_page_files(year_entries))
+    for year_month, month_entries in months.items():
+        title = month_title(year_month)
+        pages[f'archive-{year_month}.html'] = (render_listing_page(config, shell, f"{title} - {site_title}", f'<h1>{title}</h1>', month_entries), listing_page_files(month_entries))
+
+    page_hashes = load_json_file(listing_state_path, {})
+    page_refs = {}
+    written = 0
+    for page_name, (page_html, page_files) in pages.items():
+        # Recorded for unchanged pages too; update_asset_refs only applies the differences
+        page_refs[page_name] = page_files
+        if write_page_if_changed(output_dir, page_name, page_html, page_hashes):
+            written += 1
 
-def optimize_image(image_path, output_path, quality=85):
-    """Optimizes an image file."""
+    # Pages that no longer exist, e.g. the last index page after posts were removed
+    for page_name in [name for name in page_hashes if name not in pages]:
+        stale_path = os.path.join(output_dir, page_name)
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+        del page_hashes[page_name]
+        page_refs[page_name] = set()
+
+    write_json_file(listing_state_path, page_hashes)
+    if page_refs:
+        update_asset_refs(config, page_refs)
+    print(f"Homepage generated: {written} of {len(pages)} listing pages written ({page_count} index page(s)).", file=sys.stderr)
+
+def encode_image_variants(image_path, variants, quality=85):
+    """Decodes an image once and writes every resized/re-encoded variant of it.
+
+    `variants` is a sequence of (output_path, width, format) where format is a
+    key of MODERN_IMAGE_FORMATS or None to keep the source format.
+    """
     try:
         with Image.open(image_path) as img:
             img = ImageOps.exif_transpose(img)
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            img.save(output_path, quality=quality, optimize=True)
-            print(f"Optimized {os.path.basename(image_path)} and saved to {output_path}", file=sys.stderr)
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            for output_path, width, image_format in variants:
+                variant = img
+                if width and width < img.width:
+                    height = max(1, round(img.height * width / img.width))
+                    variant = img.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+                if image_format:
+                    pillow_format = MODERN_IMAGE_FORMATS[image_format][0]
+                    variant.save(output_path, format=pillow_format, quality=quality)
+                else:
+                    if variant.mode == 'RGBA' and output_path.lower().endswith(('.jpg', '.jpeg')):
+                        variant = variant.convert('RGB')
+                    variant.save(output_path, quality=quality, optimize=True)
             return True
     except Exception as e:
         print(f"Error optimizing {os.path.basename(image_path)}: {e}", file=sys.stderr)
         return False
 
-def prepare_post_template(config):
-    """Prepares a temporary post template file with shared components."""
+_image_size_cache = {}
+
+def get_image_size(image_path):
+    """Returns the upright (width, height) of an image from its header, or None if unreadable."""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    cache_key = (image_path, stat.st_mtime_ns, stat.st_size)
+    build_report.count_cache('image_size', cache_key in _image_size_cache)
+    if cache_key not in _image_size_cache:
+        try:
+            with Image.open(image_path) as img:
+                width, height = img.size
+                # EXIF orientations 5-8 are rotated by 90 degrees
+                if img.getexif().get(0x0112) in (5, 6, 7, 8):
+                    width, height = height, width
+                _image_size_cache[cache_key] = (width, height)
+        except Exception:
+            _image_size_cache[cache_key] = None
+    return _image_size_cache[cache_key]
+
+def get_image_settings(config):
+    """Returns the responsive image settings from config, keeping only formats Pillow can encode."""
+    formats = []
+    for image_format in config.get('image_formats', DEFAULT_IMAGE_FORMATS):
+        if image_format in MODERN_IMAGE_FORMATS and features.check(image_format):
+            formats.append(image_format)
+    return {
+        'widths': sorted(set(config.get('image_widths', DEFAULT_IMAGE_WIDTHS))),
+        'formats': formats,
+        'quality': config.get('image_quality', DEFAULT_IMAGE_QUALITY),
+        'sizes': config.get('image_sizes', DEFAULT_IMAGE_SIZES),
+    }
+
+def fingerprint_name(filename, digest, suffix='', extension=None):
+    """Returns a content-addressed asset name such as `photo.3f2a9c1b0d4e-480.webp`."""
+    stem, source_extension = os.path.splitext(filename)
+    return f"{stem}.{digest[:FINGERPRINT_LENGTH]}{suffix}{extension or source_extension}"
+
+def plan_responsive_image(config, source_abs_path, assets_dir):
+    """Plans the derivatives of a local image and the markup that references them.
+
+    Returns a dict with the fallback `src`, the `srcset` in the source format,
+    one `sources` entry per modern format, the displayed `width`/`height`
+    and the `variants` to encode as (output_path, width, format) tuples. The
+    fallback is capped at the largest breakpoint. Every output name carries a
+    fingerprint of the source bytes and the encoding settings. Images that
+    could not be encoded before get a single plain variant.
+    """
+    settings = get_image_settings(config)
+    site_url = config.get('site_url', '/').rstrip('/')
+    filename = os.path.basename(source_abs_path)
+    size = get_image_size(source_abs_path)
+    source_hash = get_file_hash(source_abs_path)
+
+    digest = hashlib.sha256(source_hash.encode())
+    digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+    digest = digest.hexdigest()
+    fallback_name = fingerprint_name(filename, digest)
+    image = {'src': f"{site_url}/assets/{fallback_name}", 'srcset': '', 'sources': [], 'width': None, 'height': None}
+
+    # Sources Pillow failed to encode are published as a plain copy under the fallback name
+    plain = not size or not filename.lower().endswith(RESPONSIVE_IMAGE_EXTENSIONS) or not settings['widths']
+    if plain or source_hash in _fallback_image_hashes:
+        image['variants'] = ((os.path.join(assets_dir, fallback_name), None, None),)
+        if size:
+            image['width'], image['height'] = size
+        return image
+
+    source_width, source_height = size
+    fallback_width = min(source_width, settings['widths'][-1])
+    widths = [w for w in settings['widths'] if w < fallback_width] + [fallback_width]
+    image['width'] = fallback_width
+    image['height'] = max(1, round(source_height * fallback_width / source_width))
+
+    variants = [(os.path.join(assets_dir, fallback_name), fallback_width, None)]
+    srcset = [f"{image['src']} {fallback_width}w"]
+    for width in widths[:-1]:
+        variant_name = fingerprint_name(filename, digest, f"-{width}")
+        variants.append((os.path.join(assets_dir, variant_name), width, None))
+        srcset.insert(-1, f"{site_url}/assets/{variant_name} {width}w")
+    image['srcset'] = ', '.join(srcset)
+
+    for image_format in settings['formats']:
+        _, format_extension, mime_type = MODERN_IMAGE_FORMATS[image_format]
+        format_srcset = []
+        for width in widths:
+            variant_name = fingerprint_name(filename, digest, f"-{width}", format_extension)
+            variants.append((os.path.join(assets_dir, variant_name), width, image_format))
+            format_srcset.append(f"{site_url}/assets/{variant_name} {width}w")
+        image['sources'].append({'type': mime_type, 'srcset': ', '.join(format_srcset)})
+
+    image['variants'] = tuple(variants)
+    return image
+
+def render_picture_html(config, image, alt, css_class=None, eager=False):
+    """Renders a planned image as <picture> markup, or a plain <img> if it has no derivatives.
+
+    The intrinsic width and height reserve the image's space before it loads,
+    and images are lazy-loaded and decoded off the main thread. An `eager`
+    image (the first one on a page, likely the largest contentful paint) is
+    fetched with high priority instead.
+    """
+    sizes = get_image_settings(config)['sizes']
+    alt = html.escape(alt)
+    img_attributes = [f'src="{image["src"]}"']
+    if image['srcset']:
+        img_attributes.append(f'srcset="{image["srcset"]}" sizes="{sizes}"')
+    img_attributes.append(f'alt="{alt}"')
+    if image.get('width') and image.get('height'):
+        img_attributes.append(f'width="{image["width"]}" height="{image["height"]}"')
+    img_attributes.append('fetchpriority="high" decoding="async"' if eager else 'loading="lazy" decoding="async"')
+    if css_class:
+        img_attributes.append(f'class="{css_class}"')
+    img_html = f'<img {" ".join(img_attributes)}>'
+    if not image['sources']:
+        return img_html
+    sources_html = ''.join(
+        f'<source type="{source["type"]}" srcset="{source["srcset"]}" sizes="{sizes}">'
+        for source in image['sources']
+    )
+    return f'<picture>{sources_html}{img_html}</picture>'
+
+_file_hash_cache = {}
+
+# Hashes of image sources whose encoding failed; their copy is kept under the fallback name
+_fallback_image_hashes = set()
+
+def get_file_hash(path):
+    """Returns the content hash of a file, reusing the cached hash while its size and mtime are unchanged."""
+    stat = os.stat(path)
+    cache_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    build_report.count_cache('file_hash', cache_key in _file_hash_cache)
+    if cache_key not in _file_hash_cache:
+        with open(path, 'rb') as f:
+            _file_hash_cache[cache_key] = hash_bytes(f.read())
+        build_report.count_io(read=stat.st_size)
+    return _file_hash_cache[cache_key]
+
+def load_asset_manifest(config):
+    """Loads the asset manifest and seeds the file hash cache from it.
+
+    Seeding means sources whose size and mtime match the manifest are not read
+    again; after a fresh checkout they are re-hashed once, and identical bytes
+    map back to the same fingerprinted outputs, so nothing is re-encoded.
+    Sources marked as fallback are planned as a plain copy from then on.
+    """
+    output_dir = config.get('output_folder', 'public')
+    asset_manifest = load_json_file(os.path.join(output_dir, ASSET_MANIFEST_NAME), {})
+    for source_name, entry in asset_manifest.items():
+        cache_key = (os.path.abspath(source_name), entry.get('mtime_ns'), entry.get('size'))
+        _file_hash_cache.setdefault(cache_key, entry.get('hash'))
+        if entry.get('fallback'):
+            _fallback_image_hashes.add(entry.get('hash'))
+    return asset_manifest
+
+def process_asset(source_path, destination_path, kind, variants=(), quality=85):
+    """Optimizes an image into its variants or copies any other asset; returns (ok, message).
+
+    An image that cannot be encoded is copied to its fallback name. That only
+    counts as success when no other variant was planned; otherwise the page
+    points at derivatives that do not exist. Runs inside the asset worker
+    processes, so it reports through its return value instead of printing.
+    """
+    filename = os.path.basename(source_path)
+    if kind == 'image':
+        if encode_image_variants(source_path, variants, quality):
+            return True, f"Optimized {filename} into {len(variants)} file(s)"
+        try:
+            shutil.copy2(source_path, destination_path)
+        except Exception as e:
+            return False, f"Error copying file {source_path}: {e}"
+        if len(variants) > 1:
+            return False, f"Could not encode {filename}; copied it as a plain fallback"
+        return True, f"Falling back to simple copy for {filename}"
+    try:
+        shutil.copy2(source_path, destination_path)
+        return True, f"Copied {filename} to {destination_path}"
+    except Exception as e:
+        return False, f"Error copying file {source_path}: {e}"
+
+def measure_asset_job(source_path, destination_path, kind, variants=(), quality=85):
+    """Runs process_asset and returns (ok, message, stats) with its wall/CPU time and bytes.
+
+    Runs in a worker process, where process_time only covers this job.
+    """
+    started, started_cpu = time.perf_counter(), time.process_time()
+    ok, message = process_asset(source_path, destination_path, kind, variants, quality)
+    output_paths = [v[0] for v in variants] if variants else [destination_path]
+    stats = {
+        'wall_s': round(time.perf_counter() - started, 6),
+        'cpu_s': round(time.process_time() - started_cpu, 6),
+        'bytes_read': os.path.getsize(source_path),
+        'bytes_written': sum(os.path.getsize(p) for p in output_paths if os.path.exists(p)),
+    }
+    return ok, message, stats
+
+def run_asset_jobs(config, asset_jobs, workers=None):
+    """Processes the unique set of queued assets on a process pool.
+
+    Output names are content-addressed, so a job is skipped as soon as all of
+    its output files exist. The asset manifest is updated with the source hash
+    and output files of every queued asset. Returns the list of destinations
+    that failed.
+    """
+    output_dir = config.get('output_folder', 'public')
+    site_url = config.get('site_url', '/').rstrip('/')
+    asset_manifest = load_asset_manifest(config)
+    quality = get_image_settings(config)['quality']
+
+    stale_jobs = []
+    for destination_path, (source_path, kind, variants) in sorted(asset_jobs.items()):
+        output_paths = [v[0] for v in variants] if variants else [destination_path]
+        stat = os.stat(source_path)
+        asset_manifest[os.path.relpath(source_path)] = {
+            'hash': get_file_hash(source_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'url': f"{site_url}/assets/{os.path.basename(destination_path)}",
+            'files': sorted(os.path.basename(p) for p in output_paths),
+        }
+        if get_file_hash(source_path) in _fallback_image_hashes:
+            asset_manifest[os.path.relpath(source_path)]['fallback'] = True
+        up_to_date = all(os.path.exists(p) for p in output_paths)
+        build_report.count_cache('asset_outputs', up_to_date)
+        if not up_to_date:
+            stale_jobs.append((source_path, destination_path, kind, variants, quality))
+
+    print(f"   - {len(stale_jobs)} of {len(asset_jobs)} assets need processing.", file=sys.stderr)
+
+    failures = []
+    def record(done, job, ok, message, stats=None):
+        print(f"   - [{done}/{len(stale_jobs)}] {message}", file=sys.stderr)
+        if stats:
+            build_report.record_item('asset', os.path.relpath(job[0]), **stats)
+        if not ok:
+            failures.append(job[1])
+            source_name = os.path.relpath(job[0])
+            if job[2] == 'image' and os.path.exists(job[1]):
+                # Planned as a plain copy from now on, so the page stops pointing at missing variants
+                asset_manifest[source_name].update(fallback=True, files=[os.path.basename(job[1])])
+                _fallback_image_hashes.add(asset_manifest[source_name]['hash'])
+            else:
+                del asset_manifest[source_name]
+
+    if stale_jobs:
+        for destination_dir in {os.path.dirname(job[1]) for job in stale_jobs}:
+            os.makedirs(destination_dir, exist_ok=True)
+
+        workers = min(workers or os.cpu_count() or 1, len(stale_jobs))
+        if workers == 1:
+            for done, job in enumerate(stale_jobs, start=1):
+                record(done, job, *measure_asset_job(*job))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(measure_asset_job, *job): job for job in stale_jobs}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = (False, f"Error processing {job[0]}: {e}")
+                    record(done, job, *result)
+
+    # Sources that no longer exist are dropped from the manifest
+    for source_name in [name for name in asset_manifest if not os.path.exists(name)]:
+        del asset_manifest[source_name]
+    write_json_file(os.path.join(output_dir, ASSET_MANIFEST_NAME), asset_manifest)
+
+    if failures:
+        print(f"Uyarı: {len(failures)} varlık işlenemedi.", file=sys.stderr)
+    return failures
+
+def asset_job_files(asset_jobs):
+    """Returns the sorted output filenames produced by a set of asset jobs."""
+    files = set()
+    for destination_path, (source_path, kind, variants) in asset_jobs.items():
+        if variants:
+            files.update(os.path.basename(v[0]) for v in variants)
+        else:
+            files.add(os.path.basename(destination_path))
+    return sorted(files)
+
+def post_asset_files(asset_jobs, asset_sources):
+    """Returns every asset file a post page points to.
+
+    Besides the outputs of its jobs this includes /assets/ references whose
+    source is missing, so cleanup keeps files that are still linked.
+    """
+    files = set(asset_job_files(asset_jobs))
+    files.update(asset_file for asset_file in asset_sources.values() if asset_file)
+    return files
+
+def find_static_asset_refs(config):
+    """Returns the asset files referenced by templates and stylesheets in the output folder."""
+    output_dir = config.get('output_folder', 'public')
+    files = set()
+    for file_path in glob.glob(os.path.join('templates', '*.html')) + glob.glob(os.path.join(output_dir, '*.css')):
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            files.update(ASSET_URL_RE.findall(f.read()))
+    return files
+
+def update_asset_refs(config, page_refs):
+    """Updates the asset reference graph for the given pages.
+
+    `page_refs` maps an output page to the asset files it references; an empty
+    set removes the page. Reference counts are adjusted incrementally and every
+    file whose count drops to zero is recorded as `released`, so
+    cleanup_assets.py only has to look at those.
+    """
+    output_dir = config.get('output_folder', 'public')
+    refs_path = os.path.join(output_dir, ASSET_REFS_NAME)
+    graph = load_json_file(refs_path, {})
+    pages = graph.setdefault('pages', {})
+    counts = graph.setdefault('counts', {})
+    released = set(graph.get('released', []))
+
+    for page, files in page_refs.items():
+        old_files = set(pages.get(page, []))
+        new_files = set(files)
+        for asset in new_files - old_files:
+            counts[asset] = counts.get(asset, 0) + 1
+            released.discard(asset)
+        for asset in old_files - new_files:
+            counts[asset] = counts.get(asset, 1) - 1
+            if counts[asset] <= 0:
+                del counts[asset]
+                released.add(asset)
+        if new_files:
+            pages[page] = sorted(new_files)
+        else:
+            pages.pop(page, None)
+
+    graph['released'] = sorted(released)
+    write_json_file(refs_path, graph)
+
+def render_footer(config):
+    """Renders the shared footer for the current year."""
+    return load_template('templates/_footer.html').render({'current_year': str(datetime.now().year)})
+
+def build_post_template(config):
+    """Compiles the post template with the components shared by every post filled in."""
     try:
-        with open('templates/_footer.html', 'r', encoding='utf-8') as f: footer_content = f.read()
-        with open('templates/post.html', 'r', encoding='utf-8') as f: template_content = f.read()
+        template = load_template('templates/post.html')
+        footer_content = render_footer(config)
     except FileNotFoundError as e:
         print(f"Hata: Gerekli bir şablon dosyası bulunamadı: {e.filename}", file=sys.stderr)
         sys.exit(1)
 
-    nav_content = generate_nav_html(config)
-    current_year = str(datetime.now().year)
-
-    processed_template = template_content.replace('<!-- NAV_PLACEHOLDER -->', nav_content)
-    processed_template = processed_template.replace('<!-- FOOTER_PLACEHOLDER -->', footer_content.replace('__CURRENT_YEAR__', current_year))
-    processed_template = processed_template.replace('$site_title$', config.get("site_title", "Blog"))
-    processed_template = processed_template.replace('$site_description$', config.get("site_description", ""))
-    processed_template = processed_template.replace('$author$', config.get("author", ""))
+    return template.bind({
+        'nav': generate_nav_html(config),
+        'footer': footer_content,
+        'site_title': config.get("site_title", "Blog"),
+        'site_description': config.get("site_description", ""),
+        'author': config.get("author", ""),
+    })
 
+def prepare_post_template(config):
+    """Writes the post template with shared components to a temporary file for external pandoc runs."""
     temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8', suffix='.html')
-    temp_file.write(processed_template)
+    temp_file.write(build_post_template(config).source())
     temp_file.close()
     return temp_file.name
 
-def process_markdown_content(config, markdown_content, markdown_file_path):
-    """Processes markdown content to handle asset paths, links, and embeds."""
-    project_root = os.getcwd()
-    markdown_dir = os.path.dirname(markdown_file_path)
+def parse_front_matter(content):
+    """Returns the simple `key: value` fields of a post's front matter as a dict."""
+    front_matter_match = FRONT_MATTER_RE.search(content)
+    if not front_matter_match:
+        return {}
+    fields = {}
+    for key, value in FRONT_MATTER_FIELD_RE.findall(front_matter_match.group(1)):
+        fields[key] = value.strip().strip('"')
+    return fields
+
+def render_post_template(template, metadata, body, related_html=''):
+    """Fills a compiled post template with a post's metadata and body, the way pandoc's --template would."""
+    variables = {name: html.escape(value, quote=False) for name, value in metadata.items()}
+    variables['body'] = body
+    variables['related'] = related_html
+    return template.render(variables)
+
+def get_renderer(config):
+    """Returns the configured markdown renderer, exiting on an unknown name."""
+    renderer = config.get('renderer', DEFAULT_RENDERER)
+    if renderer not in RENDERERS:
+        print(f"Hata: Bilinmeyen renderer: {renderer} (seçenekler: {', '.join(RENDERERS)})", file=sys.stderr)
+        sys.exit(1)
+    return renderer
+
+def convert_markdown(config, markdown_content):
+    """Converts processed markdown into an HTML fragment with the configured renderer."""
+    if get_renderer(config) == 'markdown':
+        return convert_with_markdown(markdown_content)
+    return convert_with_pandoc(markdown_content)
+
+def convert_with_pandoc(markdown_content):
+    """Converts processed markdown into an HTML fragment using pandoc."""
+    result = subprocess.run(
+        ['pandoc', '--from', 'markdown+yaml_metadata_block', '--to', 'html'],
+        input=markdown_content, capture_output=True, text=True, encoding='utf-8', check=True
+    )
+    return result.stdout
+
+_markdown_converters = threading.local()
+
+def pandoc_identifier(text, used_ids):
+    """Derives a heading id the way pandoc's auto_identifiers extension does."""
+    text = html.unescape(HTML_TAG_RE.sub('', text)).lower()
+    identifier = ''.join(c for c in text if c.isalnum() or c in '_-.' or c.isspace())
+    identifier = re.sub(r'\s+', '-', identifier.strip())
+    # Everything up to the first letter is dropped
+    while identifier and not identifier[0].isalpha():
+        identifier = identifier[1:]
+    identifier = identifier or 'section'
+    unique, suffix = identifier, 0
+    while unique in used_ids:
+        suffix += 1
+        unique = f'{identifier}-{suffix}'
+    used_ids.add(unique)
+    return unique
+
+def convert_with_markdown(markdown_content):
+    """Converts processed markdown into an HTML fragment in-process with python-markdown.
+
+    Front matter is dropped, headings get pandoc-style ids and lone images
+    become captioned figures, so the output matches the pandoc renderer for
+    our content without starting a subprocess.
+    """
+    # Markdown instances are not thread-safe, so every render thread keeps its own
+    converter = getattr(_markdown_converters, 'converter', None)
+    if converter is None:
+        converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, extension_configs=MARKDOWN_EXTENSION_CONFIGS)
+        _markdown_converters.converter = converter
+    body = converter.reset().convert(FRONT_MATTER_RE.sub('', markdown_content, count=1))
+
+    used_ids = set()
+    body = HEADING_RE.sub(lambda m: f'<h{m.group(1)} id="{pandoc_identifier(m.group(2), used_ids)}">{m.group(2)}</h{m.group(1)}>', body)
+    body = MARKDOWN_IMG_RE.sub(r'<img src="\2" alt="\1"', body)
+    body = IMAGE_PARAGRAPH_RE.sub(
+        lambda m: f'<figure>\n<img src="{m.group(1)}" alt="{m.group(2)}" />\n<figcaption aria-hidden="true">{m.group(2)}</figcaption>\n</figure>',
+        body,
+    )
+    return body + '\n' if body else body
+
+def hash_asset_sources(source_paths):
+    """Returns source path -> content hash for the asset sources of a post, None for missing files.
+
+    Hashes come from get_file_hash, which the asset manifest seeds, so
+    sources whose size and mtime are unchanged are not read again.
+    """
+    return {
+        os.path.relpath(source_path): get_file_hash(source_path) if os.path.isfile(source_path) else None
+        for source_path in source_paths
+    }
+
+def post_is_current(previous, entry):
+    """Returns True if a post's manifest entry still matches its markdown and every asset source it references."""
+    if not previous or previous.get('hash') != entry['hash'] or previous.get('output') != entry['output']:
+        return False
+    asset_hashes = previous.get('assets', {})
+    return hash_asset_sources(asset_hashes) == asset_hashes
+
+def hash_bytes(data):
+    """Returns the hex SHA-256 digest of the given bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+def load_json_file(path, default):
+    """Loads a JSON state file, falling back to `default` if it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = f.read()
+        build_report.count_io(read=len(data))
+        return json.loads(data)
+    except FileNotFoundError:
+        return default
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Uyarı: {path} okunamadı, yok sayılıyor: {e}", file=sys.stderr)
+        return default
+
+def write_json_file(path, data):
+    """Writes a JSON state file atomically so an interrupted build never leaves it half-written."""
+    temp_path = f"{path}.tmp"
+    serialized = json.dumps(data, ensure_ascii=False, indent=1, sort_keys=True)
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(serialized)
+    os.replace(temp_path, path)
+    build_report.count_io(written=len(serialized))
+
+def compute_global_hash(config):
+    """Hashes every shared input of a page: templates, render config keys and the footer year."""
+    digest = hashlib.sha256()
+    digest.update(str(BUILD_MANIFEST_VERSION).encode())
+    for template_path in TEMPLATE_FILES:
+        try:
+            with open(template_path, 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b'missing:' + template_path.encode())
+    render_config = {key: config.get(key) for key in RENDER_CONFIG_KEYS}
+    digest.update(json.dumps(render_config, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    digest.update(str(datetime.now().year).encode())
+    return digest.hexdigest()
+
+def convert_post(config, md_file_path, content, content_hash):
+    """Converts a post's markdown to its HTML body without writing anything.
+
+    Returns the body, its post index entry, the asset jobs it queued and the
+    asset sources it references (source path -> emitted asset file).
+    """
+    asset_jobs = {}
+    asset_sources = {}
+    links = {}
+    images = []
+    build_report.count_io(read=len(content.encode('utf-8')), stage=False)
+    with build_report.span('rewrite'):
+        processed_content = process_markdown_content(config, content, md_file_path, asset_jobs, links, asset_sources, images)
+    with build_report.span('convert'):
+        body = convert_markdown(config, processed_content)
+    entry = build_post_entry(config, md_file_path, content, content_hash, body, links, images)
+    return body, entry, asset_jobs, asset_sources
+
+def write_post(config, post_template, md_file_path, content, body, related_html=''):
+    """Fills the post template with a converted body and writes the post's HTML file. Returns its path."""
     output_dir = config.get('output_folder', 'public')
+    output_path = os.path.join(output_dir, os.path.basename(md_file_path).replace('.md', '.html'))
+    final_html = render_post_template(post_template, parse_front_matter(content), body, related_html)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(final_html)
+    build_report.count_io(written=len(final_html.encode('utf-8')))
+    return output_path
+
+def render_post(config, post_template, md_file_path, content, content_hash, related_html=''):
+    """Renders a single post to its HTML file.
+
+    Returns the output path, its post index entry and the asset jobs it queued.
+    """
+    body, entry, asset_jobs, _ = convert_post(config, md_file_path, content, content_hash)
+    return write_post(config, post_template, md_file_path, content, body, related_html), entry, asset_jobs
+
+def post_signature(terms, document_frequency, post_count):
+    """Returns a post's most distinctive terms by tf-idf as an L2-normalized term -> weight dict.
+
+    Terms found in a single post or in more than RELATED_MAX_DOCUMENT_FREQUENCY
+    posts cannot make two posts related and are left out.
+    """
+    scored = []
+    for term, count in terms.items():
+        frequency = document_frequency.get(term, 0)
+        if 2 <= frequency <= RELATED_MAX_DOCUMENT_FREQUENCY and frequency < post_count:
+            scored.append((count * math.log(post_count / frequency), term))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    scored = scored[:RELATED_SIGNATURE_TERMS]
+    norm = math.sqrt(sum(weight * weight for weight, _ in scored))
+    return {term: round(weight / norm, 6) for weight, term in scored} if norm else {}
+
+def find_related_posts(post, postings, linked, limit):
+    """Scores other posts against one post and returns the slugs of the best `limit`.
+
+    `postings` maps signature terms to (slug, weight) pairs and `linked` maps a
+    slug to the slugs it links to or is linked from. The score is the cosine
+    similarity of the two signatures plus RELATED_LINK_WEIGHT for a link.
+    """
+    scores = {}
+    for term, weight in post['signature'].items():
+        for slug, other_weight in postings.get(term, ()):
+            scores[slug] = scores.get(slug, 0) + weight * other_weight
+    for slug in linked.get(post['slug'], ()):
+        scores[slug] = scores.get(slug, 0) + RELATED_LINK_WEIGHT
+    ranked = sorted((-score, slug) for slug, score in scores.items() if slug != post['slug'])
+    return [slug for _, slug in ranked[:limit]]
+
+def render_related_html(config, post_index, slug_index, slugs):
+    """Renders the related posts list injected into post.html, or '' when there is none."""
     site_url = config.get('site_url', '/')
+    items = []
+    for slug in slugs:
+        entry = post_index.get(slug_index.get(slug))
+        if entry:
+            post_link = os.path.join(site_url, slug + '.html')
+            items.append(f'<li><a href="{post_link}">{html.escape(entry["title"])}</a></li>')
+    return '<ul>\n' + '\n'.join(items) + '\n</ul>' if items else ''
 
-    def replace_path(match):
-        original_path = match.group(2) if match.group(2) else match.group(3)
-        if not original_path or original_path.startswith(('http://', 'https://', '//', 'mailto:', 'tel:')):
-            return match.group(0)
-        if os.path.isabs(original_path):
-            source_abs_path = os.path.join(project_root, original_path.lstrip('/'))
+def update_link_graph(config, post_index, rendered=(), force=False):
+    """Resolves internal links, reports broken ones and keeps related posts up to date.
+
+    The graph (links, backlinks, broken links and related posts per post) is
+    persisted next to the post index. Related posts are only recomputed for
+    posts that share a signature term or a link with an added, changed or
+    removed post. Returns (pages, broken): the related posts HTML of every
+    post in `rendered` and of every other post whose list changed, and the
+    number of broken links.
+    """
+    output_dir = config.get('output_folder', 'public')
+    graph_path = os.path.join(output_dir, LINK_GRAPH_NAME)
+    limit = config.get('related_posts', DEFAULT_RELATED_POSTS)
+    config_hash = hash_bytes(json.dumps([config.get('site_url', '/'), limit]).encode('utf-8'))
+
+    state = load_json_file(graph_path, {})
+    previous_posts = state.get('posts', {})
+    # Pages on disk hold these lists even when the graph itself is recomputed
+    previous_hashes = {md_file_path: post.get('related_hash') for md_file_path, post in previous_posts.items()}
+    if force or state.get('version') != LINK_GRAPH_VERSION or state.get('config_hash') != config_hash:
+        previous_posts = {}
+
+    # Slug -> post path; every link resolves with one lookup
+    slug_index = {entry['slug']: md_file_path for md_file_path, entry in post_index.items()}
+    posts = {}
+    changed = set()
+    for md_file_path, entry in post_index.items():
+        previous = previous_posts.get(md_file_path)
+        build_report.count_cache('link_graph', bool(previous) and previous['hash'] == entry['hash'])
+        if previous and previous['hash'] == entry['hash']:
+            posts[md_file_path] = previous
         else:
-            source_abs_path = os.path.abspath(os.path.join(markdown_dir, original_path))
-        
-        assets_dir = os.path.join(project_root, output_dir, 'assets')
-        os.makedirs(assets_dir, exist_ok=True)
-        filename = os.path.basename(source_abs_path)
-        destination_abs_path = os.path.join(assets_dir, filename)
-        
-        new_absolute_path = f"{site_url.rstrip('/')}/assets/{filename}"
+            changed.add(md_file_path)
+    removed = [md_file_path for md_file_path in previous_posts if md_file_path not in post_index]
+
+    if changed:
+        document_frequency = {}
+        for entry in post_index.values():
+            for term in entry.get('terms', {}):
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        for md_file_path in changed:
+            entry = post_index[md_file_path]
+            posts[md_file_path] = {
+                'hash': entry['hash'],
+                'slug': entry['slug'],
+                'signature': post_signature(entry.get('terms', {}), document_frequency, len(post_index)),
+                'links': entry.get('links', []),
+                'related': [],
+            }
+
+    # Posts whose score against an added, changed or removed post may differ
+    touched_slugs, touched_terms = set(), set()
+    for md_file_path in list(changed) + removed:
+        for post in (previous_posts.get(md_file_path), posts.get(md_file_path)):
+            if post:
+                touched_slugs.add(post['slug'])
+                touched_slugs.update(post['links'])
+                touched_terms.update(post['signature'])
+    affected = set(changed)
+    for md_file_path, post in posts.items():
+        if md_file_path not in affected and (
+            post['slug'] in touched_slugs
+            or touched_slugs.intersection(post['links'])
+            or touched_slugs.intersection(post['related'])
+            or touched_terms.intersection(post['signature'])
+        ):
+            affected.add(md_file_path)
+
+    backlinks = {}
+    broken = {}
+    for md_file_path, post in sorted(posts.items()):
+        for slug in post['links']:
+            if slug in slug_index:
+                backlinks.setdefault(slug, []).append(post['slug'])
+            elif slug != 'index':
+                broken.setdefault(md_file_path, []).append(slug)
+                print(f"Uyarı: {md_file_path} içindeki {slug}.md bağlantısı hiçbir yazıya gitmiyor.", file=sys.stderr)
+
+    if affected:
+        postings = {}
+        for post in posts.values():
+            for term, weight in post['signature'].items():
+                postings.setdefault(term, []).append((post['slug'], weight))
+        linked = {}
+        for post in posts.values():
+            for slug in post['links']:
+                if slug in slug_index:
+                    linked.setdefault(post['slug'], set()).add(slug)
+                    linked.setdefault(slug, set()).add(post['slug'])
+
+    pages = {}
+    for md_file_path in sorted(affected | set(rendered)):
+        post = posts.get(md_file_path)
+        if not post:
+            continue
+        if md_file_path in affected:
+            post['related'] = find_related_posts(post, postings, linked, limit)
+        related_html = render_related_html(config, post_index, slug_index, post['related'])
+        related_hash = hash_bytes(related_html.encode('utf-8'))
+        if md_file_path in rendered or previous_hashes.get(md_file_path) != related_hash:
+            pages[md_file_path] = related_html
+        post['related_hash'] = related_hash
+
+    write_json_file(graph_path, {
+        'version': LINK_GRAPH_VERSION,
+        'config_hash': config_hash,
+        'posts': posts,
+        'backlinks': backlinks,
+        'broken': broken,
+    })
+    broken_count = sum(len(slugs) for slugs in broken.values())
+    print(f"   - Link graph: related posts recomputed for {len(affected)} of {len(posts)} post(s), "
+          f"{len(pages)} page(s) to write, {broken_count} broken link(s).", file=sys.stderr)
+    return pages, broken_count
+
+def post_body_cache_path(config, md_file_path):
+    """Returns where the converted body of a post is cached."""
+    output_dir = config.get('output_folder', 'public')
+    return os.path.join(output_dir, POST_BODY_CACHE_DIR, os.path.basename(md_file_path).replace('.md', '.json'))
+
+def remove_post_body(config, md_file_path):
+    """Drops the cached body of a deleted post."""
+    try:
+        os.remove(post_body_cache_path(config, md_file_path))
+    except FileNotFoundError:
+        pass
+
+def write_related_page(config, post_template, md_file_path, related_html, converted=None):
+    """Writes one post with its related posts list around a just converted or cached body.
+
+    `converted` is the (content, body) of a post converted in this build, whose
+    body is cached for later related-only rewrites.
+    """
+    cache_path = post_body_cache_path(config, md_file_path)
+    if converted:
+        content, body = converted
+        write_json_file(cache_path, {'hash': hash_bytes(content.encode('utf-8')), 'body': body})
+    else:
+        with open(md_file_path, 'rb') as f:
+            raw_content = f.read()
+        content_hash = hash_bytes(raw_content)
+        content = raw_content.decode('utf-8')
+        cached = load_json_file(cache_path, {})
+        build_report.count_cache('post_body', cached.get('hash') == content_hash)
+        if cached.get('hash') == content_hash:
+            body = cached['body']
+        else:
+            # Its assets were processed when the post was last converted
+            body = convert_post(config, md_file_path, content, content_hash)[0]
+            write_json_file(cache_path, {'hash': content_hash, 'body': body})
+    return write_post(config, post_template, md_file_path, content, body, related_html)
+
+def write_related_pages(config, post_template, pages, converted, workers=None):
+    """Writes the posts update_link_graph returned with their related posts lists.
+
+    Posts in `converted` (path -> (content, body)) were just converted and their
+    bodies are cached; any other post only needs a new related posts list and is
+    wrapped around its cached body. It is converted again only when the cache is
+    missing or older than its markdown. Returns the paths of posts that could not
+    be written.
+    """
+    os.makedirs(os.path.join(config.get('output_folder', 'public'), POST_BODY_CACHE_DIR), exist_ok=True)
+    failures = []
+    workers = min(workers or config.get('build_workers') or os.cpu_count() or 1, max(1, len(pages)))
+    with post_executor(config, workers) as executor:
+        futures = {
+            submit_tracked(executor, 'page', md_file_path, write_related_page,
+                           config, post_template, md_file_path, related_html, converted.get(md_file_path)): md_file_path
+            for md_file_path, related_html in pages.items()
+        }
+        for future in as_completed(futures):
+            md_file_path = futures[future]
+            try:
+                tracked_result(executor, future)
+            except subprocess.CalledProcessError as e:
+                print(f"Hata: pandoc {md_file_path} dosyasını dönüştüremedi: {e.stderr.strip()}", file=sys.stderr)
+                failures.append(md_file_path)
+            except OSError as e:
+                print(f"Hata: {md_file_path} yazılamadı: {e}", file=sys.stderr)
+                failures.append(md_file_path)
+    return failures
+
+def build_all(config, workers=None, image_workers=None, force=False, report_path=None, profile_path=None, top=DEFAULT_REPORT_TOP):
+    """Renders changed posts and the homepage in a single process.
+
+    A manifest in the output folder records the inputs of every rendered page,
+    so only posts whose markdown, templates or render config changed are rebuilt.
+    With `report_path`, per-stage and per-item measurements are written there
+    as JSON; with `profile_path`, the build also runs under cProfile.
+    """
+    global build_report
+    output_dir = config.get('output_folder', 'public')
+    workers = workers or config.get('build_workers') or os.cpu_count() or 1
+    image_workers = image_workers or config.get('image_workers')
+    manifest_path = os.path.join(output_dir, BUILD_MANIFEST_NAME)
+    post_index_path = os.path.join(output_dir, POST_INDEX_NAME)
+
+    build_report = BuildReport(profile=bool(profile_path))
+    main_profiler = None
+    if profile_path:
+        main_profiler = cProfile.Profile()
+        build_report.profiles.append(main_profiler)
+        main_profiler.enable()
+
+    with build_report.stage('scan'):
+        os.makedirs(os.path.join(output_dir, 'assets'), exist_ok=True)
+        load_asset_manifest(config)
+
+        global_hash = compute_global_hash(config)
+        manifest = load_json_file(manifest_path, {})
+        previous_posts = manifest.get('posts', {})
+        # A template or config change re-renders everything, but the previous post
+        # list is kept so outputs of deleted posts are still removed
+        rebuild_all = force or manifest.get('global_hash') != global_hash
+        manifest = {'global_hash': global_hash, 'posts': {}}
+        previous_index = load_json_file(post_index_path, {})
+        post_index = {}
+        # Posts whose index entry was taken over from the previous build
+        reused_index = set()
 
-        if match.group(2) and filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')):
-            if os.path.exists(source_abs_path):
-                if not os.path.exists(destination_abs_path) or os.path.getmtime(source_abs_path) > os.path.getmtime(destination_abs_path):
-                    if not optimize_image(source_abs_path, destination_abs_path):
-                        print(f"Falling back to simple copy for {filename}", file=sys.stderr)
-                        shutil.copy2(source_abs_path, destination_abs_path)
+        post_files = list_post_files(config)
+
+        current_posts = {}
+        pending = {}
+        # Undecodable posts; their previous page is kept and they are retried next build
+        skipped = set()
+        for md_file_path in post_files:
+            with open(md_file_path, 'rb') as f:
+                raw_content = f.read()
+            build_report.count_io(read=len(raw_content))
+            content_hash = hash_bytes(raw_content)
+            output_name = os.path.basename(md_file_path).replace('.md', '.html')
+            entry = {'hash': content_hash, 'output': output_name}
+            previous = previous_posts.get(md_file_path)
+            up_to_date = not rebuild_all and post_is_current(previous, entry) and os.path.exists(os.path.join(output_dir, output_name))
+            build_report.count_cache('build_manifest', up_to_date)
+            if up_to_date:
+                current_posts[md_file_path] = previous
+                if previous_index.get(md_file_path, {}).get('hash') == content_hash:
+                    post_index[md_file_path] = previous_index[md_file_path]
+                    reused_index.add(md_file_path)
             else:
-                print(f"Warning: Source image file not found: {source_abs_path}", file=sys.stderr)
-        elif os.path.exists(source_abs_path):
-            if not os.path.exists(destination_abs_path) or os.path.getmtime(source_abs_path) > os.path.getmtime(destination_abs_path):
                 try:
-                    shutil.copy2(source_abs_path, destination_abs_path)
-                except Exception as e:
-                    print(f"Error copying file {source_abs_path}: {e}", file=sys.stderr)
-                    return match.group(0)
-        elif not os.path.exists(source_abs_path):
-            print(f"Warning: Source file not found: {source_abs_path}", file=sys.stderr)
-            return match.group(0)
-        
-        if match.group(2):
-            alt_text_match = ALT_TEXT_RE.search(match.group(0))
-            alt_text = alt_text_match.group(1) if alt_text_match else ''
-            return f'![{alt_text}]({new_absolute_path})'
-        elif match.group(3):
-            return match.group(0).replace(original_path, new_absolute_path)
-        return match.group(0)
+                    pending[md_file_path] = (entry, raw_content.decode('utf-8'))
+                except UnicodeDecodeError as e:
+                    print(f"Uyarı: {md_file_path} UTF-8 değil, atlanıyor: {e}", file=sys.stderr)
+                    skipped.add(md_file_path)
+
+        # Remove pages whose source markdown no longer exists
+        page_refs = {STATIC_REFS_PAGE: find_static_asset_refs(config)}
+        for md_file_path, entry in previous_posts.items():
+            if md_file_path not in current_posts and md_file_path not in pending and md_file_path not in skipped:
+                stale_output = os.path.join(output_dir, entry['output'])
+                page_refs[entry['output']] = set()
+                remove_post_body(config, md_file_path)
+                if os.path.exists(stale_output):
+                    os.remove(stale_output)
+                    print(f"   - Removed {entry['output']} (source deleted)", file=sys.stderr)
+
+    print(f"   - {len(pending)} of {len(post_files)} posts need rendering.", file=sys.stderr)
+
+    failures = []
+    asset_jobs = {}
+    # Asset jobs of each converted post, to find the posts a failed asset belongs to
+    post_jobs = {}
+    # Converted bodies are written once the link graph has their related posts
+    converted = {}
+
+    def accept(md_file_path, result):
+        body, post_index[md_file_path], post_assets, asset_sources = result
+        entry, content = pending[md_file_path]
+        # Editing a referenced image re-renders the post, so its fingerprinted URLs stay current
+        entry['assets'] = hash_asset_sources(asset_sources)
+        converted[md_file_path] = (content, body)
+        post_jobs[md_file_path] = post_assets
+        asset_jobs.update(post_assets)
+        page_refs[entry['output']] = post_asset_files(post_assets, asset_sources)
+        current_posts[md_file_path] = entry
+
+    with build_report.stage('render'):
+        if pending:
+            with post_executor(config, min(workers, len(pending))) as executor:
+                futures = {
+                    submit_tracked(executor, 'post', md_file_path, convert_post, config, md_file_path, content, entry['hash']): md_file_path
+                    for md_file_path, (entry, content) in pending.items()
+                }
+                for future in as_completed(futures):
+                    md_file_path = futures[future]
+                    try:
+                        accept(md_file_path, tracked_result(executor, future))
+                        print(f"   - Compiled {os.path.basename(md_file_path)} -> {pending[md_file_path][0]['output']}", file=sys.stderr)
+                    except subprocess.CalledProcessError as e:
+                        print(f"Hata: pandoc {md_file_path} dosyasını dönüştüremedi: {e.stderr.strip()}", file=sys.stderr)
+                        failures.append(md_file_path)
+                    except OSError as e:
+                        print(f"Hata: {md_file_path} işlenemedi: {e}", file=sys.stderr)
+                        failures.append(md_file_path)
+
+    with build_report.stage('assets'):
+        failed_assets = set(run_asset_jobs(config, asset_jobs, image_workers)) if asset_jobs else set()
+        # Images that could not be encoded are planned as plain copies now, so their
+        # posts are converted once more; posts still missing assets are left out of
+        # the manifest and converted again by the next build
+        for md_file_path in sorted(p for p, jobs in post_jobs.items() if failed_assets.intersection(jobs)):
+            entry, content = pending[md_file_path]
+            try:
+                accept(md_file_path, convert_post(config, md_file_path, content, entry['hash']))
+                complete = not run_asset_jobs(config, post_jobs[md_file_path], image_workers)
+            except (subprocess.CalledProcessError, OSError):
+                complete = False
+            if not complete:
+                current_posts.pop(md_file_path, None)
+                print(f"Uyarı: {md_file_path} için bazı varlıklar üretilemedi; yazı sonraki derlemede yeniden işlenecek.", file=sys.stderr)
+        update_asset_refs(config, page_refs)
+        write_embed_client(config)
+
+    with build_report.stage('index'):
+        # Posts skipped by the manifest but missing from the index are indexed from their markdown
+        for md_file_path in current_posts:
+            build_report.count_cache('post_index', md_file_path in reused_index)
+            if md_file_path not in post_index:
+                post_index[md_file_path] = index_post(config, md_file_path)
+        write_json_file(post_index_path, post_index)
+
+    with build_report.stage('links'):
+        pages, broken_links = update_link_graph(config, post_index, converted, force=rebuild_all)
+        if pages:
+            failed_pages = write_related_pages(config, build_post_template(config), pages, converted, workers)
+            for md_file_path in failed_pages:
+                current_posts.pop(md_file_path, None)
+            failures.extend(failed_pages)
+        # Written after the pages, so posts an interrupted build did not write are rendered again
+        manifest['posts'] = current_posts
+        write_json_file(manifest_path, manifest)
+
+    with build_report.stage('homepage'):
+        generate_homepage(config, post_index)
+    with build_report.stage('search'):
+        update_search_index(config, post_index)
+    with build_report.stage('feeds'):
+        generate_feeds(config, post_index)
+    with build_report.stage('compress'):
+        compress_outputs(config)
+
+    if main_profiler:
+        main_profiler.disable()
+    if report_path:
+        build_report.write(report_path, profile_path, top)
+
+    if failures:
+        print(f"Hata: {len(failures)} yazı derlenemedi.", file=sys.stderr)
+        sys.exit(1)
+    if broken_links and config.get('strict_links'):
+        print(f"Hata: {broken_links} kırık iç bağlantı bulundu (strict_links açık).", file=sys.stderr)
+        sys.exit(1)
+
+def compress_outputs(config):
+    """Writes .gz (and .br when the brotli module is installed) sidecars for text outputs.
+
+    A sidecar is only rewritten when it is older than its source, so unchanged
+    pages cost one stat each. Sidecars of deleted outputs are removed.
+    """
+    output_dir = config.get('output_folder', 'public')
+    encoders = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli:
+        encoders.append(('.br', lambda data: brotli.compress(data, quality=11)))
+
+    written = 0
+    for root, dirs, files in os.walk(output_dir):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for filename in files:
+            path = os.path.join(root, filename)
+            if filename.endswith(('.gz', '.br')) and filename[:-3].endswith(COMPRESSIBLE_EXTENSIONS):
+                if not os.path.exists(path[:-3]):
+                    os.remove(path)
+                continue
+            if filename.startswith('.') or not filename.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            stat = os.stat(path)
+            if stat.st_size < MIN_COMPRESS_SIZE:
+                continue
+            data = None
+            for suffix, encode in encoders:
+                sidecar_path = path + suffix
+                up_to_date = os.path.exists(sidecar_path) and os.path.getmtime(sidecar_path) >= stat.st_mtime
+                build_report.count_cache('sidecars', up_to_date)
+                if up_to_date:
+                    continue
+                if data is None:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    build_report.count_io(read=len(data))
+                encoded = encode(data)
+                with open(sidecar_path, 'wb') as f:
+                    f.write(encoded)
+                build_report.count_io(written=len(encoded))
+                written += 1
+    print(f"   - Wrote {written} precompressed sidecar(s).", file=sys.stderr)
+
+def resolve_asset_source(markdown_file_path, original_path):
+    """Resolves an asset path referenced from a markdown file to an absolute source path."""
+    if os.path.isabs(original_path):
+        return os.path.join(os.getcwd(), original_path.lstrip('/'))
+    return os.path.abspath(os.path.join(os.path.dirname(markdown_file_path), original_path))
+
+class RewriteContext:
+    """Per-document state shared by the rewriters during one process_markdown_content pass."""
+
+    def __init__(self, config, markdown_file_path, asset_jobs, links=None, asset_sources=None, images=None):
+        self.config = config
+        self.markdown_file_path = markdown_file_path
+        self.asset_jobs = asset_jobs
+        self.links = links
+        self.asset_sources = asset_sources
+        self.images = images
+        self.project_root = os.getcwd()
+        self.output_dir = config.get('output_folder', 'public')
+        self.site_url = config.get('site_url', '/')
+        # Snippets appended once after the document, e.g. third-party embed scripts
+        self.appendix = {}
+        # The first image is likely above the fold, so it is not lazy-loaded
+        self.first_image = True
 
-    processed_content = ASSET_RE.sub(replace_path, markdown_content)
+# Registered rewriters in priority order: (name, compiled pattern, handler)
+REWRITERS = []
 
-    def replace_md_link(match):
-        original_link_text = match.group(1)
-        md_path = match.group(2)
-        html_filename = os.path.basename(md_path).replace('.md', '.html')
-        
-        absolute_html_path = f"{site_url.rstrip('/')}/{html_filename}"
-        return original_link_text.replace(md_path, absolute_html_path)
+# Regions copied verbatim: leading front matter, fenced code blocks and inline code spans.
+# As in CommonMark, the info string of a backtick fence cannot contain backticks, so a line
+# such as "```js``` is neat" is inline code and not an unclosed fence.
+VERBATIM_PATTERNS = [
+    r'\A---\n.*?\n---\n',
+    r'^[ ]{0,3}(?P<fence>`{3,}(?![^\n]*`)|~{3,})[^\n]*\n(?:[^\n]*\n)*?[ ]{0,3}(?P=fence)[`~]*[ \t]*(?=\n|\Z)',
+    r'^[ ]{0,3}(?:`{3,}(?![^\n]*`)|~{3,})[^\n]*(?:\n[^\n]*)*\Z',
+    r'(?P<ticks>`+)(?:[^`\n]|\n(?![ \t]*\n)|(?!(?P=ticks))`+)+?(?P=ticks)(?!`)',
+]
 
-    processed_content = MD_LINK_RE.sub(replace_md_link, processed_content)
+_rewrite_scanner = None
+
+def register_rewriter(name, pattern):
+    """Registers `handler(match, context)` to replace every match of `pattern` outside code.
+
+    Rewriters are tried in registration order at each position, so earlier
+    registrations win when patterns overlap. The pattern must not use named groups.
+    """
+    def decorator(handler):
+        global _rewrite_scanner
+        REWRITERS.append((name, pattern, handler))
+        _rewrite_scanner = None
+        return handler
+    return decorator
+
+def get_rewrite_scanner():
+    """Compiles all verbatim regions and rewriter patterns into one alternation."""
+    global _rewrite_scanner
+    if _rewrite_scanner is None:
+        alternatives = [f'(?P<_verbatim{i}>(?s:{pattern}))' for i, pattern in enumerate(VERBATIM_PATTERNS)]
+        for i, (name, pattern, handler) in enumerate(REWRITERS):
+            flags = ''.join(flag for flag, value in (('i', re.IGNORECASE), ('s', re.DOTALL)) if pattern.flags & value)
+            scoped = f'(?{flags}:{pattern.pattern})' if flags else f'(?:{pattern.pattern})'
+            alternatives.append(f'(?P<_rewriter{i}>{scoped})')
+        _rewrite_scanner = re.compile('|'.join(alternatives), re.MULTILINE)
+    return _rewrite_scanner
+
+@register_rewriter('asset', ASSET_RE)
+def rewrite_asset(match, context):
+    """Queues a local image/video for the asset pipeline and points the reference at its output."""
+    config = context.config
+    site_url = context.site_url
+    original_path = match.group(2) if match.group(2) else match.group(3)
+    if not original_path or original_path.startswith(('http://', 'https://', '//', 'mailto:', 'tel:')):
+        if match.group(2) and original_path.startswith(('http://', 'https://')) and context.images is not None:
+            context.images.append((original_path, None))
+        return match.group(0)
+    source_abs_path = resolve_asset_source(context.markdown_file_path, original_path)
     
-    processed_content = YOUTUBE_URL_RE.sub(
-        r'<div class="video-container"><iframe src="https://www.youtube.com/embed/\1" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" allowfullscreen></iframe></div>',
-        processed_content
-    )
+    assets_dir = os.path.join(context.project_root, context.output_dir, 'assets')
+    filename = os.path.basename(source_abs_path)
+    kind = 'image' if match.group(2) and filename.lower().endswith(IMAGE_EXTENSIONS) else 'copy'
+
+    image = None
+    if not os.path.exists(source_abs_path):
+        if kind == 'image':
+            print(f"Warning: Source image file not found: {source_abs_path}", file=sys.stderr)
+        else:
+            print(f"Warning: Source file not found: {source_abs_path}", file=sys.stderr)
+            if context.asset_sources is not None:
+                context.asset_sources[source_abs_path] = None
+            return match.group(0)
+        new_absolute_path = f"{site_url.rstrip('/')}/assets/{filename}"
+    else:
+        if kind == 'image':
+            image = plan_responsive_image(config, source_abs_path, assets_dir)
+            destination_abs_path = image['variants'][0][0]
+        else:
+            destination_abs_path = os.path.join(assets_dir, fingerprint_name(filename, get_file_hash(source_abs_path)))
+        new_absolute_path = f"{site_url.rstrip('/')}/assets/{os.path.basename(destination_abs_path)}"
+        job = (source_abs_path, kind, image['variants'] if image else ())
+        if context.asset_jobs is not None:
+            context.asset_jobs.setdefault(destination_abs_path, job)
+        elif run_asset_jobs(config, {destination_abs_path: job}, workers=1):
+            return match.group(0)
+    if context.asset_sources is not None:
+        context.asset_sources[source_abs_path] = os.path.basename(new_absolute_path)
+    if kind == 'image' and context.images is not None:
+        context.images.append((new_absolute_path, image))
+    
+    if match.group(2):
+        alt_text_match = ALT_TEXT_RE.search(match.group(0))
+        alt_text = alt_text_match.group(1) if alt_text_match else ''
+        eager, context.first_image = context.first_image, False
+        if image:
+            return render_picture_html(config, image, alt_text, eager=eager)
+        return f'![{alt_text}]({new_absolute_path})'
+    elif match.group(3):
+        return match.group(0).replace(original_path, new_absolute_path)
+    return match.group(0)
+
+@register_rewriter('md_link', MD_LINK_RE)
+def rewrite_md_link(match, context):
+    """Points links to other markdown files at their generated HTML pages."""
+    original_link_text = match.group(1)
+    md_path = match.group(2)
+    html_filename = os.path.basename(md_path).replace('.md', '.html')
+    if context.links is not None:
+        context.links[html_filename[:-len('.html')]] = md_path
     
-    twitter_embed_found = False
-    def twitter_replacer(match):
-        nonlocal twitter_embed_found
-        twitter_embed_found = True
-        tweet_id = match.group(1)
-        return f'<blockquote class="twitter-tweet"><a href="https://twitter.com/user/status/{tweet_id}"></a></blockquote>'
-
-    processed_content = TWITTER_URL_RE.sub(twitter_replacer, processed_content)
-    if twitter_embed_found:
-        processed_content += '\n<script async src="https://platform.twitter.com/widgets.js" charset="utf-8"></script>'
-        
-    return processed_content
+    absolute_html_path = f"{context.site_url.rstrip('/')}/{html_filename}"
+    return original_link_text.replace(md_path, absolute_html_path)
+
+def use_embed_facades(context):
+    """Returns True if embeds become click-to-load facades, and queues embeds.js for the document."""
+    if not context.config.get('embed_facades', DEFAULT_EMBED_FACADES):
+        return False
+    context.appendix['embeds'] = f'<script src="{context.site_url.rstrip("/")}/{EMBED_CLIENT_NAME}" defer></script>'
+    return True
+
+@register_rewriter('youtube', YOUTUBE_URL_RE)
+def rewrite_youtube(match, context):
+    """Embeds YouTube videos, as a play button that loads the player on click in facade mode."""
+    video_id = match.group(1)
+    if use_embed_facades(context):
+        return (
+            f'<div class="video-container embed-facade" data-embed="youtube" data-id="{video_id}">'
+            f'<a href="https://www.youtube.com/watch?v={video_id}" class="embed-facade-button" data-embed-load>'
+            'YouTube videosunu oynat</a></div>'
+        )
+    return f'<div class="video-container"><iframe src="https://www.youtube.com/embed/{video_id}" frameborder="0" allow="{YOUTUBE_IFRAME_ALLOW}" allowfullscreen></iframe></div>'
+
+@register_rewriter('twitter', TWITTER_URL_RE)
+def rewrite_twitter(match, context):
+    """Embeds tweets; in facade mode the Twitter widget script is only loaded when one is clicked."""
+    tweet_url = f'https://twitter.com/user/status/{match.group(1)}'
+    if use_embed_facades(context):
+        return (
+            '<div class="tweet-container embed-facade" data-embed="twitter">'
+            f'<blockquote class="twitter-tweet"><a href="{tweet_url}">{tweet_url}</a></blockquote>'
+            '<button type="button" class="embed-facade-button secondary" data-embed-load>Gönderiyi yükle</button></div>'
+        )
+    context.appendix['twitter'] = '<script async src="https://platform.twitter.com/widgets.js" charset="utf-8"></script>'
+    return f'<blockquote class="twitter-tweet"><a href="{tweet_url}"></a></blockquote>'
+
+def process_markdown_content(config, markdown_content, markdown_file_path, asset_jobs=None, links=None, asset_sources=None, images=None):
+    """Processes markdown content to handle asset paths, links, and embeds.
+
+    The document is scanned once: front matter, fenced code blocks and inline
+    code spans are copied verbatim, and every other match is dispatched to the
+    registered rewriter, writing into a single output buffer.
+
+    When an `asset_jobs` dict is given, assets are only recorded in it
+    (destination -> (source, kind, variants)) for run_asset_jobs to process later;
+    otherwise they are copied and optimized immediately. When a `links` dict is
+    given, every internal link is recorded in it as target slug -> link path.
+    When an `asset_sources` dict is given, every local asset source is recorded
+    in it as source path -> the asset file the page points to (None if the
+    reference was left unchanged), including sources that do not exist.
+    When an `images` list is given, every image outside code is appended to it
+    in document order as (URL the page uses, planned image or None).
+    """
+    context = RewriteContext(config, markdown_file_path, asset_jobs, links, asset_sources, images)
+    scanner = get_rewrite_scanner()
+    output = []
+    position = 0
+    for match in scanner.finditer(markdown_content):
+        group_name = match.lastgroup
+        if not group_name.startswith('_rewriter'):
+            continue
+        name, pattern, handler = REWRITERS[int(group_name[len('_rewriter'):])]
+        output.append(markdown_content[position:match.start()])
+        output.append(handler(pattern.match(markdown_content, match.start()), context))
+        position = match.end()
+    output.append(markdown_content[position:])
+
+    for snippet in context.appendix.values():
+        output.append('\n' + snippet)
+    return ''.join(output)
 
 def main():
     parser = argparse.ArgumentParser(description="Process markdown files for PanBlog.")
     parser.add_argument('input_file', nargs='?', default=None, help="The path to the markdown file to process. Reads from stdin if not provided.")
     parser.add_argument('--generate-homepage', action='store_true', help="Generate the homepage.")
     parser.add_argument('--prepare-post-template', action='store_true', help="Prepare the post template and print the path.")
+    parser.add_argument('--build-all', action='store_true', help="Render every post and the homepage in a single process.")
+    parser.add_argument('--force', action='store_true', help="Ignore the build manifest and re-render every post.")
+    parser.add_argument('--workers', type=int, help="Number of parallel render workers for --build-all (default: build_workers from config.json or CPU count).")
+    parser.add_argument('--image-workers', type=int, help="Number of parallel image optimization processes for --build-all (default: image_workers from config.json or CPU count).")
     parser.add_argument('--site-url', help="Override the site_url from config.json.")
+    parser.add_argument('--strict-links', action='store_true', help="With --build-all, fail the build when an internal link points to no post (default: strict_links from config.json).")
+    parser.add_argument('--renderer', choices=RENDERERS, help=f"Markdown renderer for posts (default: renderer from config.json or {DEFAULT_RENDERER}).")
+    parser.add_argument('--report', nargs='?', const='', metavar='PATH', help=f"With --build-all, write a JSON build report (default: {BUILD_REPORT_NAME} in the output folder) and print the slowest items.")
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_PROFILE_PATH, metavar='PATH', help=f"With --build-all, run under cProfile and dump the merged data (default: {DEFAULT_PROFILE_PATH}); implies --report.")
+    parser.add_argument('--top', type=int, default=DEFAULT_REPORT_TOP, help=f"Number of slowest posts/assets printed by --report (default: {DEFAULT_REPORT_TOP}).")
 
     args = parser.parse_args()
     config = load_config()
 
     if args.site_url:
         config['site_url'] = args.site_url
+    if args.renderer:
+        config['renderer'] = args.renderer
+    if args.strict_links:
+        config['strict_links'] = True
 
-    if args.generate_homepage:
+    if args.build_all:
+        report_path = args.report
+        if report_path == '' or (report_path is None and args.profile):
+            report_path = os.path.join(config.get('output_folder', 'public'), BUILD_REPORT_NAME)
+        build_all(config, workers=args.workers, image_workers=args.image_workers, force=args.force,
+                  report_path=report_path, profile_path=args.profile, top=args.top)
+    elif args.generate_homepage:
         generate_homepage(config)
     elif args.prepare_post_template:
         temp_file_path = prepare_post_template(config)
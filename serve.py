@@ -0,0 +1,246 @@
+import os
+import re
+import sys
+import json
+import argparse
+import mimetypes
+import posixpath
+import urllib.parse
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# --- Server Settings ---
+
+# Per-path Cache-Control rules, first match wins. Fingerprinted assets
+# (name.<12 hex digits>[-width].ext) never change, so they are cached forever.
+CACHE_CONTROL_RULES = [
+    (re.compile(r'^/assets/.+\.[0-9a-f]{12}(-\d+)?\.[^/]+$'), 'public, max-age=31536000, immutable'),
+    (re.compile(r'\.html$'), 'no-cache'),
+    # The search index is rewritten in place, so clients revalidate it
+    (re.compile(r'^/(search/|search\.js$)'), 'no-cache'),
+    (re.compile(r'.*'), 'public, max-age=3600'),
+]
+
+# Precompressed sidecars in order of preference: (Content-Encoding, file suffix)
+SIDECAR_ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Matches a single-range Range header: bytes=start-end, bytes=start- or bytes=-suffix
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def cache_control_for(url_path):
+    """Returns the Cache-Control value of the first rule matching the URL path."""
+    for pattern, value in CACHE_CONTROL_RULES:
+        if pattern.search(url_path):
+            return value
+    return 'no-cache'
+
+
+def accepted_encodings(header):
+    """Parses Accept-Encoding into the set of codings with a non-zero quality."""
+    encodings = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        quality = params.strip()
+        if quality.startswith('q=') and quality[2:].strip() in ('0', '0.0', '0.00', '0.000'):
+            continue
+        encodings.add(coding.strip().lower())
+    return encodings
+
+
+def make_etag(stat, encoding):
+    """Builds a strong ETag from the served file's mtime, size and content coding."""
+    etag = f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+    if encoding:
+        etag += f'-{encoding}'
+    return f'"{etag}"'
+
+
+class StaticFileHandler(BaseHTTPRequestHandler):
+    """Serves the output folder with precompressed sidecars, conditional and range requests."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'PanBlog'
+    # Headers and the sendfile body go out as separate writes; without this,
+    # Nagle's algorithm and delayed ACKs add ~40 ms to every keep-alive request
+    disable_nagle_algorithm = True
+    root = 'public'
+    quiet = False
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def resolve_path(self):
+        """Maps the request URL to a file in the root, refusing traversal and dotfiles."""
+        url_path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        url_path = posixpath.normpath(url_path)
+        if url_path.endswith('/') or url_path == '.':
+            url_path = url_path.rstrip('/') + '/index.html'
+        parts = [p for p in url_path.split('/') if p]
+        if any(p.startswith('.') for p in parts):
+            return url_path, None
+        file_path = os.path.join(self.root, *parts)
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, 'index.html')
+            url_path = url_path.rstrip('/') + '/index.html'
+        return url_path, file_path
+
+    def select_variant(self, file_path, stat):
+        """Picks the best precompressed sidecar the client accepts, if it is up to date."""
+        encodings = accepted_encodings(self.headers.get('Accept-Encoding'))
+        for encoding, suffix in SIDECAR_ENCODINGS:
+            if encoding not in encodings:
+                continue
+            try:
+                sidecar_stat = os.stat(file_path + suffix)
+            except OSError:
+                continue
+            if sidecar_stat.st_mtime_ns >= stat.st_mtime_ns:
+                return file_path + suffix, sidecar_stat, encoding
+        return file_path, stat, None
+
+    def parse_range(self, size):
+        """Returns (start, end) for a satisfiable single range, None for no range, or 'invalid'."""
+        header = self.headers.get('Range')
+        if not header:
+            return None
+        match = RANGE_RE.match(header.strip())
+        if not match or match.group(1) == match.group(2) == '':
+            return None
+        if match.group(1) == '':
+            length = int(match.group(2))
+            if length == 0:
+                return 'invalid'
+            return max(0, size - length), size - 1
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else size - 1
+        if start >= size or end < start:
+            return 'invalid'
+        return start, min(end, size - 1)
+
+    def serve(self, send_body):
+        url_path, file_path = self.resolve_path()
+        try:
+            stat = os.stat(file_path) if file_path else None
+        except OSError:
+            stat = None
+        if not stat or not os.path.isfile(file_path):
+            self.send_error(404, "File not found")
+            return
+
+        content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json', 'image/svg+xml'):
+            content_type += '; charset=utf-8'
+        served_path, served_stat, encoding = self.select_variant(file_path, stat)
+        etag = make_etag(served_stat, encoding)
+
+        common_headers = [
+            ('ETag', etag),
+            ('Last-Modified', formatdate(stat.st_mtime, usegmt=True)),
+            ('Cache-Control', cache_control_for(url_path)),
+            ('Vary', 'Accept-Encoding'),
+        ]
+
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in [t.strip() for t in if_none_match.split(',')]):
+            self.send_response(304)
+            for name, value in common_headers:
+                self.send_header(name, value)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        size = served_stat.st_size
+        byte_range = self.parse_range(size) if encoding is None else None
+        if byte_range == 'invalid':
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        offset, count = 0, size
+        if byte_range:
+            offset, end = byte_range
+            count = end - offset + 1
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {offset}-{end}/{size}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(count))
+        # Ranges are only honoured on the identity file, not on precompressed sidecars
+        self.send_header('Accept-Ranges', 'none' if encoding else 'bytes')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for name, value in common_headers:
+            self.send_header(name, value)
+        self.end_headers()
+
+        if not send_body or count == 0:
+            return
+        self.wfile.flush()
+        with open(served_path, 'rb') as f:
+            try:
+                # socket.sendfile uses os.sendfile (zero-copy) where the platform supports it
+                self.connection.sendfile(f, offset, count)
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True
+
+
+class StaticFileServer(ThreadingHTTPServer):
+    """Thread-per-connection server with a listen backlog sized for bursts of new connections."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_server(root, host, port, quiet=False):
+    """Creates a threaded server for the given output folder."""
+    handler = type('PanBlogHandler', (StaticFileHandler,), {'root': root, 'quiet': quiet})
+    return StaticFileServer((host, port), handler)
+
+
+def load_output_folder(config_path='config.json'):
+    """Reads output_folder from config.json, defaulting to 'public'."""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('output_folder', 'public')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return 'public'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the PanBlog output folder for production traffic.")
+    parser.add_argument('--root', help="Folder to serve (default: output_folder from config.json).")
+    parser.add_argument('--host', default='', help="Address to bind (default: all interfaces).")
+    parser.add_argument('--port', type=int, default=8000, help="Port to listen on (default: 8000).")
+    parser.add_argument('--quiet', action='store_true', help="Do not log every request.")
+    args = parser.parse_args()
+
+    root = args.root or load_output_folder()
+    if not os.path.isdir(root):
+        print(f"Hata: Sunulacak dizin bulunamadı: {root}", file=sys.stderr)
+        sys.exit(1)
+
+    server = make_server(root, args.host, args.port, args.quiet)
+    print(f"Serving {root} at http://localhost:{args.port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 #!/bin/bash
 
 PID_FILE="/storage/emulated/0/www/panblog/server.pid"
+PROJECT_DIR="/storage/emulated/0/www/panblog"
 PUBLIC_DIR="/storage/emulated/0/www/panblog/public"
 PORT=8000
 
@@ -17,14 +18,14 @@ start_server() {
     fi
 
     echo "Web sunucusu başlatılıyor..."
-    (cd "$PUBLIC_DIR" && python -m http.server $PORT & echo $! > "$PID_FILE") &>/dev/null &
+    (cd "$PROJECT_DIR" && python3 serve.py --root "$PUBLIC_DIR" --port $PORT --quiet & echo $! > "$PID_FILE") &>/dev/null &
     PID=$(cat "$PID_FILE")
     echo "Web sunucusu başlatıldı. PID: $PID. Port: $PORT. (http://localhost:$PORT)"
 }
 
 stop_server() {
-    echo "Tüm Python HTTP sunucuları aranıyor ve durduruluyor..."
-    PIDS=$(ps aux | grep 'python -m http.server' | grep -v grep | awk '{print $2}')
+    echo "Tüm PanBlog sunucuları aranıyor ve durduruluyor..."
+    PIDS=$(ps aux | grep -E 'serve\.py|python -m http\.server' | grep -v grep | awk '{print $2}')
 
     if [ -z "$PIDS" ]; then
         echo "Çalışan bir Python HTTP sunucusu bulunamadı."
@@ -43,15 +44,23 @@ stop_server() {
     fi
 }
 
+watch_server() {
+    echo "İzleme modu başlatılıyor (değişiklikte yeniden derleme ve canlı yenileme)..."
+    cd "$PROJECT_DIR" && exec python3 watch.py --port $PORT
+}
+
 case "$1" in
     start)
         start_server
         ;;
+    watch)
+        watch_server
+        ;;
     stop)
         stop_server
         ;;
     *)
-        echo "Kullanım: $0 {start|stop}"
+        echo "Kullanım: $0 {start|stop|watch}"
         exit 1
         ;;
 esac
\ No newline at end of file
@@ -0,0 +1,60 @@
+/**
+ * PanBlog embed facades.
+ *
+ * Posts render YouTube videos and tweets as local placeholders that link to
+ * the original page. Clicking one swaps in the YouTube player or loads
+ * platform.twitter.com/widgets.js, so no third-party code runs before the
+ * reader asks for it.
+ */
+(() => {
+  const youtubeAllow = 'accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture';
+
+  let twitterPromise = null;
+  const loadTwitter = () => {
+    twitterPromise = twitterPromise || new Promise((resolve, reject) => {
+      const script = document.createElement('script');
+      script.src = 'https://platform.twitter.com/widgets.js';
+      script.async = true;
+      script.charset = 'utf-8';
+      script.onload = () => resolve(window.twttr);
+      script.onerror = () => {
+        // Let a later click try again
+        twitterPromise = null;
+        reject(new Error('widgets.js could not be loaded'));
+      };
+      document.head.append(script);
+    });
+    return twitterPromise;
+  };
+
+  const activate = {
+    youtube(facade) {
+      const iframe = document.createElement('iframe');
+      iframe.src = 'https://www.youtube.com/embed/' + encodeURIComponent(facade.dataset.id) + '?autoplay=1';
+      iframe.title = 'YouTube';
+      iframe.allow = youtubeAllow;
+      iframe.allowFullscreen = true;
+      facade.replaceChildren(iframe);
+    },
+    async twitter(facade) {
+      const button = facade.querySelector('[data-embed-load]');
+      button.disabled = true;
+      try {
+        const twttr = await loadTwitter();
+        await twttr.widgets.load(facade);
+        button.remove();
+      } catch (error) {
+        button.disabled = false;
+      }
+    },
+  };
+
+  document.addEventListener('click', (event) => {
+    const trigger = event.target.closest('[data-embed-load]');
+    const facade = trigger && trigger.closest('.embed-facade');
+    if (!facade || !activate[facade.dataset.embed]) return;
+    event.preventDefault();
+    facade.classList.remove('embed-facade');
+    activate[facade.dataset.embed](facade);
+  });
+})();
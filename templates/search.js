@@ -0,0 +1,138 @@
+/**
+ * PanBlog client-side search.
+ *
+ * The build writes an inverted index split into gzip-compressed shards by
+ * the first letters of each term (search/shard-<prefix>.gz) plus a small
+ * search/meta.json with the title, URL and date of every post. A query only
+ * downloads the shards of its own terms; the last term matches as a prefix
+ * so results appear while typing.
+ */
+(() => {
+  const searchUrl = __SEARCH_URL__;
+  const prefixLength = __SHARD_PREFIX_LENGTH__;
+  const stopWords = new Set(__STOP_WORDS__);
+  const maxResults = 10;
+  const foldMap = { 'ı': 'i', 'ş': 's', 'ğ': 'g', 'ç': 'c', 'ö': 'o', 'ü': 'u' };
+
+  // Same normalization as normalize_search_text in process_markdown.py
+  const normalize = (text) => text
+    .replace(/İ/g, 'i')
+    .replace(/I/g, 'ı')
+    .toLowerCase()
+    .replace(/[ışğçöü]/g, (c) => foldMap[c])
+    .normalize('NFKD')
+    .replace(/\p{M}/gu, '');
+
+  const tokenize = (text) => (normalize(text).match(/[\p{L}\p{N}_]+/gu) || [])
+    .filter((term) => Array.from(term).length >= prefixLength && !stopWords.has(term));
+
+  const shardName = (term) => {
+    let prefix = Array.from(term).slice(0, prefixLength).join('');
+    if (!/^[a-z0-9]+$/.test(prefix)) {
+      prefix = 'x' + Array.from(new TextEncoder().encode(prefix), (b) => b.toString(16).padStart(2, '0')).join('');
+    }
+    return 'shard-' + prefix + '.gz';
+  };
+
+  let metaPromise = null;
+  const loadMeta = () => {
+    metaPromise = metaPromise || fetch(searchUrl + 'meta.json').then((r) => r.json());
+    return metaPromise;
+  };
+
+  const shards = new Map();
+  const loadShard = (name) => {
+    if (!shards.has(name)) {
+      shards.set(name, fetch(searchUrl + name).then(async (response) => {
+        if (!response.ok) return {};
+        const bytes = new Uint8Array(await response.arrayBuffer());
+        // Servers that add Content-Encoding: gzip hand us the JSON already decompressed
+        if (bytes[0] !== 0x1f || bytes[1] !== 0x8b) return JSON.parse(new TextDecoder().decode(bytes));
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+        return new Response(stream).json();
+      }).catch(() => ({})));
+    }
+    return shards.get(name);
+  };
+
+  // Returns [docId, score] pairs of posts containing every term, best first
+  const search = async (query) => {
+    const terms = tokenize(query);
+    if (!terms.length) return [];
+    let scores = null;
+    for (const [index, term] of terms.entries()) {
+      const shard = await loadShard(shardName(term));
+      const isLast = index === terms.length - 1;
+      const matching = isLast ? Object.keys(shard).filter((t) => t.startsWith(term)) : (shard[term] ? [term] : []);
+      const termScores = new Map();
+      for (const t of matching) {
+        for (const [docId, weight] of shard[t]) termScores.set(docId, (termScores.get(docId) || 0) + weight);
+      }
+      if (scores === null) {
+        scores = termScores;
+      } else {
+        for (const docId of scores.keys()) {
+          if (termScores.has(docId)) scores.set(docId, scores.get(docId) + termScores.get(docId));
+          else scores.delete(docId);
+        }
+      }
+      if (!scores.size) return [];
+    }
+    return Array.from(scores).sort((a, b) => b[1] - a[1]).slice(0, maxResults);
+  };
+
+  const renderResults = (list, results, meta) => {
+    list.replaceChildren();
+    if (!results.length) {
+      const empty = document.createElement('li');
+      empty.textContent = 'Sonuç bulunamadı.';
+      list.append(empty);
+    }
+    for (const [docId] of results) {
+      const doc = meta.docs[docId];
+      if (!doc) continue;
+      const item = document.createElement('li');
+      const link = document.createElement('a');
+      link.href = doc[0];
+      link.textContent = doc[1];
+      item.append(link);
+      if (doc[2]) {
+        const date = document.createElement('small');
+        date.textContent = ' ' + doc[2];
+        item.append(date);
+      }
+      list.append(item);
+    }
+    list.hidden = false;
+  };
+
+  for (const form of document.querySelectorAll('form[data-search]')) {
+    const input = form.querySelector('input[type="search"]');
+    const list = form.querySelector('.search-results');
+    let generation = 0;
+    let timer = null;
+
+    form.addEventListener('submit', (event) => event.preventDefault());
+    input.addEventListener('focus', loadMeta, { once: true });
+    input.addEventListener('keydown', (event) => {
+      if (event.key === 'Escape') {
+        input.value = '';
+        list.hidden = true;
+      }
+    });
+    input.addEventListener('input', () => {
+      clearTimeout(timer);
+      timer = setTimeout(async () => {
+        const current = ++generation;
+        const query = input.value.trim();
+        if (!query) {
+          list.hidden = true;
+          return;
+        }
+        const [meta, results] = await Promise.all([loadMeta(), search(query)]);
+        // A newer query may have finished first
+        if (current === generation) renderResults(list, results, meta);
+      }, 150);
+    });
+  }
+})();
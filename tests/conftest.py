@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import shutil
+
+import pytest
+
+# Repository root: the build scripts are imported and the templates copied from here
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import process_markdown as pm
+
+# Settings of the throwaway sites; the in-process renderer keeps tests independent of pandoc,
+# and a single build worker keeps conversions in this process where tests can observe them
+TEST_CONFIG = {
+    'site_title': 'Test',
+    'site_description': 'Test sitesi',
+    'author': 'Test',
+    'site_url': '/',
+    'output_folder': 'public',
+    'content_folder': 'content',
+    'renderer': 'markdown',
+    'image_widths': [480],
+    'image_formats': [],
+    'build_workers': 1,
+    'image_workers': 1,
+    'navigation_links': [],
+}
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """Creates a minimal site in a temporary directory and makes it the working directory."""
+    shutil.copytree(os.path.join(PROJECT_DIR, 'templates'), tmp_path / 'templates')
+    (tmp_path / 'content').mkdir()
+    (tmp_path / 'img').mkdir()
+    (tmp_path / 'public' / 'assets').mkdir(parents=True)
+    shutil.copy(os.path.join(PROJECT_DIR, 'public', 'style.css'), tmp_path / 'public')
+    (tmp_path / 'config.json').write_text(json.dumps(TEST_CONFIG), encoding='utf-8')
+    (tmp_path / 'content' / 'index.md').write_text('---\ntitle: "Ana Sayfa"\n---\n\n# Test\n', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def build(site):
+    """Returns a function that runs a full incremental build of the test site."""
+    def run(**kwargs):
+        pm.build_all(pm.load_config(), **kwargs)
+    return run
+
+
+def write_post(site, name, body, title=None):
+    """Writes content/<name>.md with front matter and returns its path."""
+    path = site / 'content' / f'{name}.md'
+    path.write_text(f'---\ntitle: "{title or name}"\ndate: 2025-06-01\n---\n\n{body}\n', encoding='utf-8')
+    return path
@@ -0,0 +1,187 @@
+import json
+
+from PIL import Image
+
+import process_markdown as pm
+from conftest import write_post
+
+
+def load_manifest(site):
+    return json.loads((site / 'public' / pm.BUILD_MANIFEST_NAME).read_text(encoding='utf-8'))
+
+
+def record_conversions(monkeypatch):
+    """Returns the list the names of converted posts are appended to."""
+    converted = []
+    convert_post = pm.convert_post
+    def recording_convert_post(config, md_file_path, *args):
+        converted.append(md_file_path.rsplit('/', 1)[-1])
+        return convert_post(config, md_file_path, *args)
+    monkeypatch.setattr(pm, 'convert_post', recording_convert_post)
+    return converted
+
+
+def test_unchanged_build_converts_nothing(site, build, monkeypatch):
+    write_post(site, 'bir', 'Birinci yazı.')
+    write_post(site, 'iki', 'İkinci yazı.')
+    build()
+
+    converted = record_conversions(monkeypatch)
+    build()
+    assert converted == []
+
+
+def test_source_edit_converts_only_that_post(site, build, monkeypatch):
+    write_post(site, 'bir', 'Birinci yazı.')
+    write_post(site, 'iki', 'İkinci yazı.')
+    build()
+
+    converted = record_conversions(monkeypatch)
+    write_post(site, 'iki', 'İkinci yazı, düzenlendi.')
+    build()
+
+    assert converted == ['iki.md']
+    assert 'düzenlendi' in (site / 'public' / 'iki.html').read_text(encoding='utf-8')
+
+
+def test_asset_edit_rerenders_post(site, build, monkeypatch):
+    source = site / 'img' / 'foto.jpg'
+    Image.new('RGB', (64, 48), (200, 100, 50)).save(source)
+    write_post(site, 'yazi', '![Foto](../img/foto.jpg)')
+    write_post(site, 'diger', 'Resimsiz yazı.')
+    build()
+    old_page = (site / 'public' / 'yazi.html').read_text(encoding='utf-8')
+
+    converted = record_conversions(monkeypatch)
+    Image.new('RGB', (64, 48), (10, 200, 50)).save(source)
+    build()
+
+    assert converted == ['yazi.md']
+    new_page = (site / 'public' / 'yazi.html').read_text(encoding='utf-8')
+    assert new_page != old_page
+    # The new fingerprinted outputs exist
+    asset_files = pm.ASSET_URL_RE.findall(new_page)
+    assert asset_files
+    for asset_file in asset_files:
+        assert (site / 'public' / 'assets' / asset_file).exists()
+
+
+def test_touching_asset_without_changes_converts_nothing(site, build, monkeypatch):
+    source = site / 'img' / 'foto.jpg'
+    Image.new('RGB', (64, 48), (200, 100, 50)).save(source)
+    write_post(site, 'yazi', '![Foto](../img/foto.jpg)')
+    build()
+
+    converted = record_conversions(monkeypatch)
+    source.write_bytes(source.read_bytes())
+    build()
+    assert converted == []
+
+
+def test_deleted_post_is_removed(site, build):
+    write_post(site, 'bir', 'Birinci yazı.')
+    post = write_post(site, 'iki', 'İkinci yazı.')
+    build()
+    assert (site / 'public' / 'iki.html').exists()
+
+    post.unlink()
+    build()
+
+    assert not (site / 'public' / 'iki.html').exists()
+    assert [path.rsplit('/', 1)[-1] for path in load_manifest(site)['posts']] == ['bir.md']
+    assert 'iki.html' not in (site / 'public' / 'index.html').read_text(encoding='utf-8')
+
+
+def test_undecodable_post_is_skipped(site, build):
+    write_post(site, 'bir', 'Birinci yazı.')
+    (site / 'content' / 'bozuk.md').write_bytes(b'---\ntitle: "Bozuk"\n---\n\n\xff\xfe yazi\n')
+    build()
+
+    assert (site / 'public' / 'bir.html').exists()
+    assert not (site / 'public' / 'bozuk.html').exists()
+
+
+def test_image_quality_change_rerenders_posts(site, build, monkeypatch):
+    Image.new('RGB', (64, 48), (200, 100, 50)).save(site / 'img' / 'foto.jpg')
+    write_post(site, 'yazi', '![Foto](../img/foto.jpg)')
+    build()
+    old_page = (site / 'public' / 'yazi.html').read_text(encoding='utf-8')
+
+    config = json.loads((site / 'config.json').read_text(encoding='utf-8'))
+    config['image_quality'] = 60
+    (site / 'config.json').write_text(json.dumps(config), encoding='utf-8')
+    converted = record_conversions(monkeypatch)
+    build()
+
+    assert converted == ['yazi.md']
+    new_page = (site / 'public' / 'yazi.html').read_text(encoding='utf-8')
+    assert new_page != old_page
+    for asset_file in pm.ASSET_URL_RE.findall(new_page):
+        assert (site / 'public' / 'assets' / asset_file).exists()
+
+
+def test_image_that_cannot_be_encoded_gets_a_plain_img(site, build):
+    config = json.loads((site / 'config.json').read_text(encoding='utf-8'))
+    config['image_widths'] = [16, 32]
+    (site / 'config.json').write_text(json.dumps(config), encoding='utf-8')
+    source = site / 'img' / 'bozuk.jpg'
+    Image.effect_noise((64, 48), 64).convert('RGB').save(source, quality=95)
+    source.write_bytes(source.read_bytes()[:len(source.read_bytes()) // 2])
+    write_post(site, 'yazi', '![Bozuk](../img/bozuk.jpg)')
+    build()
+
+    page = (site / 'public' / 'yazi.html').read_text(encoding='utf-8')
+    assert 'srcset' not in page
+    asset_files = pm.ASSET_URL_RE.findall(page)
+    assert asset_files
+    for asset_file in asset_files:
+        assert (site / 'public' / 'assets' / asset_file).exists()
+    assert list(load_manifest(site)['posts']) == ['content/yazi.md']
+
+
+def test_post_with_failed_asset_is_converted_again(site, build, monkeypatch):
+    process_asset = pm.process_asset
+    Image.new('RGB', (64, 48), (200, 100, 50)).save(site / 'img' / 'foto.jpg')
+    write_post(site, 'yazi', '![Foto](../img/foto.jpg)')
+    write_post(site, 'diger', 'Resimsiz yazı.')
+    monkeypatch.setattr(pm, 'process_asset', lambda source_path, *args: (False, f"Error processing {source_path}"))
+    build()
+    assert [path.rsplit('/', 1)[-1] for path in load_manifest(site)['posts']] == ['diger.md']
+
+    monkeypatch.setattr(pm, 'process_asset', process_asset)
+    converted = record_conversions(monkeypatch)
+    build()
+    assert converted == ['yazi.md']
+    for asset_file in pm.ASSET_URL_RE.findall((site / 'public' / 'yazi.html').read_text(encoding='utf-8')):
+        assert (site / 'public' / 'assets' / asset_file).exists()
+
+
+def test_worker_processes_render_the_same_pages(site, build):
+    for index in range(6):
+        write_post(site, f'yazi{index}', f'Kamera objektif diyafram {index}.')
+    build(workers=1, force=True)
+    serial = {path.name: path.read_bytes() for path in (site / 'public').glob('*.html')}
+
+    build(workers=3, force=True, report_path='rapor.json')
+    parallel = {path.name: path.read_bytes() for path in (site / 'public').glob('*.html')}
+    assert parallel == serial
+
+    report = json.loads((site / 'rapor.json').read_text(encoding='utf-8'))
+    posts = [item for item in report['items'] if item['kind'] == 'post']
+    assert len(posts) == 6
+    # Spans and I/O measured in the worker processes reach the report
+    assert all('convert_s' in item and item['bytes_read'] for item in posts)
+
+
+def test_posts_named_like_listing_pages_are_skipped(site, build):
+    write_post(site, 'yazi', 'Normal yazı.')
+    for name in ('archive', 'index-2', 'archive-2025', 'archive-2025-06'):
+        write_post(site, name, f'Çakışan yazı {name}.')
+    write_post(site, 'archive-notlari', 'Serbest ad.')
+    build()
+
+    assert 'Çakışan yazı' not in (site / 'public' / 'archive.html').read_text(encoding='utf-8')
+    assert 'Çakışan yazı' not in (site / 'public' / 'archive-2025.html').read_text(encoding='utf-8')
+    assert not (site / 'public' / 'index-2.html').exists()
+    posts = sorted(path.rsplit('/', 1)[-1] for path in load_manifest(site)['posts'])
+    assert posts == ['archive-notlari.md', 'yazi.md']
@@ -0,0 +1,27 @@
+import json
+
+from conftest import write_post
+
+
+def test_post_index_hits_count_only_reused_entries(site, build):
+    write_post(site, 'bir', 'Birinci yazı.')
+    write_post(site, 'iki', 'İkinci yazı.')
+    build()
+
+    write_post(site, 'iki', 'İkinci yazı, düzenlendi.')
+    build(report_path='rapor.json')
+
+    report = json.loads((site / 'rapor.json').read_text(encoding='utf-8'))
+    assert report['cache']['post_index'] == {'hit': 1, 'miss': 1}
+    assert report['cache']['build_manifest'] == {'hit': 1, 'miss': 1}
+
+
+def test_profiled_build_completes(site, build):
+    for index in range(4):
+        write_post(site, f'yazi{index}', f'Yazı {index}.')
+    build(report_path='rapor.json', profile_path='build.prof')
+
+    report = json.loads((site / 'rapor.json').read_text(encoding='utf-8'))
+    assert report['hot_functions']
+    assert (site / 'build.prof').exists()
+    assert len([item for item in report['items'] if item['kind'] == 'post']) == 4
@@ -0,0 +1,35 @@
+from PIL import Image
+
+import cleanup_assets
+from conftest import write_post
+
+
+def test_full_cleanup_keeps_referenced_assets(site, build):
+    Image.new('RGB', (64, 48), (200, 100, 50)).save(site / 'img' / 'foto.jpg')
+    # Built before the source went missing; the page still links to /assets/kayip.jpg
+    (site / 'public' / 'assets' / 'kayip.jpg').write_bytes(b'eski cikti')
+    (site / 'public' / 'assets' / 'sahipsiz.jpg').write_bytes(b'kullanilmiyor')
+    write_post(site, 'yazi', '![Foto](../img/foto.jpg)\n\n![Kayıp](../img/kayip.jpg)')
+    build()
+
+    cleanup_assets.cleanup_assets(dry_run=False, full=True)
+
+    remaining = {path.name for path in (site / 'public' / 'assets').iterdir()}
+    assert 'kayip.jpg' in remaining
+    assert 'sahipsiz.jpg' not in remaining
+    assert any(name.startswith('foto.') for name in remaining)
+    assert '/assets/kayip.jpg' in (site / 'public' / 'yazi.html').read_text(encoding='utf-8')
+
+
+def test_cleanup_releases_assets_of_deleted_posts(site, build):
+    Image.new('RGB', (64, 48), (10, 20, 30)).save(site / 'img' / 'foto.jpg')
+    post = write_post(site, 'yazi', '![Foto](../img/foto.jpg)')
+    build()
+    outputs = {path.name for path in (site / 'public' / 'assets').iterdir()}
+    assert any(name.startswith('foto.') for name in outputs)
+
+    post.unlink()
+    build()
+    cleanup_assets.cleanup_assets(dry_run=False, full=False)
+
+    assert not any(path.name.startswith('foto.') for path in (site / 'public' / 'assets').iterdir())
@@ -0,0 +1,20 @@
+import json
+
+import process_markdown as pm
+from conftest import write_post
+
+
+def test_feed_entries_follow_renderer_changes(site, build):
+    write_post(site, 'yazi', 'Eski özet.')
+    build()
+    post_index = pm.load_post_index(pm.load_config())
+    (entry,) = post_index.values()
+    # Same markdown, different renderer output: the summary changes but the hash does not
+    entry['summary'] = 'Yeni özet.'
+
+    config = json.loads((site / 'config.json').read_text(encoding='utf-8'))
+    config['renderer'] = 'pandoc'
+    (site / 'config.json').write_text(json.dumps(config), encoding='utf-8')
+    pm.generate_feeds(pm.load_config(), post_index)
+
+    assert 'Yeni özet.' in (site / 'public' / pm.ATOM_FEED_NAME).read_text(encoding='utf-8')
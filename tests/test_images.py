@@ -0,0 +1,96 @@
+from PIL import Image
+
+import process_markdown as pm
+from conftest import write_post
+
+
+def image_tags(html):
+    """Returns the <img> tags of a page in document order."""
+    return [tag.split('>', 1)[0] for tag in html.split('<img ')[1:]]
+
+
+def test_first_image_is_not_lazy_loaded(site, build):
+    for name in ('bir', 'iki'):
+        Image.new('RGB', (64, 48), (200, 100, 50)).save(site / 'img' / f'{name}.jpg')
+    write_post(site, 'yazi', '![Bir](../img/bir.jpg)\n\nMetin.\n\n![İki](../img/iki.jpg)')
+    build()
+
+    first, second = image_tags((site / 'public' / 'yazi.html').read_text(encoding='utf-8'))
+    assert 'fetchpriority="high"' in first and 'loading="lazy"' not in first
+    assert 'loading="lazy"' in second and 'fetchpriority' not in second
+
+
+def test_first_preview_on_listing_page_is_not_lazy_loaded(site, build):
+    for name, day in (('eski', '01'), ('yeni', '02')):
+        Image.new('RGB', (64, 48), (10, 20, 30)).save(site / 'img' / f'{name}.jpg')
+        (site / 'content' / f'{name}.md').write_text(
+            f'---\ntitle: "{name}"\ndate: 2025-06-{day}\n---\n\n![{name}](../img/{name}.jpg)\n', encoding='utf-8')
+    build()
+
+    previews = [tag for tag in image_tags((site / 'public' / 'index.html').read_text(encoding='utf-8')) if 'preview-image' in tag]
+    assert len(previews) == 2
+    assert 'fetchpriority="high"' in previews[0] and 'yeni' in previews[0]
+    assert 'loading="lazy"' in previews[1]
+
+
+def truncated_jpeg(path):
+    """Writes a JPEG whose header is intact but whose pixel data is cut off."""
+    Image.effect_noise((256, 192), 64).convert('RGB').save(path, quality=95)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+
+def test_failed_encode_is_a_failure_when_variants_were_planned(site):
+    source = site / 'img' / 'bozuk.jpg'
+    truncated_jpeg(source)
+    assets = site / 'public' / 'assets'
+    variants = ((str(assets / 'bozuk.x.jpg'), 128, None), (str(assets / 'bozuk.x-64.jpg'), 64, None))
+
+    ok, message = pm.process_asset(str(source), variants[0][0], 'image', variants)
+    assert not ok
+    assert (assets / 'bozuk.x.jpg').read_bytes() == source.read_bytes()
+
+    ok, message = pm.process_asset(str(source), variants[0][0], 'image', variants[:1])
+    assert ok
+
+
+def test_image_that_failed_to_encode_is_planned_as_plain_copy(site):
+    source = site / 'img' / 'bozuk.jpg'
+    truncated_jpeg(source)
+    config = dict(pm.load_config(), image_widths=[64, 128])
+    assets_dir = str(site / 'public' / 'assets')
+    image = pm.plan_responsive_image(config, str(source), assets_dir)
+    assert len(image['variants']) == 2
+
+    failures = pm.run_asset_jobs(config, {image['variants'][0][0]: (str(source), 'image', image['variants'])}, workers=1)
+    assert failures == [image['variants'][0][0]]
+
+    plain = pm.plan_responsive_image(config, str(source), assets_dir)
+    assert plain['src'] == image['src']
+    assert plain['srcset'] == '' and plain['sources'] == []
+    assert [v[0] for v in plain['variants']] == [image['variants'][0][0]]
+    assert pm.run_asset_jobs(config, {plain['variants'][0][0]: (str(source), 'image', plain['variants'])}, workers=1) == []
+
+
+def test_preview_uses_images_outside_code(site, build):
+    Image.new('RGB', (64, 48), (1, 2, 3)).save(site / 'img' / 'kod.jpg')
+    write_post(site, 'yazi', 'Örnek:\n\n```\n![Kod](../img/kod.jpg)\n```\n')
+    build()
+
+    index_html = (site / 'public' / 'index.html').read_text(encoding='utf-8')
+    assert 'preview-image' not in index_html
+    assert not any(path.name.startswith('kod.') for path in (site / 'public' / 'assets').iterdir())
+
+
+def test_preview_files_are_created(site, build):
+    Image.new('RGB', (64, 48), (1, 2, 3)).save(site / 'img' / 'kod.jpg')
+    Image.new('RGB', (64, 48), (4, 5, 6)).save(site / 'img' / 'kapak.jpg')
+    write_post(site, 'yazi', '```\n![Kod](../img/kod.jpg)\n```\n\n![Kapak](../img/kapak.jpg)\n')
+    build()
+
+    (entry,) = pm.load_post_index(pm.load_config()).values()
+    assert entry['preview_picture']['files']
+    for asset_file in entry['preview_picture']['files']:
+        assert (site / 'public' / 'assets' / asset_file).exists()
+    assert entry['preview_image'] == entry['preview_picture']['src']
+    assert 'kapak.' in entry['preview_image']
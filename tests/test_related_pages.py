@@ -0,0 +1,46 @@
+import process_markdown as pm
+from conftest import write_post
+
+TOPIC = 'kamera objektif diyafram pozlama enstantane'
+
+
+def test_related_only_pages_reuse_cached_body(site, build, monkeypatch):
+    write_post(site, 'birinci', f'{TOPIC} ilk.', title='Birinci')
+    write_post(site, 'ikinci', f'{TOPIC} ikinci.', title='İkinci')
+    write_post(site, 'ucuncu', 'bambaska bir konu hakkinda.', title='Üçüncü')
+    build()
+    assert 'Birinci' in (site / 'public' / 'ikinci.html').read_text(encoding='utf-8')
+
+    converted = []
+    convert_post = pm.convert_post
+    monkeypatch.setattr(pm, 'convert_post', lambda config, path, *args: converted.append(path) or convert_post(config, path, *args))
+    # Only the title changes, so ikinci.md needs a new related list but not a new body
+    write_post(site, 'birinci', f'{TOPIC} ilk.', title='Yeni Başlık')
+    build()
+
+    assert [path.rsplit('/', 1)[-1] for path in converted] == ['birinci.md']
+    page = (site / 'public' / 'ikinci.html').read_text(encoding='utf-8')
+    assert 'Yeni Başlık' in page
+    assert 'ikinci.' in page
+
+
+def test_deleted_post_drops_cached_body(site, build):
+    write_post(site, 'birinci', f'{TOPIC} ilk.')
+    post = write_post(site, 'ikinci', f'{TOPIC} ikinci.')
+    build()
+    assert (site / 'public' / pm.POST_BODY_CACHE_DIR / 'ikinci.json').exists()
+
+    post.unlink()
+    build()
+    assert not (site / 'public' / pm.POST_BODY_CACHE_DIR / 'ikinci.json').exists()
+
+
+def test_related_titles_are_escaped(site, build):
+    write_post(site, 'birinci', f'{TOPIC} ilk.', title='Test & <One>')
+    write_post(site, 'ikinci', f'{TOPIC} ikinci.')
+    write_post(site, 'ucuncu', 'bambaska bir konu hakkinda.')
+    build()
+
+    page = (site / 'public' / 'ikinci.html').read_text(encoding='utf-8')
+    assert 'Test &amp; &lt;One&gt;</a></li>' in page
+    assert '<One>' not in page
@@ -0,0 +1,61 @@
+from PIL import Image
+
+import process_markdown as pm
+from conftest import TEST_CONFIG
+
+
+def rewrite(site, markdown, **kwargs):
+    """Runs the single-pass rewriter over `markdown` as if it were content/yazi.md."""
+    return pm.process_markdown_content(TEST_CONFIG, markdown, str(site / 'content' / 'yazi.md'), **kwargs)
+
+
+def test_fenced_code_is_copied_verbatim(site):
+    Image.new('RGB', (64, 48)).save(site / 'img' / 'foto.jpg')
+    markdown = (
+        '```\n![Foto](../img/foto.jpg)\n[Diğer](diger.md)\nhttps://youtu.be/CqL5kB8pOfo\n```\n\n'
+        '~~~~ python\n![Foto](../img/foto.jpg)\n~~~~\n'
+    )
+    asset_jobs, links = {}, {}
+    assert rewrite(site, markdown, asset_jobs=asset_jobs, links=links) == markdown
+    assert asset_jobs == {} and links == {}
+
+
+def test_unclosed_fence_runs_to_the_end(site):
+    markdown = 'Metin.\n\n```\n![Foto](../img/foto.jpg)\n[Diğer](diger.md)\n'
+    assert rewrite(site, markdown, asset_jobs={}, links={}) == markdown
+
+
+def test_inline_code_is_copied_verbatim(site):
+    markdown = 'Şöyle yazılır: `![Foto](../img/foto.jpg)` ve ``[Diğer](diger.md)``.'
+    links = {}
+    assert rewrite(site, markdown, asset_jobs={}, links=links) == markdown
+    assert links == {}
+
+
+def test_references_outside_code_are_rewritten(site):
+    Image.new('RGB', (64, 48)).save(site / 'img' / 'foto.jpg')
+    markdown = '`kod` ![Foto](../img/foto.jpg)\n\n```\n[Kod](kod.md)\n```\n\n[Diğer](diger.md)\n'
+    asset_jobs, links = {}, {}
+    output = rewrite(site, markdown, asset_jobs=asset_jobs, links=links)
+
+    assert '../img/foto.jpg' not in output
+    assert '`kod`' in output and '[Kod](kod.md)' in output
+    assert len(asset_jobs) == 1
+    assert list(links) == ['diger']
+
+
+def test_backticks_in_info_string_are_not_a_fence(site):
+    markdown = '```js``` is neat\n\n[Sap](sap.md)\n\nhttps://youtu.be/CqL5kB8pOfo\n'
+    links = {}
+    output = rewrite(site, markdown, asset_jobs={}, links=links)
+
+    assert output.startswith('```js``` is neat')
+    assert list(links) == ['sap']
+    assert 'https://youtu.be/CqL5kB8pOfo\n' not in output
+
+
+def test_tilde_fence_info_string_may_contain_backticks(site):
+    markdown = '~~~ `kod`\n[Diğer](diger.md)\n~~~\n'
+    links = {}
+    assert rewrite(site, markdown, asset_jobs={}, links=links) == markdown
+    assert links == {}
@@ -0,0 +1,78 @@
+import gzip
+import threading
+import http.client
+
+import pytest
+
+import serve
+
+BODY = b'<!DOCTYPE html><title>Test</title>' + b'x' * 1000
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Serves a folder with one page and its gzip sidecar on a free port."""
+    (tmp_path / 'index.html').write_bytes(BODY)
+    (tmp_path / 'index.html.gz').write_bytes(gzip.compress(BODY))
+    httpd = serve.make_server(str(tmp_path), '127.0.0.1', 0, quiet=True)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def request(port, headers=None, method='GET', path='/index.html'):
+    """Sends one request and returns the response with its body read."""
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    connection.request(method, path, headers=headers or {})
+    response = connection.getresponse()
+    response.body = response.read()
+    connection.close()
+    return response
+
+
+def test_full_response(server):
+    response = request(server)
+    assert response.status == 200
+    assert response.body == BODY
+    assert response.getheader('Accept-Ranges') == 'bytes'
+    assert response.getheader('Cache-Control') == 'no-cache'
+
+
+def test_not_modified(server):
+    etag = request(server).getheader('ETag')
+    response = request(server, {'If-None-Match': etag})
+    assert response.status == 304
+    assert response.body == b''
+    assert response.getheader('ETag') == etag
+
+
+def test_partial_content(server):
+    response = request(server, {'Range': 'bytes=10-19'})
+    assert response.status == 206
+    assert response.body == BODY[10:20]
+    assert response.getheader('Content-Range') == f'bytes 10-19/{len(BODY)}'
+
+    response = request(server, {'Range': 'bytes=-5'})
+    assert response.status == 206
+    assert response.body == BODY[-5:]
+
+
+def test_range_not_satisfiable(server):
+    response = request(server, {'Range': f'bytes={len(BODY) + 10}-'})
+    assert response.status == 416
+    assert response.getheader('Content-Range') == f'bytes */{len(BODY)}'
+
+
+def test_precompressed_sidecar_ignores_ranges(server):
+    response = request(server, {'Accept-Encoding': 'gzip', 'Range': 'bytes=0-9'})
+    assert response.status == 200
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert response.getheader('Accept-Ranges') == 'none'
+    assert gzip.decompress(response.body) == BODY
+
+
+def test_dotfiles_are_not_served(server, tmp_path):
+    (tmp_path / '.build-manifest.json').write_text('{}')
+    assert request(server, path='/.build-manifest.json').status == 404
@@ -0,0 +1,45 @@
+import os
+
+import process_markdown as pm
+from conftest import PROJECT_DIR
+
+
+def test_variables_and_placeholders():
+    template = pm.Template('<title>$title$</title><!-- NAV_PLACEHOLDER --><p>__SITE_TITLE__</p>$eksik$')
+    assert template.render({'title': 'Başlık', 'nav': '<nav>', 'site_title': 'Site'}) == '<title>Başlık</title><nav><p>Site</p>'
+
+
+def test_conditionals():
+    template = pm.Template('$if(date)$<time>$date$</time>$else$tarihsiz$endif$|$if(lang)$$lang$$endif$')
+    assert template.render({'date': '1 Haziran'}) == '<time>1 Haziran</time>|'
+    assert template.render({'date': '', 'lang': 'tr'}) == 'tarihsiz|tr'
+
+
+def test_nested_conditionals():
+    template = pm.Template('$if(a)$A$if(b)$B$else$-$endif$$endif$')
+    assert template.render({'a': 1, 'b': 1}) == 'AB'
+    assert template.render({'a': 1}) == 'A-'
+    assert template.render({'b': 1}) == ''
+
+
+def test_bind_fills_shared_variables_and_keeps_the_rest():
+    template = pm.Template('<h1>$site$</h1>$if(body)$$body$$else$boş$endif$ $title$')
+    bound = template.bind({'site': 'Site'})
+    assert bound.render({'body': '<p>x</p>', 'title': 'T'}) == '<h1>Site</h1><p>x</p> T'
+    assert bound.render({}) == '<h1>Site</h1>boş '
+    # Literals around bound values are merged
+    assert bound.nodes[0] == '<h1>Site</h1>'
+
+
+def test_source_round_trips_pandoc_syntax():
+    source = '<title>$title$</title>$if(date)$<p>$date$</p>$else$-$endif$'
+    template = pm.Template(source)
+    assert template.source() == source
+    assert pm.Template(template.source()).render({'title': 'T'}) == template.render({'title': 'T'})
+
+
+def test_repository_templates_parse():
+    for template_path in pm.TEMPLATE_FILES:
+        with open(os.path.join(PROJECT_DIR, template_path), encoding='utf-8') as f:
+            template = pm.Template(f.read())
+        assert '$if(' not in template.render({})
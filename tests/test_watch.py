@@ -0,0 +1,21 @@
+import os
+
+from PIL import Image
+
+import watch
+from conftest import write_post
+
+
+def test_only_referenced_asset_sources_are_watched(site):
+    Image.new('RGB', (64, 48), 'red').save(site / 'img' / 'foto.jpg')
+    Image.new('RGB', (64, 48), 'blue').save(site / 'img' / 'baska.jpg')
+    (site / 'img' / 'album').mkdir()
+    Image.new('RGB', (64, 48), 'green').save(site / 'img' / 'album' / 'eski.jpg')
+    write_post(site, 'yazi', '![Foto](../img/foto.jpg)')
+
+    state = watch.SiteState()
+
+    assert state.asset_source_files() == [os.path.join('img', 'foto.jpg')]
+    snapshot = watch.snapshot_files([state.content_dir], state.asset_source_files())
+    assert os.path.join('img', 'foto.jpg') in snapshot
+    assert not any(path.startswith('img') and path != os.path.join('img', 'foto.jpg') for path in snapshot)
@@ -0,0 +1,373 @@
+import os
+import sys
+import time
+import glob
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import process_markdown as pm
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+# --- Watch Settings ---
+
+# Seconds without new file events before a rebuild starts
+DEBOUNCE_SECONDS = 0.1
+
+# Seconds between scans when the polling watcher is used
+POLL_INTERVAL_SECONDS = 0.25
+
+# URL of the server-sent events stream the browser listens to for reloads
+LIVERELOAD_PATH = '/__livereload'
+
+# Injected before </body> of every HTML page served in watch mode
+LIVERELOAD_SCRIPT = (
+    '<script>new EventSource("' + LIVERELOAD_PATH + '")'
+    '.addEventListener("reload", () => location.reload());</script>'
+)
+
+
+class ChangeQueue:
+    """Collects changed paths from the watcher and hands them out once they settle."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.paths = set()
+        self.last_event = 0.0
+
+    def add(self, path):
+        with self.lock:
+            self.paths.add(os.path.relpath(path))
+            self.last_event = time.monotonic()
+
+    def take_settled(self):
+        """Returns the pending paths if no event arrived for DEBOUNCE_SECONDS, otherwise an empty set."""
+        with self.lock:
+            if not self.paths or time.monotonic() - self.last_event < DEBOUNCE_SECONDS:
+                return set()
+            paths, self.paths = self.paths, set()
+            return paths
+
+
+class ReloadBroadcaster:
+    """Wakes every open live-reload stream when a rebuild finishes."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.generation = 0
+
+    def notify(self):
+        with self.condition:
+            self.generation += 1
+            self.condition.notify_all()
+
+    def wait(self, generation, timeout):
+        with self.condition:
+            self.condition.wait_for(lambda: self.generation != generation, timeout)
+            return self.generation
+
+
+def snapshot_files(watch_dirs, watch_files):
+    """Returns path -> (mtime, size) for every watched file."""
+    snapshot = {}
+    paths = list(watch_files)
+    for watch_dir in watch_dirs:
+        paths.extend(glob.glob(os.path.join(watch_dir, '**', '*'), recursive=True))
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if os.path.isfile(path):
+            snapshot[os.path.relpath(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def poll_for_changes(watch_dirs, watch_files, changes):
+    """Fallback watcher used when watchdog is not installed: compares stat snapshots."""
+    previous = snapshot_files(watch_dirs, watch_files)
+    while True:
+        time.sleep(POLL_INTERVAL_SECONDS)
+        current = snapshot_files(watch_dirs, watch_files)
+        for path in previous.keys() | current.keys():
+            if previous.get(path) != current.get(path):
+                changes.add(path)
+        previous = current
+
+
+def start_watcher(watch_dirs, watch_files, changes):
+    """Starts an inotify-backed watchdog observer, or a polling thread without watchdog.
+
+    Directories are watched recursively; single files (config.json, images
+    referenced from e.g. a camera folder) only through their own directory,
+    non-recursively, so a large folder around them is never walked.
+    """
+    if Observer is None:
+        print("   - watchdog is not installed; falling back to polling.", file=sys.stderr)
+        thread = threading.Thread(target=poll_for_changes, args=(watch_dirs, watch_files, changes), daemon=True)
+        thread.start()
+        return
+
+    watched_dirs = [os.path.abspath(watch_dir) + os.sep for watch_dir in watch_dirs]
+    watched_files = {os.path.abspath(path) for path in watch_files}
+
+    def add_if_watched(path):
+        path = os.path.abspath(path)
+        if path in watched_files or any(path.startswith(watch_dir) for watch_dir in watched_dirs):
+            changes.add(path)
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            add_if_watched(event.src_path)
+            if getattr(event, 'dest_path', None):
+                add_if_watched(event.dest_path)
+
+    observer = Observer()
+    handler = Handler()
+    for watch_dir in watch_dirs:
+        observer.schedule(handler, watch_dir, recursive=True)
+    for file_dir in sorted({os.path.dirname(os.path.abspath(path)) for path in watch_files}):
+        observer.schedule(handler, file_dir, recursive=False)
+    observer.daemon = True
+    observer.start()
+
+
+class SiteState:
+    """Keeps config, the post template, the build manifest and the post index in memory between rebuilds."""
+
+    def __init__(self, site_url=None):
+        self.site_url = site_url
+        self.load()
+
+    def load(self):
+        """(Re)loads everything and brings the output folder up to date with a regular incremental build."""
+        self.config = pm.load_config()
+        if self.site_url:
+            self.config['site_url'] = self.site_url
+        self.output_dir = self.config.get('output_folder', 'public')
+        self.content_dir = self.config.get('content_folder', 'content')
+        self.manifest_path = os.path.join(self.output_dir, pm.BUILD_MANIFEST_NAME)
+        self.post_index_path = os.path.join(self.output_dir, pm.POST_INDEX_NAME)
+
+        try:
+            pm.build_all(self.config)
+        except SystemExit:
+            print("   - Some posts failed to build; watching for fixes.", file=sys.stderr)
+
+        self.post_template = pm.build_post_template(self.config)
+        self.manifest = pm.load_json_file(self.manifest_path, {'global_hash': pm.compute_global_hash(self.config), 'posts': {}})
+        self.post_index = pm.load_json_file(self.post_index_path, {})
+
+    def save(self):
+        pm.write_json_file(self.manifest_path, self.manifest)
+        pm.write_json_file(self.post_index_path, self.post_index)
+
+    def asset_source_files(self):
+        """Returns the existing asset sources referenced by posts outside the content folder."""
+        content_dir = os.path.normpath(self.content_dir)
+        files = set()
+        for entry in self.manifest['posts'].values():
+            for source_path in entry.get('assets', {}):
+                if os.path.isfile(source_path) and not (os.path.dirname(source_path) + os.sep).startswith(content_dir + os.sep):
+                    files.add(source_path)
+        return sorted(files)
+
+    def posts_using_sources(self, paths):
+        """Returns the posts whose manifest entry references one of the given asset sources."""
+        return {
+            md_file_path for md_file_path, entry in self.manifest['posts'].items()
+            if paths.intersection(entry.get('assets', {}))
+        }
+
+    def rebuild_post(self, md_file_path, converted):
+        """Converts one post and processes its assets; the page is written once its related posts are known.
+
+        Returns False if nothing changed.
+        """
+        with open(md_file_path, 'rb') as f:
+            raw_content = f.read()
+        content_hash = pm.hash_bytes(raw_content)
+        output_name = os.path.basename(md_file_path).replace('.md', '.html')
+        entry = {'hash': content_hash, 'output': output_name}
+        if pm.post_is_current(self.manifest['posts'].get(md_file_path), entry):
+            return False
+
+        content = raw_content.decode('utf-8')
+        body, post_entry, asset_jobs, asset_sources = pm.convert_post(self.config, md_file_path, content, content_hash)
+        complete = not asset_jobs or not pm.run_asset_jobs(self.config, asset_jobs)
+        if not complete:
+            # Images that could not be encoded are planned as plain copies on the second try
+            body, post_entry, asset_jobs, asset_sources = pm.convert_post(self.config, md_file_path, content, content_hash)
+            complete = not pm.run_asset_jobs(self.config, asset_jobs)
+        entry['assets'] = pm.hash_asset_sources(asset_sources)
+        converted[md_file_path] = (content, body)
+        pm.update_asset_refs(self.config, {output_name: pm.post_asset_files(asset_jobs, asset_sources)})
+        if complete:
+            self.manifest['posts'][md_file_path] = entry
+        else:
+            # Left out of the manifest, so the post is converted again on the next change or build
+            self.manifest['posts'].pop(md_file_path, None)
+        self.post_index[md_file_path] = post_entry
+        print(f"   - Compiled {os.path.basename(md_file_path)} -> {output_name}", file=sys.stderr)
+        return True
+
+    def remove_post(self, md_file_path):
+        """Removes the output of a deleted post. Returns False if it was never built."""
+        entry = self.manifest['posts'].pop(md_file_path, None)
+        self.post_index.pop(md_file_path, None)
+        if not entry:
+            return False
+        output_path = os.path.join(self.output_dir, entry['output'])
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        pm.update_asset_refs(self.config, {entry['output']: set()})
+        pm.remove_post_body(self.config, md_file_path)
+        print(f"   - Removed {entry['output']} (source deleted)", file=sys.stderr)
+        return True
+
+    def apply_changes(self, paths):
+        """Rebuilds whatever the changed paths affect. Returns True if the output changed."""
+        if any(path == 'config.json' or path.startswith('templates' + os.sep) for path in paths):
+            print("   - Templates or config changed; rebuilding dependent pages.", file=sys.stderr)
+            try:
+                self.load()
+            except SystemExit:
+                print("   - Rebuild failed; fix the error above and save again.", file=sys.stderr)
+                return False
+            return True
+
+        homepage_dirty = False
+        converted = {}
+        # An edited image gets a new fingerprint, so the posts showing it are rebuilt too
+        paths = set(paths) | self.posts_using_sources({path for path in paths if not path.endswith('.md')})
+        for path in sorted(paths):
+            if not path.endswith('.md') or os.path.dirname(path) != os.path.normpath(self.content_dir):
+                continue
+            if os.path.basename(path) == 'index.md':
+                homepage_dirty = True
+            elif pm.is_reserved_post(path):
+                print(f"Uyarı: {path} atlanıyor; bu ad bir liste sayfasına ayrılmış, dosyayı yeniden adlandırın.", file=sys.stderr)
+            elif os.path.exists(path):
+                try:
+                    homepage_dirty |= self.rebuild_post(path, converted)
+                except Exception as e:
+                    print(f"Hata: {path} işlenemedi: {e}", file=sys.stderr)
+            else:
+                homepage_dirty |= self.remove_post(path)
+
+        if homepage_dirty:
+            # Changed posts and the posts whose related lists they affect are written here
+            pages, _ = pm.update_link_graph(self.config, self.post_index, converted)
+            # One worker thread: forking worker processes next to the watcher's threads is unsafe
+            for md_file_path in pm.write_related_pages(self.config, self.post_template, pages, converted, workers=1):
+                self.manifest['posts'].pop(md_file_path, None)
+            self.save()
+            pm.generate_homepage(self.config, self.post_index)
+            pm.update_search_index(self.config, self.post_index)
+            pm.generate_feeds(self.config, self.post_index)
+        return homepage_dirty
+
+
+def make_handler(output_dir, broadcaster):
+    """Builds a request handler that serves the output folder and the live-reload stream."""
+
+    class LiveReloadHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=output_dir, **kwargs)
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path == LIVERELOAD_PATH:
+                self.stream_reloads()
+                return
+            path = self.translate_path(self.path)
+            if os.path.isdir(path):
+                path = os.path.join(path, 'index.html')
+            if path.endswith('.html') and os.path.isfile(path):
+                self.send_html(path)
+                return
+            super().do_GET()
+
+        def send_html(self, path):
+            with open(path, 'rb') as f:
+                body = f.read()
+            body = body.replace(b'</body>', LIVERELOAD_SCRIPT.encode() + b'</body>', 1)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def stream_reloads(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            generation = broadcaster.generation
+            try:
+                while True:
+                    new_generation = broadcaster.wait(generation, timeout=15)
+                    if new_generation != generation:
+                        generation = new_generation
+                        self.wfile.write(b'event: reload\ndata: \n\n')
+                    else:
+                        # Keeps idle connections from being closed by proxies
+                        self.wfile.write(b': ping\n\n')
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return LiveReloadHandler
+
+
+def watch(port, site_url=None):
+    """Builds once, then serves the site and rebuilds changed pages until interrupted."""
+    print("👀 Starting PanBlog watch mode...", file=sys.stderr)
+    state = SiteState(site_url)
+    broadcaster = ReloadBroadcaster()
+
+    server = ThreadingHTTPServer(('', port), make_handler(state.output_dir, broadcaster))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"   - Serving {state.output_dir} at http://localhost:{port} with live reload.", file=sys.stderr)
+
+    changes = ChangeQueue()
+    # Only the referenced sources are watched, not the folders around them (e.g. a whole camera roll)
+    start_watcher([state.content_dir, 'templates'], ['config.json'] + state.asset_source_files(), changes)
+
+    try:
+        while True:
+            time.sleep(DEBOUNCE_SECONDS / 2)
+            paths = changes.take_settled()
+            if not paths:
+                continue
+            started = time.perf_counter()
+            if state.apply_changes(paths):
+                broadcaster.notify()
+                print(f"   - Rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms.", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nStopping watch mode.", file=sys.stderr)
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild PanBlog on every change and live-reload open pages.")
+    parser.add_argument('--port', type=int, default=8000, help="Port of the development server (default: 8000).")
+    parser.add_argument('--site-url', help="Override the site_url from config.json.")
+    args = parser.parse_args()
+
+    watch(args.port, args.site_url)
+
+
+if __name__ == "__main__":
+    main()